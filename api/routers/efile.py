@@ -14,6 +14,7 @@ import logging
 from typing import List, Optional
 from datetime import date
 from decimal import Decimal
+import pandas as pd
 from pydantic import BaseModel, Field
 from fastapi import APIRouter, HTTPException, Query, BackgroundTasks
 from fastapi.responses import Response
@@ -25,7 +26,7 @@ from supabase_client import (
     get_filer,
     get_forms_1099,
     get_form_1099,
-    get_recipient,
+    get_recipients_by_id,
     update_form_1099,
     log_activity,
     get_operating_years,
@@ -56,6 +57,7 @@ from iris_xml_validator import IRISXMLValidator, validate_iris_xml
 from iris_client import IRISClient, IRISClientError, SubmissionStatus
 from iris_error_translator import translate_iris_errors
 from config import load_config
+from validation_rules import FILER_ADDRESS_RULES, FILER_TIN_RULES, evaluate_rules
 
 logger = logging.getLogger(__name__)
 
@@ -428,347 +430,53 @@ FORM_TYPE_DB_MAP = {
 # FORM VALIDATION HELPERS
 # =============================================================================
 
-# Valid US state codes (includes DC and territories)
-VALID_STATE_CODES = {
-    "AL", "AK", "AZ", "AR", "CA", "CO", "CT", "DE", "DC", "FL",
-    "GA", "HI", "ID", "IL", "IN", "IA", "KS", "KY", "LA", "ME",
-    "MD", "MA", "MI", "MN", "MS", "MO", "MT", "NE", "NV", "NH",
-    "NJ", "NM", "NY", "NC", "ND", "OH", "OK", "OR", "PA", "RI",
-    "SC", "SD", "TN", "TX", "UT", "VT", "VA", "WA", "WV", "WI",
-    "WY", "AS", "GU", "MP", "PR", "VI", "FM", "MH", "PW",
-}
-
-
-def normalize_tin(tin: str) -> str:
-    """Strip punctuation from TIN, return digits only."""
-    if not tin:
-        return ""
-    return "".join(c for c in tin if c.isdigit())
-
-
-def validate_tin_format(tin: str, tin_type: str = "SSN") -> tuple[bool, str]:
+def validate_forms_data(rows: List[tuple], form_type: str) -> List[FormValidationError]:
     """
-    Validate TIN format.
+    Validate forms and their recipients against the shared validation rules.
 
-    Returns (is_valid, error_message).
+    rows is a list of (row_num, form, recipient). All rows are checked at
+    once (see validation_rules); errors come back per row in rule order.
     """
-    normalized = normalize_tin(tin)
-
-    if not normalized:
-        return False, "TIN is missing"
-
-    if len(normalized) != 9:
-        return False, f"TIN must be 9 digits (got {len(normalized)})"
-
-    # Check for invalid patterns
-    if normalized == "000000000":
-        return False, "TIN cannot be all zeros"
-
-    if tin_type == "SSN":
-        # SSN format: XXX-XX-XXXX
-        # Area number (first 3) cannot be 000, 666, or 900-999
-        area = int(normalized[:3])
-        if area == 0 or area == 666 or area >= 900:
-            return False, f"Invalid SSN area number: {area:03d}"
-        # Group number (middle 2) cannot be 00
-        if normalized[3:5] == "00":
-            return False, "Invalid SSN group number: 00"
-        # Serial number (last 4) cannot be 0000
-        if normalized[5:] == "0000":
-            return False, "Invalid SSN serial number: 0000"
-
-    return True, ""
-
-
-def validate_zip_code(zip_code: str) -> tuple[bool, str]:
-    """Validate ZIP code format."""
-    if not zip_code:
-        return False, "ZIP code is missing"
-
-    # Remove any spaces or dashes
-    cleaned = zip_code.replace("-", "").replace(" ", "")
-
-    if not cleaned.isdigit():
-        return False, "ZIP code must be numeric"
-
-    if len(cleaned) not in (5, 9):
-        return False, f"ZIP code must be 5 or 9 digits (got {len(cleaned)})"
-
-    return True, ""
-
-
-def validate_amount(amount, field_name: str, allow_zero: bool = True, max_amount: float = 99999999.99) -> tuple[bool, str]:
-    """Validate a monetary amount."""
-    if amount is None:
-        return True, ""  # None amounts are OK (treated as 0)
-
-    try:
-        value = float(amount)
-    except (ValueError, TypeError):
-        return False, f"{field_name} must be a number"
-
-    if value < 0:
-        return False, f"{field_name} cannot be negative"
-
-    if not allow_zero and value == 0:
-        return False, f"{field_name} cannot be zero"
-
-    if value > max_amount:
-        return False, f"{field_name} exceeds maximum ({max_amount:,.2f})"
-
-    return True, ""
-
-
-def validate_form_data(
-    row_num: int,
-    form: dict,
-    recipient: dict,
-    form_type: str,
-) -> List[FormValidationError]:
-    """
-    Validate a single form and its recipient data.
+    records = []
+    for _, form, recipient in rows:
+        # If TIN is encrypted, decrypt it for validation
+        tin = recipient.get("tin_encrypted") or recipient.get("tin", "")
+        if recipient.get("tin_encrypted"):
+            try:
+                tin = decrypt_tin(recipient["tin_encrypted"])
+            except Exception:
+                tin = ""  # Will fail validation
+
+        records.append({
+            **form,
+            "form_type": form.get("form_type") or form_type,
+            "name": recipient.get("name"),
+            "tin": tin,
+            "tin_type": recipient.get("tin_type") or "SSN",
+            "address1": recipient.get("address1"),
+            "address2": recipient.get("address2"),
+            "city": recipient.get("city"),
+            "state": recipient.get("state"),
+            "zip": recipient.get("zip"),
+        })
+
+    if not records:
+        return []
+
+    checked = evaluate_rules(pd.DataFrame.from_records(records), consumer="efile")
 
-    Returns list of validation errors.
-    """
     errors = []
-    recipient_name = recipient.get("name", "Unknown")
-
-    def add_error(field: str, message: str, severity: str = "error"):
+    for position, field, message, severity in zip(
+        checked.index, checked["field"], checked["message"], checked["severity"]
+    ):
+        row_num, _, recipient = rows[position]
         errors.append(FormValidationError(
             row=row_num,
             field=field,
             message=f"Row {row_num}: {message}",
             severity=severity,
-            recipient_name=recipient_name,
+            recipient_name=recipient.get("name", "Unknown"),
         ))
-
-    def add_warning(field: str, message: str):
-        add_error(field, message, severity="warning")
-
-    # -----------------------------
-    # Recipient Validation
-    # -----------------------------
-
-    # TIN validation
-    tin = recipient.get("tin_encrypted") or recipient.get("tin", "")
-    tin_type = recipient.get("tin_type", "SSN")
-
-    # If TIN is encrypted, try to decrypt for validation
-    if recipient.get("tin_encrypted"):
-        try:
-            tin = decrypt_tin(recipient["tin_encrypted"])
-        except Exception:
-            tin = ""  # Will fail validation
-
-    tin_valid, tin_error = validate_tin_format(tin, tin_type)
-    if not tin_valid:
-        add_error("tin", tin_error)
-
-    # Name validation
-    if not recipient.get("name") or not recipient.get("name", "").strip():
-        add_error("name", "Recipient name is missing")
-    elif len(recipient.get("name", "")) > 80:
-        add_error("name", "Recipient name too long (max 80 characters)")
-
-    # Check for business entity with SSN (will cause XML errors)
-    recipient_name_str = recipient.get("name", "")
-    if recipient_name_str and tin_type:
-        # Import the detection function
-        from import_service import detect_business_entity
-
-        is_business_name = detect_business_entity(recipient_name_str)
-        if is_business_name and tin_type == "SSN":
-            add_error(
-                "tin_type",
-                f"Name '{recipient_name_str}' appears to be a business (LLC/Inc/Corp) but TIN type is SSN. "
-                "This will cause XML validation errors. Please change TIN type to EIN."
-            )
-        elif not is_business_name and tin_type == "EIN":
-            # Parse name to check if it will fit in person name fields
-            name_parts = recipient_name_str.split(" ")
-            if len(name_parts) > 1:
-                # Check if last name would exceed 20 char limit for PersonLastNameType
-                last_name = name_parts[-1]
-                if len(last_name) > 20:
-                    add_error(
-                        "name",
-                        f"Last name '{last_name}' is {len(last_name)} characters (max 20 for individuals). "
-                        "Either shorten the name or change TIN type to EIN if this is a business."
-                    )
-
-    # Address validation
-    if not recipient.get("address1") or not recipient.get("address1", "").strip():
-        add_error("address1", "Street address is missing")
-    elif len(recipient.get("address1", "")) > 40:
-        add_error("address1", "Street address too long (max 40 characters)")
-
-    if recipient.get("address2") and len(recipient.get("address2", "")) > 40:
-        add_warning("address2", "Address line 2 too long (max 40 characters)")
-
-    if not recipient.get("city") or not recipient.get("city", "").strip():
-        add_error("city", "City is missing")
-    elif len(recipient.get("city", "")) > 25:
-        add_error("city", "City name too long (max 25 characters)")
-
-    # State validation
-    state = recipient.get("state", "").upper().strip()
-    if not state:
-        add_error("state", "State is missing")
-    elif state not in VALID_STATE_CODES:
-        add_error("state", f"Invalid state code: {state}")
-
-    # ZIP validation
-    zip_valid, zip_error = validate_zip_code(recipient.get("zip", ""))
-    if not zip_valid:
-        add_error("zip", zip_error)
-
-    # -----------------------------
-    # Amount Validation
-    # -----------------------------
-
-    if form_type == "1099-NEC":
-        # NEC Box 1: Nonemployee compensation (required, cannot be zero for filing)
-        nec_box1 = form.get("nec_box1")
-        valid, msg = validate_amount(nec_box1, "Nonemployee compensation (Box 1)")
-        if not valid:
-            add_error("nec_box1", msg)
-        elif nec_box1 is None or float(nec_box1 or 0) == 0:
-            add_warning("nec_box1", "Nonemployee compensation (Box 1) is zero - form may not be required")
-
-        # NEC Box 4: Federal tax withheld
-        valid, msg = validate_amount(form.get("nec_box4"), "Federal tax withheld (Box 4)")
-        if not valid:
-            add_error("nec_box4", msg)
-
-    elif form_type == "1099-MISC":
-        # MISC has many boxes - validate the common ones
-        amount_fields = [
-            ("misc_box1", "Rents (Box 1)"),
-            ("misc_box2", "Royalties (Box 2)"),
-            ("misc_box3", "Other income (Box 3)"),
-            ("misc_box4", "Federal tax withheld (Box 4)"),
-            ("misc_box5", "Fishing boat proceeds (Box 5)"),
-            ("misc_box6", "Medical payments (Box 6)"),
-            ("misc_box8", "Substitute payments (Box 8)"),
-            ("misc_box9", "Crop insurance (Box 9)"),
-            ("misc_box10", "Attorney proceeds (Box 10)"),
-            ("misc_box11", "Fish purchased (Box 11)"),
-            ("misc_box12", "Section 409A deferrals (Box 12)"),
-            ("misc_box14", "Nonqualified deferred comp (Box 14)"),
-        ]
-
-        has_any_amount = False
-        for field, label in amount_fields:
-            valid, msg = validate_amount(form.get(field), label)
-            if not valid:
-                add_error(field, msg)
-            elif form.get(field) and float(form.get(field) or 0) > 0:
-                has_any_amount = True
-
-        if not has_any_amount:
-            add_warning("amounts", "No amounts entered - form may not be required")
-
-    elif form_type == "1099-S":
-        # 1099-S: Real estate transaction
-        # Box 2: Gross proceeds (required)
-        s_box2 = form.get("s_box2")
-        valid, msg = validate_amount(s_box2, "Gross proceeds (Box 2)")
-        if not valid:
-            add_error("s_box2", msg)
-        elif s_box2 is None or float(s_box2 or 0) == 0:
-            add_warning("s_box2", "Gross proceeds (Box 2) is zero - form may not be required")
-
-        # Box 6: Buyer's real estate tax
-        valid, msg = validate_amount(form.get("s_box6"), "Buyer's real estate tax (Box 6)")
-        if not valid:
-            add_error("s_box6", msg)
-
-        # Box 3: Address or legal description
-        if not form.get("s_box3") or not str(form.get("s_box3", "")).strip():
-            add_warning("s_box3", "Property address/description (Box 3) is empty")
-
-    elif form_type == "1098":
-        # 1098: Mortgage interest statement
-        # Box 1: Mortgage interest received (required)
-        mort_box1 = form.get("mort_box1")
-        valid, msg = validate_amount(mort_box1, "Mortgage interest received (Box 1)")
-        if not valid:
-            add_error("mort_box1", msg)
-        elif mort_box1 is None or float(mort_box1 or 0) == 0:
-            add_warning("mort_box1", "Mortgage interest (Box 1) is zero - form may not be required")
-
-        # Box 2: Outstanding mortgage principal
-        valid, msg = validate_amount(form.get("mort_box2"), "Outstanding principal (Box 2)")
-        if not valid:
-            add_error("mort_box2", msg)
-
-        # Box 4: Refund of overpaid interest
-        valid, msg = validate_amount(form.get("mort_box4"), "Refund of overpaid interest (Box 4)")
-        if not valid:
-            add_error("mort_box4", msg)
-
-        # Box 5: Mortgage insurance premiums
-        valid, msg = validate_amount(form.get("mort_box5"), "Mortgage insurance premiums (Box 5)")
-        if not valid:
-            add_error("mort_box5", msg)
-
-        # Box 6: Points paid
-        valid, msg = validate_amount(form.get("mort_box6"), "Points paid (Box 6)")
-        if not valid:
-            add_error("mort_box6", msg)
-
-    # -----------------------------
-    # State Withholding Validation (for NEC and MISC only)
-    # -----------------------------
-
-    # If state withholding is present, state info must be present
-    if form.get("state1_withheld") and float(form.get("state1_withheld") or 0) > 0:
-        if not form.get("state1_code"):
-            add_error("state1_code", "State 1 withholding requires a state code")
-        elif form.get("state1_code") not in VALID_STATE_CODES:
-            add_error("state1_code", f"Invalid state code: {form.get('state1_code')}")
-
-        valid, msg = validate_amount(form.get("state1_withheld"), "State 1 withholding")
-        if not valid:
-            add_error("state1_withheld", msg)
-
-    if form.get("state2_withheld") and float(form.get("state2_withheld") or 0) > 0:
-        if not form.get("state2_code"):
-            add_error("state2_code", "State 2 withholding requires a state code")
-        elif form.get("state2_code") not in VALID_STATE_CODES:
-            add_error("state2_code", f"Invalid state code: {form.get('state2_code')}")
-
-        valid, msg = validate_amount(form.get("state2_withheld"), "State 2 withholding")
-        if not valid:
-            add_error("state2_withheld", msg)
-
-    # If state income is present, state code should be present
-    if form.get("state1_income") and float(form.get("state1_income") or 0) > 0:
-        if not form.get("state1_code"):
-            add_warning("state1_code", "State 1 income without state code")
-
-    if form.get("state2_income") and float(form.get("state2_income") or 0) > 0:
-        if not form.get("state2_code"):
-            add_warning("state2_code", "State 2 income without state code")
-
-    # -----------------------------
-    # Federal Withholding Validation (NEC and MISC only)
-    # -----------------------------
-
-    # Federal withholding shouldn't exceed income (for forms that have withholding)
-    if form_type in ("1099-NEC", "1099-MISC"):
-        federal_withheld = float(form.get("nec_box4") or form.get("misc_box4") or 0)
-        if form_type == "1099-NEC":
-            total_income = float(form.get("nec_box1") or 0)
-        else:
-            total_income = sum(
-                float(form.get(f"misc_box{i}") or 0)
-                for i in [1, 2, 3, 5, 6, 8, 9, 10, 11, 12, 14]
-            )
-
-        if federal_withheld > 0 and total_income > 0 and federal_withheld > total_income:
-            add_warning("federal_withheld", f"Federal withholding (${federal_withheld:,.2f}) exceeds total income (${total_income:,.2f})")
-
     return errors
 
 
@@ -797,9 +505,20 @@ def validate_filer_data(filer: dict) -> List[FormValidationError]:
         except Exception:
             tin = ""
 
-    tin_valid, tin_error = validate_tin_format(tin, filer.get("tin_type", "EIN"))
-    if not tin_valid:
-        add_error("tin", tin_error)
+    # TIN, state and ZIP are checked with the recipient rules (validation_rules)
+    frame = pd.DataFrame([{
+        "tin": tin,
+        "tin_type": filer.get("tin_type") or "EIN",
+        "state": filer.get("state"),
+        "zip": filer.get("zip"),
+    }])
+
+    def add_rule_errors(rules, consumer: str):
+        checked = evaluate_rules(frame, rules, consumer=consumer)
+        for field, message, severity in zip(checked["field"], checked["message"], checked["severity"]):
+            add_error(field, message, severity)
+
+    add_rule_errors(FILER_TIN_RULES, "efile")
 
     # Name validation
     if not filer.get("name"):
@@ -810,16 +529,7 @@ def validate_filer_data(filer: dict) -> List[FormValidationError]:
         add_error("address1", "Filer street address is missing")
     if not filer.get("city"):
         add_error("city", "Filer city is missing")
-
-    state = filer.get("state", "").upper().strip()
-    if not state:
-        add_error("state", "Filer state is missing")
-    elif state not in VALID_STATE_CODES:
-        add_error("state", f"Invalid filer state code: {state}")
-
-    zip_valid, zip_error = validate_zip_code(filer.get("zip", ""))
-    if not zip_valid:
-        add_error("zip", f"Filer {zip_error.lower()}")
+    add_rule_errors(FILER_ADDRESS_RULES, "filer")
 
     return errors
 
@@ -875,9 +585,11 @@ async def validate_forms(request: EFileRequest):
         filer_errors = validate_filer_data(filer)
         all_errors.extend(filer_errors)
 
-        # Validate each form
+        # Validate the forms together
+        recipients = get_recipients_by_id(f.get("recipient_id") for f in forms)
+        rows = []
         for i, form in enumerate(forms, 1):
-            recipient = get_recipient(form.get("recipient_id"))
+            recipient = recipients.get(form.get("recipient_id"))
             if not recipient:
                 all_errors.append(FormValidationError(
                     row=i,
@@ -887,9 +599,11 @@ async def validate_forms(request: EFileRequest):
                     recipient_name=None,
                 ))
                 continue
+            rows.append((i, form, recipient))
 
-            form_errors = validate_form_data(i, form, recipient, form_type_filter)
-            all_errors.extend(form_errors)
+        all_errors.extend(validate_forms_data(rows, form_type_filter))
+        # Keep errors in row order (filer errors first, at row 0)
+        all_errors.sort(key=lambda e: e.row)
 
         # Count errors and warnings
         error_count = len([e for e in all_errors if e.severity == "error"])
@@ -956,10 +670,10 @@ async def preview_xml(request: EFileRequest) -> Response:
         # Build submission batch
         issuer = build_issuer_from_filer(filer)
         form_data_list = []
+        recipients = get_recipients_by_id(f.get("recipient_id") for f in forms)
 
         for i, form in enumerate(forms, 1):
-            # Get recipient
-            recipient_record = get_recipient(form.get("recipient_id"))
+            recipient_record = recipients.get(form.get("recipient_id"))
             if not recipient_record:
                 continue
 
@@ -1005,7 +719,7 @@ async def preview_xml(request: EFileRequest) -> Response:
             is_test=request.is_test,
         )
 
-        xml_content = generator.generate_transmission(
+        xml_content = generator.generate_transmission_bytes(
             batches=[batch],
             tax_year=tax_year,
         )
@@ -1077,9 +791,10 @@ async def submit_efile(
         issuer = build_issuer_from_filer(filer)
         form_data_list = []
         form_id_map = {}  # Map record_id to form database id
+        recipients = get_recipients_by_id(f.get("recipient_id") for f in forms)
 
         for i, form in enumerate(forms, 1):
-            recipient_record = get_recipient(form.get("recipient_id"))
+            recipient_record = recipients.get(form.get("recipient_id"))
             if not recipient_record:
                 continue
 
@@ -1442,9 +1157,10 @@ async def validate_xml_submission(request: EFileRequest):
         # Build submission
         issuer = build_issuer_from_filer(filer)
         form_data_list = []
+        recipients = get_recipients_by_id(f.get("recipient_id") for f in forms)
 
         for i, form in enumerate(forms, 1):
-            recipient_record = get_recipient(form.get("recipient_id"))
+            recipient_record = recipients.get(form.get("recipient_id"))
             if not recipient_record:
                 continue
 
@@ -4,8 +4,11 @@ Imports API Router.
 Handles Excel/CSV file uploads, column mapping, validation, and promotion.
 """
 
-from typing import List, Optional
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional
 from fastapi import APIRouter, HTTPException, Query, UploadFile, File, Form, Request
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
 from slowapi import Limiter
 from slowapi.util import get_remote_address
@@ -13,7 +16,8 @@ from slowapi.util import get_remote_address
 import sys
 sys.path.insert(0, "src")
 
-from import_service import ImportService, auto_map_columns
+from import_service import ImportService, SpooledUpload, auto_map_columns, PREVIEW_SAMPLE_ROWS, UPLOAD_CHUNK_BYTES
+from import_jobs import get_job_manager
 
 router = APIRouter()
 
@@ -31,6 +35,16 @@ class SheetImportResult(BaseModel):
     batch_id: Optional[str]
     row_count: int
     error: Optional[str]
+    elapsed_seconds: float = 0.0
+
+
+class QuickSheetResult(BaseModel):
+    sheet_name: str
+    form_type: str
+    row_count: int
+    imported_rows: int
+    error: Optional[str]
+    elapsed_seconds: float = 0.0
 
 
 class MultiSheetImportResponse(BaseModel):
@@ -55,11 +69,94 @@ class QuickImportResponse(BaseModel):
     filer_name: Optional[str]
     filer_created: bool
     forms_created: int
+    forms_updated: int = 0
     recipients_created: int
     total_rows: int
     imported_rows: int
     errors: List[str]
     row_errors: List[RowError]
+    elapsed_seconds: float = 0.0
+    rows_per_second: float = 0.0
+    duplicate_of: Optional[str] = None  # import_history ID when the file was already imported
+    previous_import_at: Optional[str] = None
+    diff: Dict[str, int] = {}  # recipients/forms created, updated, unchanged, deleted
+    sheets_imported: List[QuickSheetResult] = []
+
+
+class SheetPreview(BaseModel):
+    """Mapping preview of one sheet (header and first rows only)."""
+    sheet_name: Optional[str]
+    form_type: Optional[str]
+    columns: List[str]
+    suggested_mapping: Dict[str, str]
+    unmapped_columns: List[str]
+    sample_rows: List[Dict[str, Any]]
+    normalized_rows: List[Dict[str, Any]]
+    errors: List[dict]
+
+
+class ImportPreviewResponse(BaseModel):
+    filer_data: Optional[dict]
+    sheets: List[SheetPreview]
+
+
+class ImportJobStatus(BaseModel):
+    """Progress of a background import (see /jobs)."""
+    id: str
+    kind: str
+    filename: str
+    status: str
+    sheets_total: int
+    sheets_done: int
+    current_sheet: Optional[str]
+    rows_processed: int
+    errors_so_far: int
+    result: Optional[dict]
+    error: Optional[str]
+
+
+def _quick_import_response(result: dict) -> QuickImportResponse:
+    """Shape an ImportService.quick_import result for the API."""
+    filer_name = None
+    if result.get('filer_data'):
+        filer_name = result['filer_data'].get('name')
+
+    return QuickImportResponse(
+        filer_id=result.get('filer_id'),
+        filer_name=filer_name,
+        filer_created=result.get('filer_created', False),
+        forms_created=len(result.get('forms_created', [])),
+        forms_updated=len(result.get('forms_updated', [])),
+        recipients_created=result.get('recipients_created', 0),
+        total_rows=result.get('total_rows', 0),
+        imported_rows=result.get('imported_rows', 0),
+        errors=result.get('errors', []),
+        row_errors=[RowError(**re) for re in result.get('row_errors', [])],
+        elapsed_seconds=result.get('elapsed_seconds', 0.0),
+        rows_per_second=result.get('rows_per_second', 0.0),
+        duplicate_of=result.get('duplicate_of'),
+        previous_import_at=result.get('previous_import_at'),
+        diff=result.get('diff', {}),
+        sheets_imported=[QuickSheetResult(**sheet) for sheet in result.get('sheets_imported', [])]
+    )
+
+
+def _upload_response(result: dict) -> MultiSheetImportResponse:
+    """Shape an ImportService.import_all_sheets result for the API."""
+    filer_name = None
+    if result.get('filer_data'):
+        filer_name = result['filer_data'].get('name')
+
+    return MultiSheetImportResponse(
+        filer_id=result.get('filer_id'),
+        filer_name=filer_name,
+        filer_created=result.get('filer_created', False),
+        sheets_imported=[
+            SheetImportResult(**sheet) for sheet in result.get('sheets_imported', [])
+        ],
+        total_rows=result.get('total_rows', 0),
+        errors=result.get('errors', [])
+    )
 
 
 # =============================================================================
@@ -100,6 +197,18 @@ class ImportRow(BaseModel):
     validation_errors: Optional[List[dict]]
 
 
+class BatchErrorSummary(BaseModel):
+    """Rows of a batch with one kind of validation error."""
+    code: str
+    field: Optional[str] = None
+    severity: Optional[str] = None
+    row_count: int
+
+
+class RowCount(BaseModel):
+    count: int
+
+
 class ColumnMappingRequest(BaseModel):
     mapping: dict  # {source_column: target_field}
 
@@ -130,12 +239,46 @@ class AutoMapResponse(BaseModel):
 # ENDPOINTS
 # =============================================================================
 
+async def _spool_upload(file: UploadFile) -> SpooledUpload:
+    """
+    Copy an upload to a temporary file in UPLOAD_CHUNK_BYTES pieces, hashing it on the way.
+
+    The request never holds the whole file in memory; the import reads it
+    from disk. The caller closes the returned upload.
+    """
+    upload = SpooledUpload(suffix=Path(file.filename or "").suffix.lower())
+    try:
+        while chunk := await file.read(UPLOAD_CHUNK_BYTES):
+            await run_in_threadpool(upload.write, chunk)
+    except Exception:
+        upload.close()
+        raise
+    return upload.finish()
+
+
+def _check_quick_import_file(filename: str, filer_id: Optional[str]) -> None:
+    """Reject files quick import can't take."""
+    if not filename.lower().endswith(('.xlsx', '.xls', '.csv')):
+        raise HTTPException(
+            status_code=400,
+            detail="Invalid file type. Please upload .xlsx, .xls, or .csv"
+        )
+    if filename.lower().endswith('.csv') and not filer_id:
+        raise HTTPException(
+            status_code=400,
+            detail="CSV imports need a filer_id (CSV files have no 'Filer Information' sheet)"
+        )
+
+
 @router.post("/quick", response_model=QuickImportResponse, status_code=201)
 @limiter.limit("10/minute")  # 10 file uploads per minute per IP
 async def quick_import(
     request: Request,
     file: UploadFile = File(...),
     operating_year_id: str = Form(...),
+    filer_id: Optional[str] = Form(None),
+    force: bool = Form(False),
+    delete_missing: bool = Form(False),
 ):
     """
     Quick Import: Parse, validate, and create forms in ONE step.
@@ -147,45 +290,87 @@ async def quick_import(
     4. Validate and normalize data
     5. Create recipients and 1099 forms directly
 
+    Flat CSV exports are accepted too: they are parsed in chunks and need
+    the filer_id of an existing filer, since a CSV has no filer sheet.
+
+    A file that was already imported for the same year is not processed
+    again: the earlier outcome comes back with duplicate_of set. Send
+    force=true to import it anyway.
+
+    Re-importing a corrected file only writes new and changed rows; diff
+    counts what was created, updated and left unchanged. With
+    delete_missing=true, draft/ready forms from an earlier import that are
+    no longer in the file are deleted.
+
     After success, redirect to filer page to print/email/download/efile.
+    For large files, use /jobs to run the import in the background.
     """
     filename = file.filename or "upload"
-    if not filename.lower().endswith(('.xlsx', '.xls')):
-        raise HTTPException(
-            status_code=400,
-            detail="Invalid file type. Please upload .xlsx or .xls Excel file"
-        )
+    _check_quick_import_file(filename, filer_id)
 
+    upload = await _spool_upload(file)
     try:
-        content = await file.read()
         service = ImportService()
 
-        result = service.quick_import(
-            file_content=content,
+        # Run off the event loop so other requests keep being served
+        result = await run_in_threadpool(
+            service.quick_import,
+            file_content=upload,
             filename=filename,
-            operating_year_id=operating_year_id
+            operating_year_id=operating_year_id,
+            filer_id=filer_id,
+            force=force,
+            delete_missing=delete_missing
         )
 
-        filer_name = None
-        if result.get('filer_data'):
-            filer_name = result['filer_data'].get('name')
-
-        return QuickImportResponse(
-            filer_id=result.get('filer_id'),
-            filer_name=filer_name,
-            filer_created=result.get('filer_created', False),
-            forms_created=len(result.get('forms_created', [])),
-            recipients_created=result.get('recipients_created', 0),
-            total_rows=result.get('total_rows', 0),
-            imported_rows=result.get('imported_rows', 0),
-            errors=result.get('errors', []),
-            row_errors=[RowError(**re) for re in result.get('row_errors', [])]
+        return _quick_import_response(result)
+
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    finally:
+        upload.close()
+
+
+@router.post("/preview", response_model=ImportPreviewResponse)
+@limiter.limit("30/minute")
+async def preview_file(
+    request: Request,
+    file: UploadFile = File(...),
+    sample_rows: int = Form(PREVIEW_SAMPLE_ROWS, ge=1, le=100),
+):
+    """
+    Preview the column mapping of an Excel or CSV file before importing it.
+
+    Reads only the header and first sample_rows rows of each data sheet,
+    and returns the auto-detected mapping with the sample normalized under
+    it. Nothing is stored; send the confirmed mapping with /upload-single
+    (column_mapping) to parse and stage the whole file.
+    """
+    filename = file.filename or "upload"
+    if not filename.lower().endswith(('.xlsx', '.xls', '.csv')):
+        raise HTTPException(
+            status_code=400,
+            detail="Invalid file type. Please upload .xlsx, .xls, or .csv"
+        )
+
+    upload = await _spool_upload(file)
+    try:
+        service = ImportService()
+        return await run_in_threadpool(
+            service.preview_file,
+            file_content=upload,
+            filename=filename,
+            sample_rows=sample_rows
         )
 
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+    finally:
+        upload.close()
 
 
 @router.post("/upload", response_model=MultiSheetImportResponse, status_code=201)
@@ -217,37 +402,95 @@ async def upload_file(
             detail="Invalid file type. Please upload .xlsx or .xls Excel file"
         )
 
+    upload = await _spool_upload(file)
     try:
-        content = await file.read()
         service = ImportService()
 
-        # Import all sheets at once
-        result = service.import_all_sheets(
-            file_content=content,
+        # Import all sheets at once (off the event loop)
+        result = await run_in_threadpool(
+            service.import_all_sheets,
+            file_content=upload,
             filename=filename,
             operating_year_id=operating_year_id
         )
 
-        # Build response
-        filer_name = None
-        if result.get('filer_data'):
-            filer_name = result['filer_data'].get('name')
-
-        return MultiSheetImportResponse(
-            filer_id=result.get('filer_id'),
-            filer_name=filer_name,
-            filer_created=result.get('filer_created', False),
-            sheets_imported=[
-                SheetImportResult(**sheet) for sheet in result.get('sheets_imported', [])
-            ],
-            total_rows=result.get('total_rows', 0),
-            errors=result.get('errors', [])
-        )
+        return _upload_response(result)
 
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+    finally:
+        upload.close()
+
+
+@router.post("/jobs", response_model=ImportJobStatus, status_code=202)
+@limiter.limit("10/minute")  # 10 file uploads per minute per IP
+async def start_import_job(
+    request: Request,
+    file: UploadFile = File(...),
+    operating_year_id: str = Form(...),
+    filer_id: Optional[str] = Form(None),
+    mode: str = Form("quick"),
+    force: bool = Form(False),
+    delete_missing: bool = Form(False),
+):
+    """
+    Start an import in the background and return its job right away.
+
+    mode='quick' runs the /quick import, mode='upload' the staging import of
+    /upload. Poll GET /jobs/{job_id} for progress; once the job is completed
+    its result is the body that endpoint would have returned.
+    """
+    filename = file.filename or "upload"
+    if mode == 'quick':
+        _check_quick_import_file(filename, filer_id)
+    elif mode == 'upload':
+        if not filename.lower().endswith(('.xlsx', '.xls')):
+            raise HTTPException(
+                status_code=400,
+                detail="Invalid file type. Please upload .xlsx or .xls Excel file"
+            )
+    else:
+        raise HTTPException(status_code=400, detail=f"Unknown import mode: {mode}")
+
+    upload = await _spool_upload(file)
+    service = ImportService()
+
+    def run(progress):
+        # The spooled upload is removed once the job is done with it
+        try:
+            if mode == 'quick':
+                result = service.quick_import(
+                    file_content=upload,
+                    filename=filename,
+                    operating_year_id=operating_year_id,
+                    filer_id=filer_id,
+                    progress=progress,
+                    force=force,
+                    delete_missing=delete_missing
+                )
+                return _quick_import_response(result).model_dump()
+            result = service.import_all_sheets(
+                file_content=upload,
+                filename=filename,
+                operating_year_id=operating_year_id,
+                progress=progress
+            )
+            return _upload_response(result).model_dump()
+        finally:
+            upload.close()
+
+    return ImportJobStatus(**get_job_manager().submit(mode, filename, run))
+
+
+@router.get("/jobs/{job_id}", response_model=ImportJobStatus)
+async def get_import_job(job_id: str):
+    """Progress of a background import: sheets and rows processed, errors so far, and the result when done."""
+    job = get_job_manager().get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Import job not found")
+    return ImportJobStatus(**job)
 
 
 @router.post("/upload-single", response_model=ImportBatch, status_code=201)
@@ -258,12 +501,17 @@ async def upload_single_sheet(
     operating_year_id: str = Form(...),
     filer_id: Optional[str] = Form(None),
     sheet_name: Optional[str] = Form(None),
+    column_mapping: Optional[str] = Form(None),
 ):
     """
     Upload an Excel or CSV file and import a single sheet.
 
     Use this endpoint if you want to import just one specific sheet.
     For multi-sheet import, use /upload instead.
+
+    column_mapping is an optional JSON object {source_column: target_field},
+    e.g. a mapping confirmed from /preview; without it the columns are
+    auto-mapped.
     """
     # Validate file type
     filename = file.filename or "upload"
@@ -273,15 +521,24 @@ async def upload_single_sheet(
             detail="Invalid file type. Please upload .xlsx, .xls, or .csv"
         )
 
+    mapping = None
+    if column_mapping:
+        try:
+            mapping = json.loads(column_mapping)
+        except json.JSONDecodeError:
+            raise HTTPException(status_code=400, detail="column_mapping must be a JSON object")
+        if not isinstance(mapping, dict):
+            raise HTTPException(status_code=400, detail="column_mapping must be a JSON object")
+
+    upload = await _spool_upload(file)
     try:
-        content = await file.read()
         service = ImportService()
 
         # Create batch
         batch = service.create_batch(
             operating_year_id=operating_year_id,
             filename=filename,
-            file_content=content,
+            file_content=upload,
             filer_id=filer_id
         )
 
@@ -289,11 +546,12 @@ async def upload_single_sheet(
             raise HTTPException(status_code=500, detail="Failed to create import batch")
 
         # Parse and store raw rows
-        df = service.parse_file(content, filename, sheet_name=sheet_name)
+        df = service.parse_file(upload, filename, sheet_name=sheet_name)
         service.store_raw_rows(batch['id'], df)
 
-        # Auto-detect column mapping
-        mapping = auto_map_columns(list(df.columns))
+        # Auto-detect column mapping unless one was confirmed
+        if mapping is None:
+            mapping = auto_map_columns(list(df.columns))
         service.apply_column_mapping(batch['id'], mapping)
 
         # Return updated batch
@@ -303,6 +561,8 @@ async def upload_single_sheet(
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+    finally:
+        upload.close()
 
 
 @router.get("/batches", response_model=List[ImportBatch])
@@ -346,18 +606,55 @@ async def get_batch(batch_id: str):
 async def get_batch_rows(
     batch_id: str,
     status: Optional[str] = Query(None, description="Filter by status: pending, valid, error, warning"),
+    error_code: Optional[str] = Query(None, description="Only rows with this validation error code"),
+    error_field: Optional[str] = Query(None, description="Only rows with a validation error on this field"),
+    after_row_number: Optional[int] = Query(None, ge=0, description="Keyset paging: last row_number of the previous page"),
     limit: int = Query(100, ge=1, le=1000),
     offset: int = Query(0, ge=0),
 ):
-    """Get rows for an import batch."""
+    """
+    Get rows for an import batch.
+
+    For large batches page with after_row_number instead of offset.
+    """
     try:
         service = ImportService()
-        rows = service.get_batch_rows(batch_id, status=status, limit=limit, offset=offset)
+        rows = service.get_batch_rows(
+            batch_id, status=status, limit=limit, offset=offset,
+            error_code=error_code, error_field=error_field, after_row_number=after_row_number
+        )
         return rows
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/batches/{batch_id}/rows/count", response_model=RowCount)
+async def count_batch_rows(
+    batch_id: str,
+    status: Optional[str] = Query(None, description="Filter by status: pending, valid, error, warning"),
+    error_code: Optional[str] = Query(None, description="Only rows with this validation error code"),
+    error_field: Optional[str] = Query(None, description="Only rows with a validation error on this field"),
+):
+    """Count the rows of an import batch matching the same filters as /rows."""
+    try:
+        service = ImportService()
+        return RowCount(count=service.count_batch_rows(
+            batch_id, status=status, error_code=error_code, error_field=error_field
+        ))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/batches/{batch_id}/errors", response_model=List[BatchErrorSummary])
+async def get_batch_error_summary(batch_id: str):
+    """Validation errors of an import batch by code and field, with the number of rows each."""
+    try:
+        service = ImportService()
+        return service.get_batch_error_summary(batch_id)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get("/batches/{batch_id}/auto-map", response_model=AutoMapResponse)
 async def auto_map_batch(batch_id: str):
     """
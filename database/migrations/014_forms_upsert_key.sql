@@ -0,0 +1,18 @@
+-- Migration 014: Upsert key for forms_1099
+-- Lets the importer bulk-upsert forms through PostgREST (on_conflict)
+-- Run this in Supabase SQL Editor
+--
+-- idx_forms_1099_unique is a partial index (WHERE is_correction = false).
+-- PostgREST sends ON CONFLICT (cols) without a predicate, and Postgres will
+-- not infer a partial index from that. original_key is TRUE for originals and
+-- NULL for corrections, so a plain unique index that includes it enforces the
+-- same rule (one original per filer/recipient/year/type, any number of
+-- corrections) and can be used as an on_conflict target.
+
+ALTER TABLE forms_1099 ADD COLUMN IF NOT EXISTS original_key BOOLEAN
+    GENERATED ALWAYS AS (CASE WHEN is_correction THEN NULL ELSE TRUE END) STORED;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_forms_1099_upsert_key
+    ON forms_1099 (filer_id, recipient_id, operating_year_id, form_type, original_key);
+
+COMMENT ON COLUMN forms_1099.original_key IS 'TRUE for original forms, NULL for corrections. Upsert conflict target for imports.';
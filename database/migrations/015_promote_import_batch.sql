@@ -0,0 +1,173 @@
+-- Sherpa 1099 Database Migration
+-- Migration 015: Set-based promotion of import batches
+-- Run this in Supabase SQL Editor (after 014_forms_upsert_key.sql)
+--
+-- promote_import_batch() moves every valid import_rows row of a batch into
+-- recipients and forms_1099 in one transaction. Called by
+-- ImportService.promote_batch through client.rpc. Any error rolls back the
+-- whole batch, so a batch is either promoted completely or not at all.
+--
+-- Rules (same as the row-by-row promotion it replaces):
+-- - Recipients are matched by filer + TIN; new TINs are inserted once
+--   (first row wins). recipients has no unique key on (filer_id, tin), so
+--   promotions for a filer are serialized with an advisory lock instead of
+--   ON CONFLICT.
+-- - One draft form per recipient/year/type. A row whose form already exists
+--   (or repeats an earlier row in the batch) is skipped and gets a
+--   FORM_EXISTS validation error.
+-- - Empty amounts and checkboxes take the forms_1099 column defaults.
+
+CREATE OR REPLACE FUNCTION public.promote_import_batch(p_batch_id UUID, p_filer_id UUID)
+RETURNS JSONB
+LANGUAGE plpgsql
+SECURITY INVOKER
+SET search_path = public
+AS $$
+DECLARE
+    v_operating_year_id UUID;
+    v_recipients_created INT;
+    v_forms_created INT;
+    v_skipped INT;
+BEGIN
+    SELECT operating_year_id INTO v_operating_year_id
+    FROM public.import_batches
+    WHERE id = p_batch_id
+    FOR UPDATE;
+
+    IF NOT FOUND THEN
+        RAISE EXCEPTION 'Import batch % not found', p_batch_id;
+    END IF;
+
+    PERFORM pg_advisory_xact_lock(hashtext('promote_import_batch:' || p_filer_id::text));
+
+    -- ------------------------------------------------------------------------
+    -- Recipients
+    -- ------------------------------------------------------------------------
+    WITH new_recipients AS (
+        INSERT INTO public.recipients (
+            filer_id, name, name_line_2, tin, tin_type,
+            address1, address2, city, state, zip, account_number
+        )
+        SELECT DISTINCT ON (r.recipient_tin)
+            p_filer_id, r.recipient_name, r.recipient_name_line2, r.recipient_tin,
+            COALESCE(r.recipient_tin_type, 'SSN'),
+            r.recipient_address1, r.recipient_address2, r.recipient_city,
+            r.recipient_state, r.recipient_zip, r.account_number
+        FROM public.import_rows r
+        WHERE r.batch_id = p_batch_id
+          AND r.status = 'valid'
+          AND NOT EXISTS (
+              SELECT 1 FROM public.recipients x
+              WHERE x.filer_id = p_filer_id AND x.tin = r.recipient_tin
+          )
+        ORDER BY r.recipient_tin, r.row_number
+        RETURNING id
+    )
+    SELECT COUNT(*) INTO v_recipients_created FROM new_recipients;
+
+    -- ------------------------------------------------------------------------
+    -- Forms, then link (or flag) the staging rows
+    -- ------------------------------------------------------------------------
+    WITH source AS (
+        SELECT
+            r.*,
+            rc.id AS recipient_id,
+            COALESCE(r.form_type, '1099-NEC') AS promoted_form_type,
+            ROW_NUMBER() OVER (
+                PARTITION BY rc.id, COALESCE(r.form_type, '1099-NEC')
+                ORDER BY r.row_number
+            ) AS occurrence
+        FROM public.import_rows r
+        CROSS JOIN LATERAL (
+            SELECT x.id FROM public.recipients x
+            WHERE x.filer_id = p_filer_id AND x.tin = r.recipient_tin
+            ORDER BY x.created_at
+            LIMIT 1
+        ) rc
+        WHERE r.batch_id = p_batch_id
+          AND r.status = 'valid'
+    ),
+    inserted AS (
+        INSERT INTO public.forms_1099 (
+            filer_id, recipient_id, operating_year_id, form_type, status,
+            nec_box1, nec_box4,
+            misc_box1, misc_box2, misc_box3, misc_box4, misc_box5, misc_box6,
+            misc_box8, misc_box9, misc_box10, misc_box11, misc_box12, misc_box14,
+            s_box1_date_closing, s_box2_gross_proceeds, s_box3_property_address,
+            s_box4_property_services, s_box5_foreign_person, s_box6_buyers_tax,
+            f1098_box1_mortgage_interest, f1098_box2_outstanding_principal,
+            f1098_box3_origination_date, f1098_box4_refund_interest,
+            f1098_box5_mortgage_insurance, f1098_box6_points_paid,
+            f1098_box8_property_address, f1098_box9_num_properties,
+            f1098_box10_other, f1098_box11_acquisition_date,
+            state1_code, state1_id, state1_income, state1_withheld
+        )
+        SELECT
+            p_filer_id, s.recipient_id, v_operating_year_id, s.promoted_form_type, 'draft',
+            COALESCE(s.nec_box1, 0), COALESCE(s.nec_box4, 0),
+            COALESCE(s.misc_box1, 0), COALESCE(s.misc_box2, 0), COALESCE(s.misc_box3, 0),
+            COALESCE(s.misc_box4, 0), COALESCE(s.misc_box5, 0), COALESCE(s.misc_box6, 0),
+            COALESCE(s.misc_box8, 0), COALESCE(s.misc_box9, 0), COALESCE(s.misc_box10, 0),
+            COALESCE(s.misc_box11, 0), COALESCE(s.misc_box12, 0), COALESCE(s.misc_box14, 0),
+            s.s_box1_date_closing, COALESCE(s.s_box2_gross_proceeds, 0), s.s_box3_property_address,
+            COALESCE(s.s_box4_property_services, false), COALESCE(s.s_box5_foreign_person, false),
+            COALESCE(s.s_box6_buyers_tax, 0),
+            COALESCE(s.f1098_box1_mortgage_interest, 0), COALESCE(s.f1098_box2_outstanding_principal, 0),
+            s.f1098_box3_origination_date, COALESCE(s.f1098_box4_refund_interest, 0),
+            COALESCE(s.f1098_box5_mortgage_insurance, 0), COALESCE(s.f1098_box6_points_paid, 0),
+            s.f1098_box8_property_address, s.f1098_box9_num_properties,
+            COALESCE(s.f1098_box10_other, 0), s.f1098_box11_acquisition_date,
+            s.state1_code, s.state1_id, COALESCE(s.state1_income, 0), COALESCE(s.state1_withheld, 0)
+        FROM source s
+        WHERE s.occurrence = 1
+        ON CONFLICT (filer_id, recipient_id, operating_year_id, form_type, original_key) DO NOTHING
+        RETURNING id, recipient_id, form_type
+    ),
+    promoted AS (
+        UPDATE public.import_rows r
+        SET promoted_recipient_id = i.recipient_id,
+            promoted_form_id = i.id,
+            status = 'promoted'
+        FROM source s
+        JOIN inserted i
+          ON i.recipient_id = s.recipient_id AND i.form_type = s.promoted_form_type
+        WHERE r.id = s.id
+          AND s.occurrence = 1
+        RETURNING r.id
+    ),
+    skipped AS (
+        UPDATE public.import_rows r
+        SET validation_errors = jsonb_build_array(jsonb_build_object(
+            'field', 'promotion',
+            'code', 'FORM_EXISTS',
+            'message', 'A ' || s.promoted_form_type || ' form already exists for this recipient and year',
+            'severity', 'error'
+        ))
+        FROM source s
+        WHERE r.id = s.id
+          AND NOT (
+              s.occurrence = 1 AND EXISTS (
+                  SELECT 1 FROM inserted i
+                  WHERE i.recipient_id = s.recipient_id AND i.form_type = s.promoted_form_type
+              )
+          )
+        RETURNING r.id
+    )
+    SELECT (SELECT COUNT(*) FROM promoted), (SELECT COUNT(*) FROM skipped)
+    INTO v_forms_created, v_skipped;
+
+    UPDATE public.import_batches
+    SET status = 'promoted',
+        filer_id = p_filer_id,
+        promoted_at = NOW()
+    WHERE id = p_batch_id;
+
+    RETURN jsonb_build_object(
+        'recipients_created', v_recipients_created,
+        'forms_created', v_forms_created,
+        'skipped', v_skipped
+    );
+END;
+$$;
+
+GRANT EXECUTE ON FUNCTION public.promote_import_batch(UUID, UUID) TO authenticated, service_role;
@@ -0,0 +1,51 @@
+-- Sherpa 1099 Database Migration
+-- Migration 016: Content hashes for diff-based re-imports
+-- Run this in Supabase SQL Editor (after 015_promote_import_batch.sql)
+--
+-- quick_import stores a hash of the values it wrote on each recipient and
+-- form. When a corrected workbook is imported again, rows whose hash is
+-- unchanged are not written at all, so a re-import with a few edits costs a
+-- few writes instead of one per row.
+--
+-- The hash only describes what the importer wrote. If a recipient or form is
+-- edited anywhere else (forms page, recipient edit, API), the trigger below
+-- clears content_hash so the next import writes that row again. Updates that
+-- only touch workflow columns (status, validation, IRS submission fields)
+-- keep the hash.
+
+ALTER TABLE recipients ADD COLUMN IF NOT EXISTS content_hash TEXT;
+ALTER TABLE forms_1099 ADD COLUMN IF NOT EXISTS content_hash TEXT;
+
+COMMENT ON COLUMN recipients.content_hash IS 'SHA-256 of the values last written by an import. NULL once edited elsewhere.';
+COMMENT ON COLUMN forms_1099.content_hash IS 'SHA-256 of the values last written by an import. NULL once edited elsewhere.';
+
+CREATE OR REPLACE FUNCTION public.clear_import_content_hash()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+SET search_path = public
+AS $$
+DECLARE
+    v_ignored TEXT[] := ARRAY[
+        'content_hash', 'updated_at', 'status', 'validation_errors', 'validated_at',
+        'irs_record_id', 'irs_status', 'irs_response',
+        'tin_status', 'tin_checked_at', 'tin_match_code'
+    ];
+BEGIN
+    IF NEW.content_hash IS NOT DISTINCT FROM OLD.content_hash
+       AND OLD.content_hash IS NOT NULL
+       AND (to_jsonb(NEW) - v_ignored) IS DISTINCT FROM (to_jsonb(OLD) - v_ignored) THEN
+        NEW.content_hash := NULL;
+    END IF;
+    RETURN NEW;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS recipients_clear_content_hash ON recipients;
+CREATE TRIGGER recipients_clear_content_hash
+    BEFORE UPDATE ON recipients
+    FOR EACH ROW EXECUTE FUNCTION public.clear_import_content_hash();
+
+DROP TRIGGER IF EXISTS forms_1099_clear_content_hash ON forms_1099;
+CREATE TRIGGER forms_1099_clear_content_hash
+    BEFORE UPDATE ON forms_1099
+    FOR EACH ROW EXECUTE FUNCTION public.clear_import_content_hash();
@@ -0,0 +1,18 @@
+-- Sherpa 1099 Database Migration
+-- Migration 017: Per-field normalization results for staged imports
+-- Run this in Supabase SQL Editor (after 016_import_content_hash.sql)
+--
+-- normalize_batch keeps each row's normalization errors by target field and
+-- the column mapping the batch was normalized with. When the mapping is
+-- changed on the review screen, normalizing again only redoes the target
+-- fields whose source column changed; the other fields' values are already
+-- in the row and their errors come from field_errors.
+--
+-- Batches normalized before this migration have no normalized_mapping and
+-- are normalized in full the next time.
+
+ALTER TABLE import_batches ADD COLUMN IF NOT EXISTS normalized_mapping JSONB;
+ALTER TABLE import_rows ADD COLUMN IF NOT EXISTS field_errors JSONB;
+
+COMMENT ON COLUMN import_batches.normalized_mapping IS 'column_mapping the rows were last normalized with. NULL until normalized.';
+COMMENT ON COLUMN import_rows.field_errors IS 'Normalization errors by target field: {"recipient_tin": [{field, code, message, severity}], ...}. Rule errors are not included.';
@@ -0,0 +1,46 @@
+-- Sherpa 1099 Database Migration
+-- Migration 018: Look up staged import rows by validation error
+-- Run this in Supabase SQL Editor (after 017_import_field_errors.sql)
+--
+-- The review screen fixes one kind of error at a time ("every row with
+-- INVALID_TIN_LENGTH"). ImportService.get_batch_rows filters on
+-- validation_errors with JSONB containment:
+--
+--     validation_errors @> '[{"code": "INVALID_TIN_LENGTH"}]'
+--
+-- which the GIN index below answers without reading every row of the batch.
+-- jsonb_path_ops only supports @>, and is smaller and faster than the
+-- default operator class for it.
+--
+-- Rows are paged by row_number (keyset: row_number > last one seen), which
+-- idx_import_rows_batch_row_number serves in order. The index is unique: a
+-- row number is staged once per batch, and ImportService._insert_chunks
+-- retries a failed chunk with ON CONFLICT (batch_id, row_number) DO NOTHING
+-- in case the first attempt was committed after all.
+--
+-- import_batch_error_summary() gives the per-code counts for a batch, so the
+-- UI can list the kinds of error and how many rows each one has.
+
+CREATE INDEX IF NOT EXISTS idx_import_rows_validation_errors
+    ON import_rows USING GIN (validation_errors jsonb_path_ops);
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_import_rows_batch_row_number
+    ON import_rows(batch_id, row_number);
+
+CREATE OR REPLACE FUNCTION public.import_batch_error_summary(p_batch_id UUID)
+RETURNS TABLE (code TEXT, field TEXT, severity TEXT, row_count BIGINT)
+LANGUAGE sql
+STABLE
+SECURITY INVOKER
+SET search_path = public
+AS $$
+    SELECT e->>'code', e->>'field', e->>'severity', COUNT(DISTINCT r.id)
+    FROM public.import_rows r
+    CROSS JOIN LATERAL jsonb_array_elements(r.validation_errors) AS e
+    WHERE r.batch_id = p_batch_id
+      AND jsonb_typeof(r.validation_errors) = 'array'
+    GROUP BY 1, 2, 3
+    ORDER BY 4 DESC, 1, 2;
+$$;
+
+GRANT EXECUTE ON FUNCTION public.import_batch_error_summary(UUID) TO authenticated, service_role;
@@ -0,0 +1,105 @@
+"""
+Regression check for the business-entity name classifier.
+
+Runs detect_business_entity (and its column-wise variant) over a labeled set
+of names, including every recipient in the Test Returns workbook, and fails if
+any name is classified differently from its label. Short designators such as
+CO, PA and INC must match whole words only: "James Second" and "Patricia Cole"
+are individuals.
+
+Usage:
+    python scripts/regress_business_entity.py
+    python scripts/regress_business_entity.py --bench
+"""
+
+from pathlib import Path
+import sys
+import time
+
+# Add src to path
+REPO = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(REPO / "src"))
+
+import pandas as pd
+
+from validation_rules import (
+    BUSINESS_ENTITY_INDICATORS,
+    detect_business_entity,
+    detect_business_entity_series,
+)
+
+# (name, is_business)
+CASES = [
+    # Test Returns recipients and filers
+    ("Aaron Fifth", False), ("Bobby Fourth", False), ("Charlie Test", False),
+    ("Curly Sixth", False), ("Delroy Seventh", False), ("Eliza Eight", False),
+    ("James Second", False), ("James Third", False), ("Kevin Test", False),
+    ("Phil Second", False), ("Fifth Test Data", False), ("Second Test Data", False),
+    # Individuals containing a designator inside a word
+    ("COLLINS", False), ("Patricia Cole", False), ("Vincent Price", False),
+    ("Scott Coleman", False), ("Pamela Cook", False), ("Marco Polo", False),
+    ("Francesca Cortez", False), ("Sherpa 1099", False), ("Lincoln Ltdz", False),
+    ("ACMEINC", False), ("", False), (None, False),
+    # Businesses
+    ("Acme LLC", True), ("Acme, L.L.C.", True), ("Acme L L C", True),
+    ("acme llc", True), ("ACME INC.", True), ("Acme, Inc", True),
+    ("Acme Incorporated", True), ("Smith & Co.", True), ("Smith & Co", True),
+    ("Jones Company", True), ("Widgets Ltd", True), ("Widgets Limited", True),
+    ("Doe Law, P.A.", True), ("Doe Law PA", True), ("Roe PC", True),
+    ("Roe, P.C.", True), ("Jones PLLC", True), ("Roe P.L.L.C.", True),
+    ("Alpha LP", True), ("Alpha L.P.", True), ("Beta LLP", True),
+    ("Gamma Corp", True), ("Gamma Corporation", True),
+    ("Smith Professional Association", True), ("Co-op Foods", True),
+    ("Arnolds Home Healthcare LLC", True),
+]
+
+
+def substring_classifier(name):
+    """The previous classifier (plain substring test), for --bench only."""
+    if not name:
+        return False
+    upper = name.upper()
+    return any(i in upper for i in BUSINESS_ENTITY_INDICATORS)
+
+
+def bench(rows: int = 100_000) -> None:
+    names = [name or "" for name, _ in CASES]
+    data = (names * (rows // len(names) + 1))[:rows]
+    series = pd.Series(data, dtype=object)
+
+    for label, fn in [
+        ("substring (old)", lambda: [substring_classifier(n) for n in data]),
+        ("detect_business_entity", lambda: [detect_business_entity(n) for n in data]),
+        ("detect_business_entity_series", lambda: detect_business_entity_series(series)),
+    ]:
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        print(f"  {label:32} {elapsed * 1000:8.1f} ms  ({rows / elapsed:,.0f} names/s)")
+
+
+def main():
+    failures = []
+    for name, expected in CASES:
+        if detect_business_entity(name) != expected:
+            failures.append((name, expected))
+
+    series = detect_business_entity_series(pd.Series([n for n, _ in CASES], dtype=object))
+    for (name, expected), got in zip(CASES, series):
+        if bool(got) != expected:
+            failures.append((name, expected))
+
+    if failures:
+        print("FAIL: business-entity classification changed")
+        for name, expected in failures:
+            print(f"  {name!r}: expected {'business' if expected else 'individual'}")
+        sys.exit(1)
+
+    print(f"PASS: {len(CASES)} names classified as labeled")
+
+    if "--bench" in sys.argv:
+        bench()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Background import jobs for Sherpa 1099.
+
+Runs quick imports and multi-sheet uploads in a small worker pool so the
+upload request returns right away with a job ID. Progress (sheets and rows
+processed, errors so far) and the final result are kept in memory and read
+back through the progress endpoint.
+
+Jobs live in this process only; the API runs as a single uvicorn process.
+Finished jobs are dropped after JOB_TTL_SECONDS.
+"""
+
+import os
+import time
+import uuid
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, asdict
+from typing import Optional, Any, Dict, Callable
+
+# Imports running at once; the rest wait in the queue
+IMPORT_WORKERS = int(os.getenv("IMPORT_WORKERS", "2"))
+
+# How long a finished job stays available to the progress endpoint
+JOB_TTL_SECONDS = 60 * 60
+
+
+@dataclass
+class ImportJob:
+    """State of one background import."""
+    id: str
+    kind: str  # quick or upload
+    filename: str
+    status: str = "queued"  # queued, running, completed, failed
+    sheets_total: int = 0
+    sheets_done: int = 0
+    current_sheet: Optional[str] = None
+    rows_processed: int = 0
+    errors_so_far: int = 0
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    created_at: float = field(default_factory=time.time)
+    finished_at: Optional[float] = None
+
+
+class ImportJobManager:
+    """Queues import jobs on a thread pool and tracks their progress."""
+
+    def __init__(self, max_workers: int = IMPORT_WORKERS):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="import")
+        self._jobs: Dict[str, ImportJob] = {}
+        self._lock = threading.Lock()
+
+    def submit(
+        self,
+        kind: str,
+        filename: str,
+        run: Callable[[Callable[[Dict[str, Any]], None]], Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """
+        Queue an import and return its initial state.
+
+        run is called on a worker thread with a progress callback and returns
+        the job result (a JSON-ready dict).
+        """
+        self._prune()
+        job = ImportJob(id=str(uuid.uuid4()), kind=kind, filename=filename)
+        with self._lock:
+            self._jobs[job.id] = job
+            snapshot = asdict(job)
+        self._executor.submit(self._run, job, run)
+        return snapshot
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Current state of a job, or None if unknown or expired."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return asdict(job) if job else None
+
+    def _run(self, job: ImportJob, run: Callable) -> None:
+        self._update(job, status="running")
+        try:
+            result = run(lambda progress: self._update(job, **progress))
+            self._update(job, status="completed", result=result, finished_at=time.time())
+        except Exception as e:
+            self._update(job, status="failed", error=str(e), finished_at=time.time())
+
+    def _update(self, job: ImportJob, **changes: Any) -> None:
+        with self._lock:
+            for key, value in changes.items():
+                setattr(job, key, value)
+
+    def _prune(self) -> None:
+        cutoff = time.time() - JOB_TTL_SECONDS
+        with self._lock:
+            expired = [job_id for job_id, job in self._jobs.items()
+                       if job.finished_at is not None and job.finished_at < cutoff]
+            for job_id in expired:
+                del self._jobs[job_id]
+
+
+# Global manager (lazy initialization)
+_job_manager: Optional[ImportJobManager] = None
+
+
+def get_job_manager() -> ImportJobManager:
+    """Get the process-wide import job manager."""
+    global _job_manager
+    if _job_manager is None:
+        _job_manager = ImportJobManager()
+    return _job_manager
@@ -9,66 +9,118 @@ Handles:
 - Promotion to canonical records
 """
 
+import os
 import re
+import json
+import time
 import hashlib
-from typing import Optional, List, Dict, Any, Tuple, Union
+import tempfile
+import threading
+from typing import Optional, List, Dict, Any, Tuple, Union, Iterable, Iterator, Callable
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from difflib import SequenceMatcher
+from itertools import islice
 from datetime import datetime
 from decimal import Decimal, InvalidOperation
 from pathlib import Path
 import pandas as pd
 
 from supabase_client import get_supabase_client, log_activity
+from validation_rules import (
+    VALID_STATES, ERROR_COLUMNS, IMPORT_RULES, detect_business_entity, empty_error_table, evaluate_rules,
+)
 
 
 # =============================================================================
 # CONSTANTS
 # =============================================================================
 
-VALID_STATES = {
-    'AL', 'AK', 'AZ', 'AR', 'CA', 'CO', 'CT', 'DE', 'DC', 'FL', 'GA', 'HI',
-    'ID', 'IL', 'IN', 'IA', 'KS', 'KY', 'LA', 'ME', 'MD', 'MA', 'MI', 'MN',
-    'MS', 'MO', 'MT', 'NE', 'NV', 'NH', 'NJ', 'NM', 'NY', 'NC', 'ND', 'OH',
-    'OK', 'OR', 'PA', 'PR', 'RI', 'SC', 'SD', 'TN', 'TX', 'UT', 'VT', 'VA',
-    'VI', 'WA', 'WV', 'WI', 'WY', 'AS', 'GU', 'MP', 'FM', 'MH', 'PW'
+# Common state name mappings
+STATE_NAMES = {
+    'ALABAMA': 'AL', 'ALASKA': 'AK', 'ARIZONA': 'AZ', 'ARKANSAS': 'AR',
+    'CALIFORNIA': 'CA', 'COLORADO': 'CO', 'CONNECTICUT': 'CT', 'DELAWARE': 'DE',
+    'FLORIDA': 'FL', 'GEORGIA': 'GA', 'HAWAII': 'HI', 'IDAHO': 'ID',
+    'ILLINOIS': 'IL', 'INDIANA': 'IN', 'IOWA': 'IA', 'KANSAS': 'KS',
+    'KENTUCKY': 'KY', 'LOUISIANA': 'LA', 'MAINE': 'ME', 'MARYLAND': 'MD',
+    'MASSACHUSETTS': 'MA', 'MICHIGAN': 'MI', 'MINNESOTA': 'MN', 'MISSISSIPPI': 'MS',
+    'MISSOURI': 'MO', 'MONTANA': 'MT', 'NEBRASKA': 'NE', 'NEVADA': 'NV',
+    'NEW HAMPSHIRE': 'NH', 'NEW JERSEY': 'NJ', 'NEW MEXICO': 'NM', 'NEW YORK': 'NY',
+    'NORTH CAROLINA': 'NC', 'NORTH DAKOTA': 'ND', 'OHIO': 'OH', 'OKLAHOMA': 'OK',
+    'OREGON': 'OR', 'PENNSYLVANIA': 'PA', 'RHODE ISLAND': 'RI', 'SOUTH CAROLINA': 'SC',
+    'SOUTH DAKOTA': 'SD', 'TENNESSEE': 'TN', 'TEXAS': 'TX', 'UTAH': 'UT',
+    'VERMONT': 'VT', 'VIRGINIA': 'VA', 'WASHINGTON': 'WA', 'WEST VIRGINIA': 'WV',
+    'WISCONSIN': 'WI', 'WYOMING': 'WY', 'DISTRICT OF COLUMBIA': 'DC',
+    'PUERTO RICO': 'PR', 'VIRGIN ISLANDS': 'VI'
 }
 
 FORM_TYPES = ['1099-NEC', '1099-MISC', '1099-DIV', '1099-INT', '1099-B', '1099-R', '1099-S', '1098']
 
+# Conflict target for bulk form upserts (see migration 014_forms_upsert_key.sql)
+FORMS_1099_UPSERT_KEY = 'filer_id,recipient_id,operating_year_id,form_type,original_key'
+FORM_UPSERT_CHUNK_SIZE = 500
+
+# Staging rows: page size for reads (PostgREST caps a response at 1000 rows)
+# and chunk size for bulk write-back
+IMPORT_ROW_PAGE_SIZE = 1000
+IMPORT_ROW_CHUNK_SIZE = 500
+
+# Staging inserts: a chunk is cut at about this many bytes of JSON (and at most
+# IMPORT_ROW_CHUNK_SIZE rows); up to IMPORT_INSERT_WORKERS chunks are in flight
+# and a failed chunk is retried IMPORT_INSERT_RETRIES times
+IMPORT_INSERT_CHUNK_BYTES = int(os.getenv("IMPORT_INSERT_CHUNK_BYTES", str(256 * 1024)))
+IMPORT_INSERT_WORKERS = int(os.getenv("IMPORT_INSERT_WORKERS", "4"))
+IMPORT_INSERT_RETRIES = 2
+
+# Receives progress updates from long imports (see import_jobs.py)
+ProgressCallback = Callable[[Dict[str, Any]], None]
+
+# Sheets of one workbook processed at once (each on its own thread)
+IMPORT_SHEET_WORKERS = int(os.getenv("IMPORT_SHEET_WORKERS", "4"))
+
+# Recipient find-or-create is serialized per TIN across sheet workers
+RECIPIENT_LOCK_STRIPES = 64
+
+# Form statuses a re-import with delete_missing may remove (never filed forms)
+DELETABLE_FORM_STATUSES = ['draft', 'ready']
+
+# Row errors kept in import_history per import (the JSONB column stays small)
+HISTORY_ROW_ERRORS = 100
+
 
 # =============================================================================
 # NORMALIZATION FUNCTIONS
 # =============================================================================
 
-def detect_business_entity(name: str) -> bool:
+def content_hash(values: Dict[str, Any]) -> str:
     """
-    Detect if a name appears to be a business entity based on common suffixes.
+    Stable SHA-256 of the values an import writes for one record.
 
-    Returns True if the name contains business entity indicators like LLC, Inc, Corp, etc.
+    Key order doesn't matter. Stored in recipients.content_hash and
+    forms_1099.content_hash (migration 016) so a re-import can skip
+    records whose values haven't changed.
     """
-    if not name:
-        return False
-
-    name_upper = name.upper()
-    business_indicators = [
-        'LLC', 'L.L.C', 'L L C',
-        'INC', 'INCORPORATED',
-        'CORP', 'CORPORATION',
-        'LTD', 'LIMITED',
-        'CO', 'COMPANY',
-        'LP', 'L.P',
-        'LLP', 'L.L.P',
-        'PLLC', 'P.L.L.C',
-        'PA', 'P.A',
-        'PC', 'P.C',
-        'PROFESSIONAL ASSOCIATION',
-        'PROFESSIONAL CORPORATION',
-    ]
+    return hashlib.sha256(json.dumps(values, sort_keys=True, default=str).encode()).hexdigest()
+
 
-    for indicator in business_indicators:
-        if indicator in name_upper:
-            return True
+def _chunk_by_size(records: Iterator[dict], max_bytes: int = IMPORT_INSERT_CHUNK_BYTES,
+                   max_rows: int = IMPORT_ROW_CHUNK_SIZE) -> Iterator[List[dict]]:
+    """
+    Group records into chunks of at most max_bytes of JSON and max_rows records.
 
-    return False
+    Wide sheets get smaller chunks so one request never gets too large; a
+    single record over max_bytes goes in a chunk of its own.
+    """
+    chunk: List[dict] = []
+    size = 0
+    for record in records:
+        record_size = len(json.dumps(record, default=str))
+        if chunk and (size + record_size > max_bytes or len(chunk) >= max_rows):
+            yield chunk
+            chunk, size = [], 0
+        chunk.append(record)
+        size += record_size
+    if chunk:
+        yield chunk
 
 
 def normalize_tin(tin: Any) -> Tuple[Optional[str], Optional[str], List[dict]]:
@@ -146,27 +198,9 @@ def normalize_state(state: Any) -> Tuple[Optional[str], List[dict]]:
 
     state_str = str(state).strip().upper()
 
-    # Common state name mappings
-    state_names = {
-        'ALABAMA': 'AL', 'ALASKA': 'AK', 'ARIZONA': 'AZ', 'ARKANSAS': 'AR',
-        'CALIFORNIA': 'CA', 'COLORADO': 'CO', 'CONNECTICUT': 'CT', 'DELAWARE': 'DE',
-        'FLORIDA': 'FL', 'GEORGIA': 'GA', 'HAWAII': 'HI', 'IDAHO': 'ID',
-        'ILLINOIS': 'IL', 'INDIANA': 'IN', 'IOWA': 'IA', 'KANSAS': 'KS',
-        'KENTUCKY': 'KY', 'LOUISIANA': 'LA', 'MAINE': 'ME', 'MARYLAND': 'MD',
-        'MASSACHUSETTS': 'MA', 'MICHIGAN': 'MI', 'MINNESOTA': 'MN', 'MISSISSIPPI': 'MS',
-        'MISSOURI': 'MO', 'MONTANA': 'MT', 'NEBRASKA': 'NE', 'NEVADA': 'NV',
-        'NEW HAMPSHIRE': 'NH', 'NEW JERSEY': 'NJ', 'NEW MEXICO': 'NM', 'NEW YORK': 'NY',
-        'NORTH CAROLINA': 'NC', 'NORTH DAKOTA': 'ND', 'OHIO': 'OH', 'OKLAHOMA': 'OK',
-        'OREGON': 'OR', 'PENNSYLVANIA': 'PA', 'RHODE ISLAND': 'RI', 'SOUTH CAROLINA': 'SC',
-        'SOUTH DAKOTA': 'SD', 'TENNESSEE': 'TN', 'TEXAS': 'TX', 'UTAH': 'UT',
-        'VERMONT': 'VT', 'VIRGINIA': 'VA', 'WASHINGTON': 'WA', 'WEST VIRGINIA': 'WV',
-        'WISCONSIN': 'WI', 'WYOMING': 'WY', 'DISTRICT OF COLUMBIA': 'DC',
-        'PUERTO RICO': 'PR', 'VIRGIN ISLANDS': 'VI'
-    }
-
     # Try full name first
-    if state_str in state_names:
-        return state_names[state_str], []
+    if state_str in STATE_NAMES:
+        return STATE_NAMES[state_str], []
 
     # Already 2-letter code?
     if len(state_str) == 2 and state_str in VALID_STATES:
@@ -429,6 +463,556 @@ def normalize_boolean(val: Any, field_name: str) -> Tuple[Optional[bool], List[d
                   'message': f'Cannot parse boolean: {val}', 'severity': 'warning'}]
 
 
+# =============================================================================
+# COLUMN-WISE NORMALIZATION
+# =============================================================================
+#
+# Series versions of the normalize_* functions above. Each returns the
+# normalized values plus a sparse error table (one row per error, indexed by
+# the source row label) of what came up while normalizing: unparseable
+# amounts and dates, sanitized or truncated text. Checks on the normalized
+# values (required fields, TIN / ZIP validity, amount range) are
+# validation_rules.IMPORT_RULES, applied by normalize_columns. City and state
+# are checked by their normalize_*_series on the cell as read, as they always
+# were: the stored state is shortened to two letters.
+
+# Recipient fields whose errors block a quick-import row
+RECIPIENT_FIELDS = [
+    'recipient_name', 'recipient_name_line2', 'recipient_tin', 'recipient_address1',
+    'recipient_city', 'recipient_state', 'recipient_zip',
+]
+
+# Form fields normalized column-wise, in the order the row loops visited them
+FORM_FIELD_KINDS: List[Tuple[str, str]] = [
+    ('nec_box1', 'amount'), ('nec_box4', 'amount'),
+    ('misc_box1', 'amount'), ('misc_box2', 'amount'), ('misc_box3', 'amount'),
+    ('misc_box4', 'amount'), ('misc_box5', 'amount'), ('misc_box6', 'amount'),
+    ('misc_box8', 'amount'), ('misc_box9', 'amount'), ('misc_box10', 'amount'),
+    ('misc_box11', 'amount'), ('misc_box12', 'amount'), ('misc_box14', 'amount'),
+    ('s_box1_date_closing', 'date'), ('s_box2_gross_proceeds', 'amount'),
+    ('s_box3_property_address', 'text'), ('s_box4_property_services', 'boolean'),
+    ('s_box5_foreign_person', 'boolean'), ('s_box6_buyers_tax', 'amount'),
+    ('f1098_box1_mortgage_interest', 'amount'), ('f1098_box2_outstanding_principal', 'amount'),
+    ('f1098_box3_origination_date', 'date'), ('f1098_box4_refund_interest', 'amount'),
+    ('f1098_box5_mortgage_insurance', 'amount'), ('f1098_box6_points_paid', 'amount'),
+    ('f1098_box8_property_address', 'text'), ('f1098_box9_num_properties', 'count'),
+    ('f1098_box10_other', 'amount'), ('f1098_box11_acquisition_date', 'date'),
+]
+
+# Target fields normalize_columns produces (recipient_tin also gives recipient_tin_type)
+NORMALIZED_FIELDS: List[str] = [
+    'recipient_name', 'recipient_name_line2', 'recipient_tin',
+    'recipient_address1', 'recipient_address2', 'recipient_city', 'recipient_state', 'recipient_zip',
+] + [field for field, _ in FORM_FIELD_KINDS]
+
+# Import target fields under the names validation_rules uses, and back
+RULE_COLUMNS = {
+    'recipient_name': 'name', 'recipient_name_line2': 'name_line_2',
+    'recipient_tin': 'tin', 'recipient_tin_type': 'tin_type',
+    'recipient_address1': 'address1', 'recipient_address2': 'address2',
+    'recipient_city': 'city', 'recipient_state': 'state', 'recipient_zip': 'zip',
+}
+IMPORT_FIELDS = {rule_field: field for field, rule_field in RULE_COLUMNS.items()}
+
+_TRUE_STRINGS = ('true', 'yes', 'y', '1', 'x', 'checked')
+_FALSE_STRINGS = ('false', 'no', 'n', '0', '', 'unchecked')
+
+
+def _error_table(mask: pd.Series, field: str, code: str, message: Union[str, pd.Series], severity: str) -> pd.DataFrame:
+    """Build error rows for every label where mask is True."""
+    mask = mask.fillna(False).astype(bool)
+    if not mask.any():
+        return empty_error_table()
+    index = mask.index[mask.to_numpy()]
+    messages = message[mask] if isinstance(message, pd.Series) else message
+    return pd.DataFrame({'field': field, 'code': code, 'message': messages, 'severity': severity},
+                        index=index, columns=ERROR_COLUMNS)
+
+
+def _concat_errors(tables: List[pd.DataFrame]) -> pd.DataFrame:
+    """Concatenate error tables, keeping per-row order stable."""
+    tables = [t for t in tables if len(t)]
+    if not tables:
+        return empty_error_table()
+    return pd.concat(tables).sort_index(kind='stable')
+
+
+def _missing(series: pd.Series) -> pd.Series:
+    """Cells the scalar functions treat as missing (None / NaN)."""
+    return series.isna()
+
+
+def _present(series: pd.Series) -> pd.Series:
+    """Cells the row loops treated as supplied (`if val and not pd.isna(val)`)."""
+    return series.notna() & series.map(bool, na_action='ignore').fillna(False).astype(bool)
+
+
+def _as_objects(series: pd.Series) -> pd.Series:
+    """Object Series with None (not NaN) for missing values, ready for JSON."""
+    series = series.astype(object)
+    series[series.isna()] = None
+    return series
+
+
+def _collapse_whitespace(series: pd.Series) -> pd.Series:
+    """Vectorized ' '.join(s.split())."""
+    return series.str.replace(r'\s+', ' ', regex=True).str.strip()
+
+
+def _unescape_html(series: pd.Series) -> pd.Series:
+    """html.unescape, applied only to cells that contain an entity."""
+    import html
+    has_entity = series.str.contains('&', regex=False, na=False)
+    if has_entity.any():
+        series = series.copy()
+        series[has_entity] = series[has_entity].map(html.unescape)
+    return series
+
+
+def normalize_tin_series(tins: pd.Series) -> Tuple[pd.Series, pd.Series, pd.DataFrame]:
+    """Column-wise normalize_tin. Returns (tins, tin_types, errors)."""
+    tins = tins.astype(object)
+    missing = _missing(tins)
+    out = pd.Series(None, index=tins.index, dtype=object)
+    types = pd.Series(None, index=tins.index, dtype=object)
+
+    tin_str = tins[~missing].astype(str).str.strip()
+    clean = tin_str.str.replace(r'[^0-9]', '', regex=True)
+    bad_length = clean.str.len() != 9
+    out.loc[bad_length.index[bad_length]] = tin_str[bad_length]
+
+    tin_str, clean = tin_str[~bad_length], clean[~bad_length]
+    ssn_pattern = tin_str.str.match(r'^\d{3}[\s\-]?\d{2}[\s\-]?\d{4}$').astype(bool)
+    ein_pattern = tin_str.str.match(r'^\d{2}[\s\-]?\d{7}$').astype(bool)
+    clearly_ssn = ssn_pattern & ~ein_pattern
+    clearly_ein = ein_pattern & ~ssn_pattern
+    # Ambiguous: low prefixes and known EIN-only codes are EINs, the rest SSNs
+    first_two = clean.str[:2].astype(int)
+    is_ein = clearly_ein | (~clearly_ssn & ~clearly_ein & ((first_two < 10) | first_two.isin((20, 26, 27))))
+
+    out.loc[clean.index] = (clean.str[:3] + '-' + clean.str[3:5] + '-' + clean.str[5:]).where(
+        ~is_ein, clean.str[:2] + '-' + clean.str[2:])
+    types.loc[clean.index] = pd.Series('SSN', index=clean.index, dtype=object).where(~is_ein, 'EIN')
+
+    return _as_objects(out), _as_objects(types), empty_error_table()
+
+
+def normalize_state_series(states: pd.Series) -> Tuple[pd.Series, pd.DataFrame]:
+    """Column-wise normalize_state."""
+    states = states.astype(object)
+    missing = _missing(states)
+    out = pd.Series(None, index=states.index, dtype=object)
+
+    state_str = states[~missing].astype(str).str.strip().str.upper()
+    from_name = state_str.map(STATE_NAMES)
+    is_code = (state_str.str.len() == 2) & state_str.isin(VALID_STATES)
+    invalid = from_name.isna() & ~is_code
+    out.loc[state_str.index] = from_name.where(from_name.notna(), state_str.str[:2])
+
+    # Checked here rather than by IMPORT_RULES: the stored value is cut to two
+    # letters, so 'CAL' would pass as 'CA' and 'TEX' would be reported as 'TE'.
+    # A blank cell is an invalid state, not a missing one.
+    errors = _concat_errors([
+        _error_table(missing, 'recipient_state', 'MISSING_STATE', 'State is required', 'error'),
+        _error_table(invalid, 'recipient_state', 'INVALID_STATE', 'Invalid state: ' + state_str, 'error'),
+    ])
+    return _as_objects(out), errors
+
+
+def normalize_zip_series(zips: pd.Series) -> Tuple[pd.Series, pd.DataFrame]:
+    """Column-wise normalize_zip."""
+    zips = zips.astype(object)
+    missing = _missing(zips)
+    out = pd.Series(None, index=zips.index, dtype=object)
+
+    zip_clean = zips[~missing].astype(str).str.strip().str.replace(r'[^0-9-]', '', regex=True)
+    digits = zip_clean.str.replace(r'[^0-9]', '', regex=True).str.zfill(5)
+    lengths = digits.str.len()
+    five, nine = lengths == 5, lengths == 9
+
+    out.loc[zip_clean.index] = zip_clean
+    out.loc[digits.index[five]] = digits[five]
+    out.loc[digits.index[nine]] = digits[nine].str[:5] + '-' + digits[nine].str[5:]
+    return _as_objects(out), empty_error_table()
+
+
+def normalize_name_series(names: pd.Series) -> Tuple[pd.Series, pd.DataFrame]:
+    """Column-wise normalize_name (IRS BusinessNameLine1Type characters)."""
+    names = names.astype(object)
+    missing = _missing(names)
+    out = pd.Series(None, index=names.index, dtype=object)
+
+    name_str = _collapse_whitespace(_unescape_html(names[~missing].astype(str).str.strip()))
+    original = name_str.str.replace('.', '', regex=False).str.replace(',', '', regex=False)
+    name_str = _collapse_whitespace(original.str.replace(r"[^A-Za-z0-9#\-\(\)&\'\s]", '', regex=True))
+
+    sanitized = name_str != original
+    lengths = name_str.str.len()
+    truncated = lengths > 75
+    name_str = name_str.str[:75]
+    empty = name_str == ''
+    out.loc[name_str.index[~empty]] = name_str[~empty]
+
+    # A name that sanitizes to nothing is left to the MISSING_NAME rule
+    errors = _concat_errors([
+        _error_table(sanitized & ~empty, 'recipient_name', 'NAME_SANITIZED',
+                     'Name sanitized for IRS compliance', 'info'),
+        _error_table(truncated & ~empty, 'recipient_name', 'NAME_TRUNCATED',
+                     'Name truncated from ' + lengths.astype(str) + ' to 75 chars', 'warning'),
+    ])
+    return _as_objects(out), errors
+
+
+def normalize_address_series(addresses: pd.Series) -> Tuple[pd.Series, pd.DataFrame]:
+    """Column-wise normalize_address (IRS StreetAddressType characters)."""
+    addresses = addresses.astype(object)
+    out = pd.Series(None, index=addresses.index, dtype=object)
+
+    addr = _collapse_whitespace(_unescape_html(addresses[~_missing(addresses)].astype(str).str.strip()))
+    addr = addr.str.replace('.', '', regex=False).str.replace(',', '', regex=False)
+    addr = addr.str.replace('#', 'No ', regex=False)
+    addr = _collapse_whitespace(addr.str.replace(r'[^A-Za-z0-9\-/\s]', '', regex=True))
+
+    lengths = addr.str.len()
+    truncated = lengths > 35
+    addr = addr.str[:35]
+    out.loc[addr.index[addr != '']] = addr[addr != '']
+
+    errors = _error_table(truncated, 'address', 'ADDRESS_TRUNCATED',
+                          'Address truncated from ' + lengths.astype(str) + ' to 35 chars', 'warning')
+    return _as_objects(out), errors
+
+
+def normalize_city_series(cities: pd.Series) -> Tuple[pd.Series, pd.DataFrame]:
+    """Column-wise normalize_city."""
+    cities = cities.astype(object)
+    missing = _missing(cities)
+    out = pd.Series(None, index=cities.index, dtype=object)
+
+    city = _collapse_whitespace(_unescape_html(cities[~missing].astype(str).str.strip()))
+    city = city.str.replace(r"[^\w\s\.\-\']", '', regex=True).str[:25]
+    out.loc[city.index[city != '']] = city[city != '']
+
+    # Only an empty cell is missing; a blank string is stored as no city
+    errors = _error_table(missing, 'recipient_city', 'MISSING_CITY', 'City is required', 'error')
+    return _as_objects(out), errors
+
+
+def normalize_amount_series(amounts: pd.Series, field_name: str) -> Tuple[pd.Series, pd.DataFrame]:
+    """Column-wise normalize_amount."""
+    amounts = amounts.astype(object)
+    out = pd.Series(None, index=amounts.index, dtype=object)
+
+    cleaned = amounts[~_missing(amounts)]
+    is_str = cleaned.map(type) == str
+    if is_str.any():
+        text = cleaned[is_str].astype(str).str.strip().str.replace(r'[,$()]', '', regex=True)
+        signed = text.str.startswith('-') | text.str.endswith('-')
+        text = text.where(~signed, '-' + text.str.replace('-', '', regex=False))
+        cleaned = cleaned.copy()
+        cleaned.loc[is_str] = text.astype(object)
+
+    values = pd.to_numeric(cleaned, errors='coerce').astype(object)
+    invalid = pd.Series(False, index=cleaned.index)
+    # Anything the fast path couldn't read gets the scalar float() treatment
+    unresolved = values.isna()
+    if unresolved.any():
+        def _to_float(v: Any) -> Optional[float]:
+            try:
+                return float(v)
+            except (ValueError, TypeError, InvalidOperation):
+                return None
+        retried = pd.Series([_to_float(v) for v in cleaned[unresolved]],
+                            index=cleaned.index[unresolved], dtype=object)
+        values.loc[unresolved] = retried
+        invalid.loc[unresolved] = retried.map(lambda v: v is None)
+
+    numbers = values[~invalid].astype(float)
+    out.loc[numbers.index] = numbers.map(lambda v: round(v, 2))
+
+    errors = _error_table(invalid, field_name, 'INVALID_AMOUNT',
+                          cleaned.map(lambda v: f'Cannot parse amount: {v}'), 'error')
+    return _as_objects(out), errors
+
+
+def normalize_date_series(dates: pd.Series, field_name: str, for_database: bool = True) -> Tuple[pd.Series, pd.DataFrame]:
+    """Column-wise normalize_date. Cells pandas can't parse in bulk fall back to normalize_date."""
+    dates = dates.astype(object)
+    out = pd.Series(None, index=dates.index, dtype=object)
+
+    date_str = dates[~_missing(dates)].astype(str).str.strip()
+    date_str = date_str[date_str != '']
+    if date_str.empty:
+        return out, empty_error_table()
+
+    try:
+        parsed = pd.to_datetime(date_str, errors='coerce', format='mixed')
+    except (ValueError, TypeError, OverflowError):
+        parsed = pd.Series(pd.NaT, index=date_str.index)
+    ok = parsed.notna()
+    out.loc[parsed.index[ok]] = parsed[ok].dt.strftime('%Y-%m-%d' if for_database else '%m/%d/%Y')
+
+    tables = []
+    for label, value in date_str[~ok].items():
+        out.loc[label], errs = normalize_date(value, field_name, for_database)
+        if errs:
+            tables.append(pd.DataFrame(errs, index=[label] * len(errs), columns=ERROR_COLUMNS))
+    return _as_objects(out), _concat_errors(tables)
+
+
+def normalize_boolean_series(values: pd.Series, field_name: str) -> Tuple[pd.Series, pd.DataFrame]:
+    """Column-wise normalize_boolean."""
+    values = values.astype(object)
+    out = pd.Series(None, index=values.index, dtype=object)
+
+    present = values[~_missing(values)]
+    is_bool = present.map(type) == bool
+    out.loc[present.index[is_bool]] = present[is_bool]
+
+    raw = present[~is_bool]
+    text = raw.astype(str).str.strip().str.lower()
+    truthy, falsy = text.isin(_TRUE_STRINGS), text.isin(_FALSE_STRINGS)
+    out.loc[text.index[truthy]] = True
+    out.loc[text.index[falsy]] = False
+
+    errors = _error_table(~truthy & ~falsy, field_name, 'INVALID_BOOLEAN',
+                          raw.map(lambda v: f'Cannot parse boolean: {v}'), 'warning')
+    return _as_objects(out), errors
+
+
+def normalize_columns(df: pd.DataFrame, reverse_map: Dict[str, str]) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Normalize every mapped target field of a sheet, one column at a time.
+
+    Args:
+        df: Raw rows, one record per row
+        reverse_map: {target_field: source_column}
+
+    Returns: (normalized, errors)
+        normalized: one column per target field plus recipient_tin_type,
+            same index as df, None where there is no value
+        errors: sparse error table indexed by df row label, with the
+            field/code/message/severity the scalar normalize_* function
+            reports plus 'source' (the target field that produced it).
+            Normalization problems come first, then IMPORT_RULES failures
+            on the normalized values.
+    """
+    normalized, errors = normalize_fields(df, reverse_map)
+    return normalized, _with_source(_concat_errors([errors, validate_normalized(normalized)]))
+
+
+def normalize_fields(
+    df: pd.DataFrame, reverse_map: Dict[str, str], fields: Optional[Iterable[str]] = None
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    The normalization half of normalize_columns, for the target fields in
+    fields only (default: all of NORMALIZED_FIELDS).
+
+    recipient_tin_type comes with recipient_tin. The error table has no
+    IMPORT_RULES failures; see validate_normalized.
+    """
+    fields = set(NORMALIZED_FIELDS if fields is None else fields)
+
+    def raw(field: str) -> pd.Series:
+        source_col = reverse_map.get(field)
+        if source_col is None or source_col not in df.columns:
+            return pd.Series(None, index=df.index, dtype=object)
+        return df[source_col].astype(object)
+
+    normalized = pd.DataFrame(index=df.index)
+    tables: List[pd.DataFrame] = []
+
+    def add(field: str, values: pd.Series, errors: pd.DataFrame) -> None:
+        normalized[field] = _as_objects(values.reindex(df.index))
+        if len(errors):
+            tables.append(errors.assign(source=field))
+
+    if 'recipient_name' in fields:
+        add('recipient_name', *normalize_name_series(raw('recipient_name')))
+
+    if 'recipient_name_line2' in fields:
+        # Line 2 is optional; blank cells are skipped rather than reported
+        name2 = raw('recipient_name_line2')
+        add('recipient_name_line2', *normalize_name_series(name2[_present(name2)]))
+
+    if 'recipient_tin' in fields:
+        tins, tin_types, tin_errors = normalize_tin_series(raw('recipient_tin'))
+        add('recipient_tin', tins, tin_errors)
+        normalized['recipient_tin_type'] = _as_objects(tin_types)
+
+    for field, normalize_series in [
+        ('recipient_address1', normalize_address_series),
+        ('recipient_address2', normalize_address_series),
+        ('recipient_city', normalize_city_series),
+        ('recipient_state', normalize_state_series),
+        ('recipient_zip', normalize_zip_series),
+    ]:
+        if field in fields:
+            add(field, *normalize_series(raw(field)))
+
+    def _to_int(v: Any) -> Optional[int]:
+        try:
+            return int(float(v))
+        except (ValueError, TypeError, OverflowError):
+            return None
+
+    for field, kind in FORM_FIELD_KINDS:
+        if field not in fields:
+            continue
+        values = raw(field)
+        if kind == 'amount':
+            add(field, *normalize_amount_series(values, field))
+        elif kind == 'date':
+            add(field, *normalize_date_series(values, field))
+        elif kind == 'boolean':
+            add(field, *normalize_boolean_series(values, field))
+        elif kind == 'text':
+            # Free-text property descriptions are just trimmed
+            values = values[_present(values)]
+            add(field, values.astype(str).str.strip(), empty_error_table())
+        elif kind == 'count':
+            values = values[_present(values)]
+            add(field, values.map(_to_int), empty_error_table())
+
+    return normalized, _with_source(_concat_errors(tables))
+
+
+def validate_normalized(normalized: pd.DataFrame) -> pd.DataFrame:
+    """IMPORT_RULES failures on normalized target fields, as an error table with 'source'."""
+    # Rules use recipients table column names
+    checked = evaluate_rules(normalized.rename(columns=RULE_COLUMNS), IMPORT_RULES, consumer='import')
+    if len(checked):
+        checked['field'] = checked['field'].map(lambda f: IMPORT_FIELDS.get(f, f))
+        checked['source'] = checked['field']
+    return _with_source(checked)
+
+
+def _with_source(errors: pd.DataFrame) -> pd.DataFrame:
+    if 'source' not in errors.columns:
+        errors['source'] = pd.Series(dtype=object)
+    return errors
+
+
+def errors_by_row(errors: pd.DataFrame) -> Dict[Any, List[dict]]:
+    """Group a sparse error table into {row_label: [error dicts]} (rows with errors only)."""
+    grouped: Dict[Any, List[dict]] = {}
+    for label, record in zip(errors.index, errors[ERROR_COLUMNS].to_dict('records')):
+        grouped.setdefault(label, []).append(record)
+    return grouped
+
+
+def skipped_rows(row_errors: List[dict]) -> int:
+    """How many row_errors entries are rows that were not imported (not just warned about)."""
+    return sum(
+        any(error.get('severity', 'error') == 'error' for error in entry['errors'])
+        for entry in row_errors
+    )
+
+
+# =============================================================================
+# DUPLICATE DETECTION
+# =============================================================================
+
+# Names at least this similar (difflib ratio) in one block are near-duplicates
+NEAR_DUPLICATE_RATIO = 0.85
+
+# Generational and professional suffixes skipped when taking a surname
+_NAME_SUFFIXES = {'JR', 'SR', 'II', 'III', 'IV', 'MD', 'DDS', 'PHD', 'ESQ', 'CPA'}
+
+
+def _match_name(name: str) -> str:
+    """Upper-case name with punctuation dropped and spaces collapsed, for comparing."""
+    return ' '.join(re.sub(r'[^A-Z0-9& ]', ' ', name.upper()).split())
+
+
+def name_control(name: Optional[str]) -> str:
+    """
+    IRS-style name control: the first four characters of the surname, or of
+    a business name (leading 'THE' skipped). '' when there is no name.
+    """
+    words = _match_name(name or '').split()
+    if not words:
+        return ''
+    if detect_business_entity(name):
+        if words[0] == 'THE' and len(words) > 1:
+            words = words[1:]
+        return ''.join(words)[:4]
+    surnames = [w for w in words if w not in _NAME_SUFFIXES] or words
+    return surnames[-1][:4]
+
+
+class RecipientIndex:
+    """
+    Finds duplicate and near-duplicate recipients while a file is imported.
+
+    check() is called for each row in sheet and row order, once every
+    sheet has been read (sheets run in parallel, so the rows are checked
+    afterwards to give the same warnings whichever sheet finishes first):
+    - DUPLICATE_ROW: an earlier row of the file has the same TIN and form
+      type. The two rows become one form: the boxes the later row fills
+      override the earlier row's, and the earlier row's other boxes are
+      kept.
+    - POSSIBLE_DUPLICATE: an earlier row or a stored recipient has a
+      similar name with a different TIN. Usually a mistyped TIN, and it
+      would create a second recipient.
+
+    Exact matches are looked up by TIN. Near-duplicates are only compared
+    within a block of the same name_control and 5-digit ZIP. Blocks stay
+    small, so a check costs O(1) expected. Findings are warnings; the row
+    is still imported.
+    """
+
+    def __init__(self, recipients: Iterable[dict] = ()):
+        self._rows: Dict[Tuple[str, str], str] = {}  # (tin digits, form_type) -> first row
+        self._blocks: Dict[Tuple[str, str], Dict[str, Tuple[str, str]]] = {}  # block -> {tin: (name, where)}
+        for recipient in recipients:
+            self._add(recipient.get('tin'), recipient.get('name'), recipient.get('zip'), 'an existing recipient')
+
+    @staticmethod
+    def _block(name: Optional[str], zip_code: Optional[str]) -> Optional[Tuple[str, str]]:
+        control, zip5 = name_control(name), re.sub(r'\D', '', zip_code or '')[:5]
+        return (control, zip5) if control and len(zip5) == 5 else None
+
+    def _add(self, tin: Optional[str], name: Optional[str], zip_code: Optional[str], where: str) -> None:
+        block = self._block(name, zip_code)
+        if block and tin:
+            self._blocks.setdefault(block, {}).setdefault(re.sub(r'\D', '', tin), (name, where))
+
+    def check(
+        self,
+        tin: str,
+        name: Optional[str],
+        zip_code: Optional[str],
+        form_type: str,
+        sheet_name: str,
+        row_num: int,
+    ) -> List[dict]:
+        """Warnings for one row (see the class docstring), then add the row to the index."""
+        digits = re.sub(r'\D', '', tin)
+        where = f"row {row_num} of sheet '{sheet_name}'"
+        warnings = []
+        first = self._rows.setdefault((digits, form_type), where)
+        if first != where:
+            warnings.append({'field': 'recipient_tin', 'code': 'DUPLICATE_ROW',
+                             'message': f'Same TIN and form type as {first}; boxes filled in this row '
+                                        "override that row's, its other boxes are kept",
+                             'severity': 'warning'})
+
+        block = self._block(name, zip_code)
+        if block:
+            key = _match_name(name)
+            for other_tin, (other_name, other_where) in self._blocks.get(block, {}).items():
+                if other_tin != digits and \
+                        SequenceMatcher(None, key, _match_name(other_name)).ratio() >= NEAR_DUPLICATE_RATIO:
+                    warnings.append({'field': 'recipient_name', 'code': 'POSSIBLE_DUPLICATE',
+                                     'message': f"Similar to '{other_name}' ({other_where}) "
+                                                f"but with a different TIN",
+                                     'severity': 'warning'})
+                    break
+        self._add(tin, name, zip_code, where)
+        return warnings
+
+
 # =============================================================================
 # COLUMN MAPPING
 # =============================================================================
@@ -449,137 +1033,551 @@ def get_column_aliases() -> Dict[str, List[str]]:
     return aliases
 
 
+# Aliases for common template column names; these supplement the database aliases
+TEMPLATE_ALIASES: Dict[str, List[str]] = {
+    'recipient_name': ['recipient name1', 'name1', 'payee name', 'recipient name'],
+    'recipient_name_line2': ['recipient name2', 'name2', 'name line 2'],
+    'recipient_tin': ['recipienttaxid', 'recipient taxid', 'recipient tax id', 'taxid', 'tax id', 'tin', 'ssn', 'ein'],
+    'recipient_address1': ['address1', 'address', 'street', 'street address'],
+    'recipient_address2': ['address2', 'address line 2', 'apt', 'suite'],
+    'recipient_city': ['city'],
+    'recipient_state': ['state'],
+    'recipient_zip': ['zipcode', 'zip code', 'zip', 'postal'],
+    'recipient_email': ['emailaddress', 'email address', 'email', 'e-mail'],
+    'account_number': ['accountnum', 'account num', 'account number', 'acct', 'account'],
+    # NEC boxes
+    'nec_box1': ['box1_nec', 'box 1 nec', 'nec box 1', 'nec box1', 'nonemployee compensation', 'compensation', 'amount'],
+    'nec_box4': ['box4_fedwithheld', 'box4_fed_withheld', 'federal withheld', 'fed withheld'],
+    # MISC boxes - key fix: add box1_rents
+    'misc_box1': ['box1_rents', 'box1 rents', 'box 1 rents', 'rents', 'rent'],
+    'misc_box2': ['box2_royalties', 'box2 royalties', 'royalties', 'royalty'],
+    'misc_box3': ['box3_otherincome', 'box3 otherincome', 'box3_ otherincome', 'other income', 'other'],
+    'misc_box4': ['box4_fedwithheld', 'misc fed withheld'],
+    'misc_box6': ['box6', 'medical', 'medical payments'],
+    'misc_box10': ['box10', 'attorney', 'gross proceeds attorney'],
+    # 1099-S boxes
+    's_box1_date_closing': ['date of closing', 'closing date', 'date closing', 's_box1', 'box 1 closing', '1 date of closing'],
+    's_box2_gross_proceeds': ['gross proceeds', 'proceeds', 'sale amount', 's_box2', 'box 2 proceeds', '2. gross proceeds', '2 gross proceeds'],
+    's_box3_property_address': ['property address', 'property description', 'legal description', 's_box3', 'box 3 property'],
+    's_box4_property_services': ['property services', 'received property', 's_box4', '4. rec prop or serv', 'rec prop or serv'],
+    's_box5_foreign_person': ['foreign person', 'foreign buyer', 's_box5', '5. foreign person'],
+    's_box6_buyers_tax': ['buyers tax', 'buyer tax', 'real estate tax', 's_box6', 'box 6 tax', '6. buyers part of real estate tax', 'buyers part of real estate tax'],
+    # 1098 boxes
+    'f1098_box1_mortgage_interest': ['mortgage interest', 'interest received', 'interest paid', '1098_box1', 'box 1 mortgage', '1. mortgage interest'],
+    'f1098_box2_outstanding_principal': ['outstanding principal', 'principal balance', 'mortgage principal', '1098_box2', '2. mortgage principal'],
+    'f1098_box3_origination_date': ['origination date', 'mortgage origination', 'loan origination', '1098_box3', '3. origin date', 'origin date'],
+    'f1098_box4_refund_interest': ['refund interest', 'overpaid interest', '1098_box4', '4. refund of int', 'refund of int'],
+    'f1098_box5_mortgage_insurance': ['mortgage insurance', 'pmi', 'insurance premiums', '1098_box5', '5. mip', 'mip'],
+    'f1098_box6_points_paid': ['points paid', 'points', '1098_box6', '6. points'],
+    'f1098_box8_property_address': ['1098 property address', '1098_box8', '8. address'],
+    'f1098_box9_num_properties': ['number of properties', 'num properties', '1098_box9', '9. no. of prop', 'no. of prop'],
+    'f1098_box10_other': ['1098 other', '1098_box10', '10. prop taxes', 'prop taxes'],
+    'f1098_box11_acquisition_date': ['acquisition date', 'property acquisition', '1098_box11', '11 acq date', 'acq date'],
+}
+
+# Generic BOX1, BOX2, ... columns only apply when the form type is known from
+# the sheet name. 'address' is here (not global) to avoid recipient_address1.
+FORM_SPECIFIC_ALIASES: Dict[str, Dict[str, List[str]]] = {
+    '1099-S': {
+        's_box1_date_closing': ['box1', 'box 1'],
+        's_box2_gross_proceeds': ['box2', 'box 2'],
+        's_box3_property_address': ['box3', 'box 3', 'address'],
+        's_box4_property_services': ['box4', 'box 4'],
+        's_box5_foreign_person': ['box5', 'box 5'],
+        's_box6_buyers_tax': ['box6', 'box 6'],
+    },
+    '1098': {
+        'f1098_box1_mortgage_interest': ['box1', 'box 1'],
+        'f1098_box2_outstanding_principal': ['box2', 'box 2'],
+        'f1098_box3_origination_date': ['box3', 'box 3'],
+        'f1098_box4_refund_interest': ['box4', 'box 4'],
+        'f1098_box5_mortgage_insurance': ['box5', 'box 5'],
+        'f1098_box6_points_paid': ['box6', 'box 6'],
+        # Box 7 is "same address" checkbox - not currently mapped
+        'f1098_box8_property_address': ['box8', 'box 8', 'address'],
+        'f1098_box9_num_properties': ['box9', 'box 9'],
+        'f1098_box10_other': ['box10', 'box 10'],
+        'f1098_box11_acquisition_date': ['box11', 'box 11'],
+    },
+}
+
+# How long database aliases are trusted before they are reloaded
+ALIAS_CACHE_TTL_SECONDS = 300
+
+
+def merge_aliases(aliases: Dict[str, List[str]], form_type: Optional[str] = None) -> Dict[str, List[str]]:
+    """
+    Database aliases followed by the template (and form-specific) aliases.
+
+    Order matters: fields are matched in dict order and each field takes its
+    first alias that matches a column. Aliases are lowercased and deduplicated.
+    """
+    template = {target: list(alias_list) for target, alias_list in TEMPLATE_ALIASES.items()}
+    for target, alias_list in FORM_SPECIFIC_ALIASES.get(form_type, {}).items():
+        template.setdefault(target, []).extend(alias_list)
+
+    merged = {target: list(alias_list) for target, alias_list in aliases.items()}
+    for target, alias_list in template.items():
+        existing = merged.setdefault(target, [])
+        seen = {a.lower() for a in existing}
+        for a in alias_list:
+            if a.lower() not in seen:
+                seen.add(a.lower())
+                existing.append(a.lower())
+    return merged
+
+
+class AliasMatcher:
+    """
+    Column-header lookup compiled from one merged alias list.
+
+    Every alias is indexed under its lowercase form and its underscores-as-
+    spaces form, so mapping a sheet's headers costs one dict lookup per
+    header instead of a scan over every alias.
+    """
+
+    def __init__(self, aliases: Dict[str, List[str]]):
+        self.targets = list(aliases)
+        # key -> [(field rank, alias rank)]
+        self._exact: Dict[str, List[Tuple[int, int]]] = {}
+        self._normalized: Dict[str, List[Tuple[int, int]]] = {}
+        for target_rank, target in enumerate(self.targets):
+            for alias_rank, alias in enumerate(aliases[target]):
+                alias = alias.lower()
+                self._exact.setdefault(alias, []).append((target_rank, alias_rank))
+                self._normalized.setdefault(alias.replace('_', ' '), []).append((target_rank, alias_rank))
+
+    def map_columns(self, df_columns: List[str]) -> Dict[str, str]:
+        """
+        {source_column: target_field} for the given headers.
+
+        Same rules as the alias scan it replaces: fields in order, each one
+        takes its first matching alias (exact match before the underscore-
+        normalized one), and a column already taken by an earlier field is
+        left alone.
+        """
+        exact_cols = {col.lower().strip(): col for col in df_columns}
+        normalized_cols: Dict[str, str] = {}
+        for col in df_columns:
+            normalized_cols[col.lower().strip().replace('_', ' ')] = col
+            normalized_cols[col.lower().strip()] = col
+
+        # Best (alias rank, exact before normalized, column) per field
+        best: Dict[int, Tuple[int, int, str]] = {}
+        for index, cols, kind in ((self._exact, exact_cols, 0), (self._normalized, normalized_cols, 1)):
+            for key, col in cols.items():
+                for target_rank, alias_rank in index.get(key, ()):
+                    current = best.get(target_rank)
+                    if current is None or (alias_rank, kind) < current[:2]:
+                        best[target_rank] = (alias_rank, kind, col)
+
+        mapping: Dict[str, str] = {}
+        for target_rank in sorted(best):
+            col = best[target_rank][2]
+            if col not in mapping:
+                mapping[col] = self.targets[target_rank]
+        return mapping
+
+
+class ColumnAliasRegistry:
+    """
+    Database column aliases, loaded once and compiled per form type.
+
+    Aliases are reloaded after ALIAS_CACHE_TTL_SECONDS or when invalidate()
+    is called, so a warm cache maps headers without any database calls.
+    """
+
+    def __init__(self, ttl: float = ALIAS_CACHE_TTL_SECONDS):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._db_aliases: Optional[Dict[str, List[str]]] = None
+        self._loaded_at = 0.0
+        self._matchers: Dict[Optional[str], AliasMatcher] = {}
+
+    def invalidate(self) -> None:
+        """Drop cached aliases; the next lookup reloads them."""
+        with self._lock:
+            self._db_aliases = None
+            self._matchers.clear()
+
+    def matcher(self, form_type: Optional[str] = None) -> AliasMatcher:
+        """Compiled matcher for a form type (generic BOX columns need one)."""
+        key = form_type if form_type in FORM_SPECIFIC_ALIASES else None
+        with self._lock:
+            if self._db_aliases is None or time.monotonic() - self._loaded_at > self.ttl:
+                self._db_aliases = get_column_aliases()
+                self._loaded_at = time.monotonic()
+                self._matchers.clear()
+            if key not in self._matchers:
+                self._matchers[key] = AliasMatcher(merge_aliases(self._db_aliases, key))
+            return self._matchers[key]
+
+
+_alias_registry = ColumnAliasRegistry()
+
+
+def invalidate_column_aliases() -> None:
+    """Reload column aliases on next use (call after editing column_aliases)."""
+    _alias_registry.invalidate()
+
+
 def auto_map_columns(df_columns: List[str], aliases: Optional[Dict[str, List[str]]] = None, form_type: Optional[str] = None) -> Dict[str, str]:
     """
     Auto-detect column mapping based on aliases.
 
     Args:
         df_columns: List of column names from the DataFrame
-        aliases: Optional pre-loaded aliases dict
+        aliases: Optional pre-loaded aliases dict (bypasses the cache)
         form_type: Optional form type to enable form-specific mappings
 
     Returns: {source_column: target_field}
     """
     if aliases is None:
-        aliases = get_column_aliases()
-
-    # Add hardcoded aliases for common template column names
-    # These supplement the database aliases
-    hardcoded_aliases = {
-        'recipient_name': ['recipient name1', 'name1', 'payee name', 'recipient name'],
-        'recipient_name_line2': ['recipient name2', 'name2', 'name line 2'],
-        'recipient_tin': ['recipienttaxid', 'recipient taxid', 'recipient tax id', 'taxid', 'tax id', 'tin', 'ssn', 'ein'],
-        'recipient_address1': ['address1', 'address', 'street', 'street address'],
-        'recipient_address2': ['address2', 'address line 2', 'apt', 'suite'],
-        'recipient_city': ['city'],
-        'recipient_state': ['state'],
-        'recipient_zip': ['zipcode', 'zip code', 'zip', 'postal'],
-        'recipient_email': ['emailaddress', 'email address', 'email', 'e-mail'],
-        'account_number': ['accountnum', 'account num', 'account number', 'acct', 'account'],
-        # NEC boxes
-        'nec_box1': ['box1_nec', 'box 1 nec', 'nec box 1', 'nec box1', 'nonemployee compensation', 'compensation', 'amount'],
-        'nec_box4': ['box4_fedwithheld', 'box4_fed_withheld', 'federal withheld', 'fed withheld'],
-        # MISC boxes - key fix: add box1_rents
-        'misc_box1': ['box1_rents', 'box1 rents', 'box 1 rents', 'rents', 'rent'],
-        'misc_box2': ['box2_royalties', 'box2 royalties', 'royalties', 'royalty'],
-        'misc_box3': ['box3_otherincome', 'box3 otherincome', 'box3_ otherincome', 'other income', 'other'],
-        'misc_box4': ['box4_fedwithheld', 'misc fed withheld'],
-        'misc_box6': ['box6', 'medical', 'medical payments'],
-        'misc_box10': ['box10', 'attorney', 'gross proceeds attorney'],
-        # 1099-S boxes
-        's_box1_date_closing': ['date of closing', 'closing date', 'date closing', 's_box1', 'box 1 closing', '1 date of closing'],
-        's_box2_gross_proceeds': ['gross proceeds', 'proceeds', 'sale amount', 's_box2', 'box 2 proceeds', '2. gross proceeds', '2 gross proceeds'],
-        's_box3_property_address': ['property address', 'property description', 'legal description', 's_box3', 'box 3 property'],
-        's_box4_property_services': ['property services', 'received property', 's_box4', '4. rec prop or serv', 'rec prop or serv'],
-        's_box5_foreign_person': ['foreign person', 'foreign buyer', 's_box5', '5. foreign person'],
-        's_box6_buyers_tax': ['buyers tax', 'buyer tax', 'real estate tax', 's_box6', 'box 6 tax', '6. buyers part of real estate tax', 'buyers part of real estate tax'],
-        # 1098 boxes
-        'f1098_box1_mortgage_interest': ['mortgage interest', 'interest received', 'interest paid', '1098_box1', 'box 1 mortgage', '1. mortgage interest'],
-        'f1098_box2_outstanding_principal': ['outstanding principal', 'principal balance', 'mortgage principal', '1098_box2', '2. mortgage principal'],
-        'f1098_box3_origination_date': ['origination date', 'mortgage origination', 'loan origination', '1098_box3', '3. origin date', 'origin date'],
-        'f1098_box4_refund_interest': ['refund interest', 'overpaid interest', '1098_box4', '4. refund of int', 'refund of int'],
-        'f1098_box5_mortgage_insurance': ['mortgage insurance', 'pmi', 'insurance premiums', '1098_box5', '5. mip', 'mip'],
-        'f1098_box6_points_paid': ['points paid', 'points', '1098_box6', '6. points'],
-        'f1098_box8_property_address': ['1098 property address', '1098_box8', '8. address'],
-        'f1098_box9_num_properties': ['number of properties', 'num properties', '1098_box9', '9. no. of prop', 'no. of prop'],
-        'f1098_box10_other': ['1098 other', '1098_box10', '10. prop taxes', 'prop taxes'],
-        'f1098_box11_acquisition_date': ['acquisition date', 'property acquisition', '1098_box11', '11 acq date', 'acq date'],
-    }
-
-    # Add form-type-specific aliases for generic BOX1, BOX2, etc. column names
-    # These only apply when we know the form type from the sheet name
-    if form_type == '1099-S':
-        # 1099-S uses generic BOX1-BOX6 columns
-        # Also add 'address' here (not globally) to avoid conflict with recipient_address1
-        form_specific = {
-            's_box1_date_closing': ['box1', 'box 1'],
-            's_box2_gross_proceeds': ['box2', 'box 2'],
-            's_box3_property_address': ['box3', 'box 3', 'address'],
-            's_box4_property_services': ['box4', 'box 4'],
-            's_box5_foreign_person': ['box5', 'box 5'],
-            's_box6_buyers_tax': ['box6', 'box 6'],
-        }
-        for target, alias_list in form_specific.items():
-            if target not in hardcoded_aliases:
-                hardcoded_aliases[target] = []
-            hardcoded_aliases[target].extend(alias_list)
-    elif form_type == '1098':
-        # 1098 uses generic BOX1-BOX11 columns
-        # Also add 'address' here (not globally) to avoid conflict with recipient_address1
-        form_specific = {
-            'f1098_box1_mortgage_interest': ['box1', 'box 1'],
-            'f1098_box2_outstanding_principal': ['box2', 'box 2'],
-            'f1098_box3_origination_date': ['box3', 'box 3'],
-            'f1098_box4_refund_interest': ['box4', 'box 4'],
-            'f1098_box5_mortgage_insurance': ['box5', 'box 5'],
-            'f1098_box6_points_paid': ['box6', 'box 6'],
-            # Box 7 is "same address" checkbox - not currently mapped
-            'f1098_box8_property_address': ['box8', 'box 8', 'address'],
-            'f1098_box9_num_properties': ['box9', 'box 9'],
-            'f1098_box10_other': ['box10', 'box 10'],
-            'f1098_box11_acquisition_date': ['box11', 'box 11'],
-        }
-        for target, alias_list in form_specific.items():
-            if target not in hardcoded_aliases:
-                hardcoded_aliases[target] = []
-            hardcoded_aliases[target].extend(alias_list)
+        matcher = _alias_registry.matcher(form_type)
+    else:
+        matcher = AliasMatcher(merge_aliases(aliases, form_type))
+    return matcher.map_columns(df_columns)
 
-    # Merge hardcoded with database aliases
-    for target, alias_list in hardcoded_aliases.items():
-        if target not in aliases:
-            aliases[target] = []
-        for a in alias_list:
-            if a.lower() not in [x.lower() for x in aliases[target]]:
-                aliases[target].append(a.lower())
-
-    mapping = {}
-    df_cols_lower = {col.lower().strip(): col for col in df_columns}
-
-    # Also try with underscores replaced by spaces
-    df_cols_normalized = {}
-    for col in df_columns:
-        normalized = col.lower().strip().replace('_', ' ')
-        df_cols_normalized[normalized] = col
-        df_cols_normalized[col.lower().strip()] = col
-
-    for target_field, alias_list in aliases.items():
-        for alias in alias_list:
-            alias_lower = alias.lower()
-            alias_normalized = alias_lower.replace('_', ' ')
-            # Try exact match first
-            if alias_lower in df_cols_lower:
-                source_col = df_cols_lower[alias_lower]
-                if source_col not in mapping:
-                    mapping[source_col] = target_field
-                break
-            # Try normalized (underscores as spaces)
-            elif alias_normalized in df_cols_normalized:
-                source_col = df_cols_normalized[alias_normalized]
-                if source_col not in mapping:
-                    mapping[source_col] = target_field
-                break
 
-    return mapping
+# =============================================================================
+# WORKBOOK SESSION
+# =============================================================================
+
+FILER_INFO_SHEET = 'filer information'
+
+# Streaming import: rows per chunk, and the upload size that switches it on
+STREAM_CHUNK_ROWS = 2000
+STREAMING_MIN_BYTES = 5 * 1024 * 1024
+
+# Rows per sheet read and normalized for a mapping preview
+PREVIEW_SAMPLE_ROWS = 20
+
+# Strings read_excel/read_csv treat as missing by default
+_NA_STRINGS = {
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND',
+    '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null',
+}
+
+
+def _excel_cell_text(value: Any) -> Optional[str]:
+    """Stringify an openpyxl cell value the way read_excel(dtype=str) does."""
+    if value is None:
+        return None
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    text = str(value)
+    return None if text in _NA_STRINGS else text
+
+
+def _header_names(cells: Tuple[Any, ...]) -> List[str]:
+    """Column names for a header row, deduplicated like pandas ('A', 'A.1')."""
+    names: List[str] = []
+    seen: Dict[str, int] = {}
+    for i, cell in enumerate(cells):
+        name = f'Unnamed: {i}' if cell is None else str(cell)
+        if name in seen:
+            seen[name] += 1
+            name = f'{name}.{seen[name]}'
+        else:
+            seen[name] = 0
+        names.append(name.strip())
+    return names
+
+
+# Uploads are copied to disk in pieces of this size
+UPLOAD_CHUNK_BYTES = 1024 * 1024
+
+
+class SpooledUpload:
+    """
+    An uploaded file written to a temporary file, hashed as it is written.
+
+    Parsers read it from path, so the upload is never held in memory as a
+    whole. Wherever the import service takes file_content, a SpooledUpload
+    can be passed instead of bytes. Closing it (or leaving a with block)
+    deletes the file.
+    """
+
+    def __init__(self, suffix: str = ''):
+        handle, self.path = tempfile.mkstemp(prefix='import-', suffix=suffix)
+        self._file = os.fdopen(handle, 'wb')
+        self._hash = hashlib.sha256()
+        self.size = 0
+        self.sha256: Optional[str] = None
+
+    @classmethod
+    def from_stream(cls, stream: Any, suffix: str = '') -> "SpooledUpload":
+        """Spool a readable binary stream."""
+        upload = cls(suffix)
+        try:
+            while chunk := stream.read(UPLOAD_CHUNK_BYTES):
+                upload.write(chunk)
+        except Exception:
+            upload.close()
+            raise
+        return upload.finish()
+
+    def __enter__(self) -> "SpooledUpload":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def write(self, chunk: bytes) -> None:
+        self._file.write(chunk)
+        self._hash.update(chunk)
+        self.size += len(chunk)
+
+    def finish(self) -> "SpooledUpload":
+        """Flush the file and fix the hash; call once everything is written."""
+        self._file.close()
+        self.sha256 = self._hash.hexdigest()
+        return self
+
+    def close(self) -> None:
+        """Delete the temporary file."""
+        self._file.close()
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+
+# An upload as raw bytes or spooled to disk
+FileContent = Union[bytes, SpooledUpload]
+
+
+def upload_size(file_content: FileContent) -> int:
+    """Size of an upload in bytes."""
+    return file_content.size if isinstance(file_content, SpooledUpload) else len(file_content)
+
+
+def upload_hash(file_content: FileContent) -> str:
+    """SHA-256 of an upload (already computed for a SpooledUpload)."""
+    if isinstance(file_content, SpooledUpload):
+        return file_content.sha256
+    return hashlib.sha256(file_content).hexdigest()
+
+
+class WorkbookSession:
+    """
+    One uploaded file, opened once and shared by every step of an import.
+
+    The XLSX is unzipped and parsed into a pd.ExcelFile on first use, and
+    each sheet is read into a DataFrame the first time it is asked for.
+    parse_filer_info, get_sheet_names and parse_file all read from the
+    session instead of re-opening the bytes. Cached frames are shared, so
+    callers should not modify them in place. A SpooledUpload is read
+    straight from its file rather than from a copy in memory.
+
+    A session is not thread-safe; a worker thread reads through its own
+    session from reopen().
+    """
+
+    def __init__(self, file_content: FileContent, filename: str):
+        self.file_content = file_content
+        self.filename = filename
+        self.file_ext = Path(filename).suffix.lower()
+        self._excel: Optional[pd.ExcelFile] = None
+        self._frames: Dict[Optional[str], pd.DataFrame] = {}
+        self._filer_frame: Optional[pd.DataFrame] = None
+        self._stream_book = None
+
+    def __enter__(self) -> "WorkbookSession":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def reopen(self) -> "WorkbookSession":
+        """A separate session on the same upload, for reading on another thread."""
+        return WorkbookSession(self.file_content, self.filename)
+
+    def close(self) -> None:
+        """Release the underlying workbook and cached sheets."""
+        if self._excel is not None:
+            self._excel.close()
+            self._excel = None
+        if self._stream_book is not None:
+            self._stream_book.close()
+            self._stream_book = None
+        self._frames.clear()
+        self._filer_frame = None
+
+    def _source(self) -> Any:
+        """Something pandas/openpyxl can read the upload from: its path, or a buffer over the bytes."""
+        from io import BytesIO
+
+        if isinstance(self.file_content, SpooledUpload):
+            return self.file_content.path
+        return BytesIO(self.file_content)
+
+    @property
+    def is_excel(self) -> bool:
+        return self.file_ext in ['.xlsx', '.xls']
+
+    @property
+    def can_stream(self) -> bool:
+        """Whether sheets can be read in chunks (openpyxl read-only mode or the CSV parser)."""
+        return self.file_ext in ['.xlsx', '.csv']
+
+    @property
+    def excel(self) -> pd.ExcelFile:
+        """The parsed workbook (opened on first access)."""
+        if self._excel is None:
+            self._excel = pd.ExcelFile(self._source())
+        return self._excel
+
+    @property
+    def sheet_names(self) -> List[str]:
+        """All sheet names, or [] for CSV."""
+        return list(self.excel.sheet_names) if self.is_excel else []
+
+    @property
+    def filer_sheet_name(self) -> Optional[str]:
+        """Actual name of the 'Filer Information' sheet (case-insensitive), if any."""
+        for sheet in self.sheet_names:
+            if sheet.lower().strip() == FILER_INFO_SHEET:
+                return sheet
+        return None
+
+    @property
+    def data_sheets(self) -> List[str]:
+        """Every sheet except 'Filer Information'."""
+        return [s for s in self.sheet_names if s.lower().strip() != FILER_INFO_SHEET]
+
+    def filer_frame(self) -> Optional[pd.DataFrame]:
+        """The 'Filer Information' sheet as raw label/value rows (no header)."""
+        if self._filer_frame is None and self.filer_sheet_name is not None:
+            self._filer_frame = pd.read_excel(self.excel, sheet_name=self.filer_sheet_name,
+                                              header=None, dtype=str)
+        return self._filer_frame
+
+    def sheet(self, sheet_name: Optional[str] = None) -> pd.DataFrame:
+        """
+        A data sheet as a DataFrame of strings with stripped column names.
+
+        For Excel files with no sheet_name, the first data sheet is used.
+        CSV files have a single unnamed sheet.
+        """
+        if self.is_excel:
+            if sheet_name is None:
+                data_sheets = self.data_sheets
+                sheet_name = data_sheets[0] if data_sheets else self.sheet_names[0]
+        elif self.file_ext == '.csv':
+            sheet_name = None
+        else:
+            raise ValueError(f"Unsupported file type: {self.file_ext}")
+
+        if sheet_name not in self._frames:
+            if self.is_excel:
+                df = pd.read_excel(self.excel, sheet_name=sheet_name, dtype=str)
+            else:
+                df = pd.read_csv(self._source(), dtype=str)
+            # Clean column names
+            df.columns = [str(col).strip() for col in df.columns]
+            self._frames[sheet_name] = df
+        return self._frames[sheet_name]
+
+    def iter_sheet_chunks(self, sheet_name: str, chunk_size: int = STREAM_CHUNK_ROWS) -> Iterator[pd.DataFrame]:
+        """
+        Yield a data sheet as DataFrames of at most chunk_size rows.
+
+        .xlsx sheets are read with openpyxl in read-only mode one row at a
+        time, so memory is bounded by chunk_size rather than sheet size.
+        Columns come from the header row, cells are stringified like
+        read_excel(dtype=str), and the index carries on across chunks so row
+        numbers match sheet(). CSV files (sheet_name is ignored) are read with
+        the C parser in chunks; the pyarrow engine is avoided because it infers
+        types before applying dtype=str and strips leading zeros from ZIPs and
+        TINs. Other formats are sliced from sheet().
+        """
+        if self.file_ext == '.csv':
+            reader = pd.read_csv(self._source(), dtype=str, engine='c', chunksize=chunk_size)
+            with reader:
+                for df in reader:
+                    df.columns = [str(col).strip() for col in df.columns]
+                    yield df
+            return
+
+        if not self.can_stream:
+            df = self.sheet(sheet_name)
+            for start in range(0, len(df), chunk_size):
+                yield df.iloc[start:start + chunk_size]
+            return
+
+        columns, rows = self._stream_rows(sheet_name)
+        if columns is None:
+            return
+
+        buffer: List[List[Optional[str]]] = []
+        start = 0
+        for cells in rows:
+            buffer.append(cells)
+            if len(buffer) >= chunk_size:
+                yield pd.DataFrame(buffer, columns=columns, index=range(start, start + len(buffer)), dtype=object)
+                start += len(buffer)
+                buffer = []
+        if buffer:
+            yield pd.DataFrame(buffer, columns=columns, index=range(start, start + len(buffer)), dtype=object)
+
+    def _stream_rows(self, sheet_name: str) -> Tuple[Optional[List[str]], Iterator[List[Optional[str]]]]:
+        """
+        Header names and a lazy iterator of stringified cell rows for an .xlsx sheet.
+
+        The workbook is opened with openpyxl in read-only mode; columns is
+        None when the sheet has no header row.
+        """
+        import openpyxl
+
+        if self._stream_book is None:
+            self._stream_book = openpyxl.load_workbook(
+                self._source(), read_only=True, data_only=True, keep_links=False
+            )
+        rows = self._stream_book[sheet_name].iter_rows(values_only=True)
+
+        header = next(rows, None)
+        if header is None:
+            return None, iter(())
+        columns = _header_names(header)
+        width = len(columns)
+
+        def cells() -> Iterator[List[Optional[str]]]:
+            for values in rows:
+                row = [_excel_cell_text(v) for v in values[:width]]
+                row.extend([None] * (width - len(row)))
+                yield row
+
+        return columns, cells()
+
+    def head(self, sheet_name: Optional[str] = None, rows: int = 20) -> pd.DataFrame:
+        """
+        The header and first rows of a data sheet, without reading the rest.
+
+        Same columns and cell strings as sheet(). .xlsx sheets are read
+        through openpyxl in read-only mode and CSV/XLS with nrows, so the
+        cost doesn't grow with sheet size. A sheet already loaded by sheet()
+        is sliced instead.
+        """
+        if self.is_excel and sheet_name is None:
+            data_sheets = self.data_sheets
+            sheet_name = data_sheets[0] if data_sheets else self.sheet_names[0]
+        if not self.is_excel:
+            sheet_name = None
+        if sheet_name in self._frames:
+            return self._frames[sheet_name].head(rows)
+
+        if self.file_ext == '.xlsx':
+            columns, cells = self._stream_rows(sheet_name)
+            if columns is None:
+                return pd.DataFrame()
+            return pd.DataFrame(list(islice(cells, rows)), columns=columns, dtype=object)
+        if self.is_excel:
+            df = pd.read_excel(self.excel, sheet_name=sheet_name, dtype=str, nrows=rows)
+        elif self.file_ext == '.csv':
+            df = pd.read_csv(self._source(), dtype=str, nrows=rows)
+        else:
+            raise ValueError(f"Unsupported file type: {self.file_ext}")
+        df.columns = [str(col).strip() for col in df.columns]
+        return df
 
 
 # =============================================================================
@@ -592,35 +1590,31 @@ class ImportService:
     def __init__(self):
         self.client = get_supabase_client()
 
-    def parse_filer_info(self, file_content: bytes, filename: str) -> Optional[Dict[str, Any]]:
+    def parse_filer_info(
+        self,
+        file_content: FileContent,
+        filename: str,
+        workbook: Optional[WorkbookSession] = None
+    ) -> Optional[Dict[str, Any]]:
         """
         Parse filer information from the 'Filer Information' sheet.
 
+        Pass workbook to reuse an already-open upload.
+
         Returns filer data dict or None if sheet doesn't exist.
         """
-        from io import BytesIO
-
-        file_ext = Path(filename).suffix.lower()
-        if file_ext not in ['.xlsx', '.xls']:
+        workbook = workbook or WorkbookSession(file_content, filename)
+        if not workbook.is_excel:
             return None
 
         try:
             # Read the Filer Information sheet (no header - it's label/value format)
-            xl = pd.ExcelFile(BytesIO(file_content))
-
-            # Case-insensitive search for filer information sheet
-            filer_sheet_name = None
-            for sheet in xl.sheet_names:
-                if sheet.lower().strip() == 'filer information':
-                    filer_sheet_name = sheet
-                    break
-
-            if filer_sheet_name is None:
-                print(f"DEBUG: Sheets found: {xl.sheet_names}")
+            if workbook.filer_sheet_name is None:
+                print(f"DEBUG: Sheets found: {workbook.sheet_names}")
                 print(f"DEBUG: No 'Filer Information' sheet found")
                 return None
 
-            df = pd.read_excel(xl, sheet_name=filer_sheet_name, header=None, dtype=str)
+            df = workbook.filer_frame()
 
             # Parse the label/value pairs
             # The sheet has labels in column 0 and values in column 1
@@ -740,17 +1734,16 @@ class ImportService:
 
         return None
 
-    def get_sheet_names(self, file_content: bytes, filename: str) -> List[str]:
+    def get_sheet_names(
+        self,
+        file_content: FileContent,
+        filename: str,
+        workbook: Optional[WorkbookSession] = None
+    ) -> List[str]:
         """Get list of sheet names from an Excel file."""
-        from io import BytesIO
-
-        file_ext = Path(filename).suffix.lower()
-        if file_ext not in ['.xlsx', '.xls']:
-            return []
-
+        workbook = workbook or WorkbookSession(file_content, filename)
         try:
-            xl = pd.ExcelFile(BytesIO(file_content))
-            return xl.sheet_names
+            return workbook.sheet_names
         except Exception:
             return []
 
@@ -758,17 +1751,17 @@ class ImportService:
         self,
         operating_year_id: str,
         filename: str,
-        file_content: bytes,
+        file_content: FileContent,
         filer_id: Optional[str] = None
     ) -> Optional[dict]:
         """Create a new import batch."""
-        file_hash = hashlib.sha256(file_content).hexdigest()
+        file_hash = upload_hash(file_content)
 
         batch_data = {
             'operating_year_id': operating_year_id,
             'filer_id': filer_id,
             'filename': filename,
-            'file_size': len(file_content),
+            'file_size': upload_size(file_content),
             'file_hash': file_hash,
             'status': 'uploaded',
         }
@@ -783,42 +1776,29 @@ class ImportService:
                 entity_id=batch['id'],
                 operating_year_id=operating_year_id,
                 filer_id=filer_id,
-                details={'filename': filename, 'size': len(file_content)}
+                details={'filename': filename, 'size': upload_size(file_content)}
             )
 
         return batch
 
-    def parse_file(self, file_content: bytes, filename: str, sheet_name: Optional[str] = None) -> pd.DataFrame:
+    def parse_file(
+        self,
+        file_content: FileContent,
+        filename: str,
+        sheet_name: Optional[str] = None,
+        workbook: Optional[WorkbookSession] = None
+    ) -> pd.DataFrame:
         """
         Parse Excel or CSV file into DataFrame.
 
         Args:
-            file_content: Raw file bytes
+            file_content: Raw file bytes (or a SpooledUpload)
             filename: Original filename (for extension detection)
             sheet_name: For Excel files, which sheet to read (default: first data sheet)
+            workbook: Already-open upload to read from instead of file_content
         """
-        from io import BytesIO
-
-        file_ext = Path(filename).suffix.lower()
-
-        if file_ext in ['.xlsx', '.xls']:
-            xl = pd.ExcelFile(BytesIO(file_content))
-
-            # If no sheet specified, find the first data sheet (skip Filer Information)
-            if sheet_name is None:
-                data_sheets = [s for s in xl.sheet_names if s != 'Filer Information']
-                sheet_name = data_sheets[0] if data_sheets else xl.sheet_names[0]
-
-            df = pd.read_excel(xl, sheet_name=sheet_name, dtype=str)
-        elif file_ext == '.csv':
-            df = pd.read_csv(BytesIO(file_content), dtype=str)
-        else:
-            raise ValueError(f"Unsupported file type: {file_ext}")
-
-        # Clean column names
-        df.columns = [str(col).strip() for col in df.columns]
-
-        return df
+        workbook = workbook or WorkbookSession(file_content, filename)
+        return workbook.sheet(sheet_name)
 
     def detect_form_type_from_sheet_name(self, sheet_name: str) -> str:
         """
@@ -848,11 +1828,73 @@ class ImportService:
             # Default based on content detection during normalization
             return "1099-NEC"
 
+    def preview_file(
+        self,
+        file_content: FileContent,
+        filename: str,
+        sample_rows: int = PREVIEW_SAMPLE_ROWS,
+        workbook: Optional[WorkbookSession] = None
+    ) -> Dict[str, Any]:
+        """
+        Preview the column mapping of every data sheet without importing anything.
+
+        Only the header and first sample_rows rows of each sheet are read
+        (see WorkbookSession.head). Each sheet gets the auto-detected
+        mapping and its sample normalized with it, so the mapping can be
+        checked before the full file is parsed and staged. Nothing is
+        written to the database.
+
+        Returns dict with filer_data and a 'sheets' list of:
+        - sheet_name (None for CSV), form_type, columns
+        - suggested_mapping {source_column: target_field}, unmapped_columns
+        - sample_rows: raw rows; normalized_rows: the same rows normalized
+        - errors: normalization/validation errors for the sample, each with row_number
+        """
+        workbook = workbook or WorkbookSession(file_content, filename)
+        sheet_names: List[Optional[str]] = workbook.data_sheets if workbook.is_excel else [None]
+        result: Dict[str, Any] = {
+            'filer_data': self.parse_filer_info(file_content, filename, workbook=workbook),
+            'sheets': []
+        }
+
+        for sheet_name in sheet_names:
+            form_type = self.detect_form_type_from_sheet_name(sheet_name) if sheet_name else None
+            df = workbook.head(sheet_name, sample_rows).dropna(how='all')
+            columns = list(df.columns)
+            mapping = auto_map_columns(columns, form_type=form_type)
+
+            sheet_preview = {
+                'sheet_name': sheet_name,
+                'form_type': form_type,
+                'columns': columns,
+                'suggested_mapping': mapping,
+                'unmapped_columns': [c for c in columns if c not in mapping],
+                'sample_rows': [],
+                'normalized_rows': [],
+                'errors': [],
+            }
+            result['sheets'].append(sheet_preview)
+            if df.empty:
+                continue
+
+            normalized, errors = normalize_columns(df, {v: k for k, v in mapping.items()})
+            sheet_preview['sample_rows'] = df.astype(object).where(df.notna(), None).to_dict('records')
+            sheet_preview['normalized_rows'] = normalized.to_dict('records')
+            sheet_preview['errors'] = [
+                {'row_number': idx + 2, **error}  # +2 for header row and 0-index
+                for idx, row_errors in errors_by_row(errors).items()
+                for error in row_errors
+            ]
+
+        return result
+
     def import_all_sheets(
         self,
-        file_content: bytes,
+        file_content: FileContent,
         filename: str,
         operating_year_id: str,
+        workbook: Optional[WorkbookSession] = None,
+        progress: Optional[ProgressCallback] = None,
     ) -> Dict[str, Any]:
         """
         Import ALL data sheets from a workbook at once.
@@ -862,8 +1904,14 @@ class ImportService:
         3. For each data sheet, create a batch and import rows
         4. Auto-detect form type from sheet name
 
+        The workbook is opened once (or pass an open WorkbookSession) and
+        shared by every step. Sheets are staged concurrently (see
+        _run_sheets); each entry of sheets_imported has its elapsed_seconds.
+        progress, if given, is called after each sheet.
+
         Returns dict with filer info and list of batch results per sheet.
         """
+        workbook = workbook or WorkbookSession(file_content, filename)
         result: Dict[str, Any] = {
             'filer_id': None,
             'filer_data': None,
@@ -875,7 +1923,7 @@ class ImportService:
 
         # Step 1: Parse filer information
         print(f"DEBUG import_all_sheets: Starting import for '{filename}'")
-        filer_data = self.parse_filer_info(file_content, filename)
+        filer_data = self.parse_filer_info(file_content, filename, workbook=workbook)
         result['filer_data'] = filer_data
         print(f"DEBUG import_all_sheets: Filer data parsed: {filer_data}")
 
@@ -888,76 +1936,40 @@ class ImportService:
             print(f"DEBUG import_all_sheets: Filer ID: {filer_id}, created: {result['filer_created']}")
         else:
             # Get sheet names to help with error message
-            sheets = self.get_sheet_names(file_content, filename)
+            sheets = self.get_sheet_names(file_content, filename, workbook=workbook)
             result['errors'].append(f"No 'Filer Information' sheet found. Sheets in workbook: {sheets}")
             return result
 
         # Step 3: Get all data sheets
-        sheets = self.get_sheet_names(file_content, filename)
+        sheets = self.get_sheet_names(file_content, filename, workbook=workbook)
         print(f"DEBUG import_all_sheets: All sheets found: {sheets}")
-        data_sheets = [s for s in sheets if s.lower().strip() != 'filer information']
+        data_sheets = [s for s in sheets if s.lower().strip() != FILER_INFO_SHEET]
         print(f"DEBUG import_all_sheets: Data sheets: {data_sheets}")
 
         if not data_sheets:
             result['errors'].append(f"No data sheets found in workbook. Sheets present: {sheets}")
             return result
 
-        # Step 4: Process each data sheet
-        for sheet_name in data_sheets:
-            sheet_result = {
-                'sheet_name': sheet_name,
-                'form_type': self.detect_form_type_from_sheet_name(sheet_name),
-                'batch_id': None,
-                'row_count': 0,
-                'error': None
-            }
-
-            try:
-                print(f"DEBUG: Processing sheet '{sheet_name}'")
-                df = self.parse_file(file_content, filename, sheet_name=sheet_name)
-                print(f"DEBUG: Sheet '{sheet_name}' has {len(df)} rows, columns: {list(df.columns)}")
-
-                # Skip empty sheets (also check if all rows are NaN)
-                if len(df) == 0:
-                    sheet_result['error'] = "Sheet is empty"
-                    result['sheets_imported'].append(sheet_result)
-                    continue
-
-                # Also skip sheets where first row (first data row) is all NaN
-                if df.iloc[0].isna().all():
-                    # Drop rows that are completely empty
-                    df = df.dropna(how='all')
-                    print(f"DEBUG: After dropping empty rows, '{sheet_name}' has {len(df)} rows")
-                    if len(df) == 0:
-                        sheet_result['error'] = "Sheet has no data rows"
-                        result['sheets_imported'].append(sheet_result)
-                        continue
-
-                sheet_result['row_count'] = len(df)
-                result['total_rows'] += len(df)
-
-                # Create batch for this sheet
-                batch = self.create_batch(
-                    operating_year_id=operating_year_id,
-                    filename=f"{filename} [{sheet_name}]",
-                    file_content=file_content,
-                    filer_id=filer_id
-                )
-
-                if batch:
-                    sheet_result['batch_id'] = batch['id']
-
-                    # Store raw rows
-                    self.store_raw_rows(batch['id'], df)
-
-                    # Auto-map columns (pass form_type for form-specific BOX mappings)
-                    mapping = auto_map_columns(list(df.columns), form_type=sheet_result['form_type'])
-                    self.apply_column_mapping(batch['id'], mapping)
-
-            except Exception as e:
-                sheet_result['error'] = str(e)
-
-            result['sheets_imported'].append(sheet_result)
+        # Step 4: Process the data sheets, several at once
+        sheets_done: List[Dict[str, Any]] = []
+        progress_lock = threading.Lock()
+
+        def stage_sheet(sheet_name: str, book: WorkbookSession) -> Dict[str, Any]:
+            sheet_result = self._stage_sheet(sheet_name, book, file_content, filename, operating_year_id, filer_id)
+            if progress:
+                with progress_lock:
+                    sheets_done.append(sheet_result)
+                    progress({
+                        'sheets_total': len(data_sheets),
+                        'sheets_done': len(sheets_done),
+                        'current_sheet': sheet_name,
+                        'rows_processed': sum(sheet['row_count'] for sheet in sheets_done),
+                        'errors_so_far': sum(1 for sheet in sheets_done if sheet['error'])
+                    })
+            return sheet_result
+
+        result['sheets_imported'] = self._run_sheets(workbook, data_sheets, stage_sheet)
+        result['total_rows'] = sum(sheet['row_count'] for sheet in result['sheets_imported'])
 
         log_activity(
             action='import_multi_sheet',
@@ -974,11 +1986,109 @@ class ImportService:
 
         return result
 
+    def _stage_sheet(
+        self,
+        sheet_name: str,
+        workbook: WorkbookSession,
+        file_content: FileContent,
+        filename: str,
+        operating_year_id: str,
+        filer_id: str
+    ) -> Dict[str, Any]:
+        """Stage one sheet of import_all_sheets: a batch with its raw rows and column mapping."""
+        started = time.perf_counter()
+        sheet_result = {
+            'sheet_name': sheet_name,
+            'form_type': self.detect_form_type_from_sheet_name(sheet_name),
+            'batch_id': None,
+            'row_count': 0,
+            'error': None,
+            'elapsed_seconds': 0.0
+        }
+
+        try:
+            print(f"DEBUG: Processing sheet '{sheet_name}'")
+            df = self.parse_file(file_content, filename, sheet_name=sheet_name, workbook=workbook)
+            print(f"DEBUG: Sheet '{sheet_name}' has {len(df)} rows, columns: {list(df.columns)}")
+
+            # Skip empty sheets (also check if all rows are NaN)
+            if len(df) == 0:
+                sheet_result['error'] = "Sheet is empty"
+                return sheet_result
+
+            # Also skip sheets where first row (first data row) is all NaN
+            if df.iloc[0].isna().all():
+                # Drop rows that are completely empty
+                df = df.dropna(how='all')
+                print(f"DEBUG: After dropping empty rows, '{sheet_name}' has {len(df)} rows")
+                if len(df) == 0:
+                    sheet_result['error'] = "Sheet has no data rows"
+                    return sheet_result
+
+            sheet_result['row_count'] = len(df)
+
+            # Create batch for this sheet
+            batch = self.create_batch(
+                operating_year_id=operating_year_id,
+                filename=f"{filename} [{sheet_name}]",
+                file_content=file_content,
+                filer_id=filer_id
+            )
+
+            if batch:
+                sheet_result['batch_id'] = batch['id']
+
+                # Store raw rows
+                self.store_raw_rows(batch['id'], df)
+
+                # Auto-map columns (pass form_type for form-specific BOX mappings)
+                mapping = auto_map_columns(list(df.columns), form_type=sheet_result['form_type'])
+                self.apply_column_mapping(batch['id'], mapping)
+
+        except Exception as e:
+            sheet_result['error'] = str(e)
+
+        finally:
+            sheet_result['elapsed_seconds'] = round(time.perf_counter() - started, 3)
+
+        return sheet_result
+
+    def _run_sheets(
+        self,
+        workbook: WorkbookSession,
+        sheet_names: List[str],
+        process: Callable[[str, WorkbookSession], Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Run process(sheet_name, workbook) for every sheet; results come back in sheet order.
+
+        Sheets only share the filer, so up to IMPORT_SHEET_WORKERS of them run
+        at once, each reading through its own WorkbookSession. Most of a
+        sheet's time is spent waiting on the database, which threads overlap
+        well. process should catch its own errors.
+        """
+        workers = min(IMPORT_SHEET_WORKERS, len(sheet_names))
+        if workers <= 1:
+            return [process(sheet_name, workbook) for sheet_name in sheet_names]
+
+        def run(sheet_name: str) -> Dict[str, Any]:
+            with workbook.reopen() as book:
+                return process(sheet_name, book)
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="import-sheet") as pool:
+            return list(pool.map(run, sheet_names))
+
     def quick_import(
         self,
-        file_content: bytes,
+        file_content: FileContent,
         filename: str,
         operating_year_id: str,
+        workbook: Optional[WorkbookSession] = None,
+        streaming: Optional[bool] = None,
+        filer_id: Optional[str] = None,
+        progress: Optional[ProgressCallback] = None,
+        force: bool = False,
+        delete_missing: bool = False,
     ) -> Dict[str, Any]:
         """
         Quick import: Parse, validate, and promote in ONE step.
@@ -989,308 +2099,198 @@ class ImportService:
         Returns dict with:
         - filer_id, filer_data, filer_created
         - forms_created: list of created form records
+        - forms_updated: list of existing form records that were overwritten
         - recipients_created: count
         - errors: list of any validation errors (row-level)
         - warnings: list of warnings
+        - elapsed_seconds, rows_per_second: import throughput
+        - diff: recipients/forms created, updated, unchanged and deleted
+
+        The workbook is opened once (or pass an open WorkbookSession) and
+        shared by every step.
+
+        With streaming, each .xlsx sheet is read, normalized and written in
+        chunks of STREAM_CHUNK_ROWS rows so memory doesn't grow with sheet
+        size. The default (None) streams CSV files and .xlsx uploads of
+        STREAMING_MIN_BYTES or more. Streamed results list form IDs only in
+        forms_created / forms_updated.
+
+        CSV files have no 'Filer Information' sheet, so they need an existing
+        filer_id; the form type is detected from the file name. For workbooks
+        filer_id is only used when the filer sheet is missing.
+
+        Data sheets are processed concurrently (see _run_sheets) and their
+        results merged in sheet order; sheets_imported lists each sheet's
+        row_count, imported_rows, error and elapsed_seconds. A recipient that
+        appears on several sheets is still created only once. Rows for the
+        same recipient or form on several sheets are applied in sheet and
+        row order, and duplicates flagged in that order, whichever sheet
+        finishes first.
+
+        progress, if given, is called after every chunk and every sheet with
+        sheets_total / sheets_done / current_sheet / rows_processed /
+        errors_so_far.
+
+        Every import is recorded in import_history with the file's SHA-256.
+        Uploading the same file again for the same year (and filer) returns
+        the earlier outcome without parsing or writing anything, with
+        duplicate_of set to the import_history ID. Pass force=True to import
+        it again anyway.
+
+        Re-imports only write what changed. Each recipient and form carries a
+        content_hash of the values the importer last wrote; rows that hash the
+        same are left alone (no write, no updated_at change) and counted as
+        unchanged in diff. With delete_missing, draft/ready forms of this
+        filer and year that an earlier import created but the file no longer
+        contains are deleted. Nothing is deleted if any row or sheet failed.
         """
+        started = time.perf_counter()
+        workbook = workbook or WorkbookSession(file_content, filename)
+        is_csv = workbook.file_ext == '.csv'
+        if streaming is None:
+            streaming = is_csv or (workbook.can_stream and upload_size(file_content) >= STREAMING_MIN_BYTES)
         result: Dict[str, Any] = {
             'filer_id': None,
             'filer_data': None,
             'filer_created': False,
             'forms_created': [],
+            'forms_updated': [],
             'recipients_created': 0,
             'total_rows': 0,
             'imported_rows': 0,
             'errors': [],
             'warnings': [],
-            'row_errors': []  # Individual row errors
+            'row_errors': [],  # Individual row errors
+            'sheets_imported': [],  # Per-sheet rows, error and elapsed_seconds
+            'elapsed_seconds': 0.0,
+            'rows_per_second': 0.0,
+            'duplicate_of': None,
+            'previous_import_at': None,
+            'diff': {
+                'recipients_created': 0,
+                'recipients_updated': 0,
+                'recipients_unchanged': 0,
+                'forms_created': 0,
+                'forms_updated': 0,
+                'forms_unchanged': 0,
+                'forms_deleted': 0
+            }
         }
 
+        # Step 0: Same file already imported? Hand back that import's outcome
+        file_hash = upload_hash(file_content)
+        previous = None if force else self.find_previous_import(file_hash, operating_year_id, filer_id)
+        if previous:
+            print(f"DEBUG quick_import: '{filename}' already imported ({previous['id']}), skipping")
+            stored = previous.get('errors') or {}
+            filer = self.client.table('filers').select('*').eq('id', previous['filer_id']).execute().data
+            result.update({
+                'filer_id': previous['filer_id'],
+                'filer_data': filer[0] if filer else None,
+                'total_rows': stored.get('total_rows', 0),
+                'errors': stored.get('errors', []),
+                'row_errors': stored.get('row_errors', []),
+                'duplicate_of': previous['id'],
+                'previous_import_at': previous['created_at']
+            })
+            return result
+
         # Step 1: Parse filer information
         print(f"DEBUG quick_import: Starting import for '{filename}'")
-        filer_data = self.parse_filer_info(file_content, filename)
+        filer_data = None if is_csv else self.parse_filer_info(file_content, filename, workbook=workbook)
         result['filer_data'] = filer_data
 
-        if not filer_data:
-            sheets = self.get_sheet_names(file_content, filename)
-            result['errors'].append(f"No 'Filer Information' sheet found. Sheets in workbook: {sheets}")
+        if not filer_data and filer_id:
+            # No filer sheet: use the filer the caller picked
+            existing = self.client.table('filers').select('*').eq('id', filer_id).execute()
+            if not existing.data:
+                result['errors'].append(f"Filer not found: {filer_id}")
+                return result
+            result['filer_data'] = existing.data[0]
+            result['filer_id'] = filer_id
+        elif not filer_data:
+            if is_csv:
+                result['errors'].append("CSV imports need a filer_id (CSV files have no 'Filer Information' sheet)")
+            else:
+                sheets = self.get_sheet_names(file_content, filename, workbook=workbook)
+                result['errors'].append(f"No 'Filer Information' sheet found. Sheets in workbook: {sheets}")
             return result
+        else:
+            # Step 2: Create/update filer
+            existing = self.client.table('filers').select('id').eq('tin', filer_data.get('tin', '')).execute()
+            result['filer_created'] = len(existing.data) == 0
+            filer_id = self.find_or_create_filer(filer_data)
+            result['filer_id'] = filer_id
 
-        # Step 2: Create/update filer
-        existing = self.client.table('filers').select('id').eq('tin', filer_data.get('tin', '')).execute()
-        result['filer_created'] = len(existing.data) == 0
-        filer_id = self.find_or_create_filer(filer_data)
-        result['filer_id'] = filer_id
-
-        if not filer_id:
-            result['errors'].append("Failed to create filer record")
-            return result
+            if not filer_id:
+                result['errors'].append("Failed to create filer record")
+                return result
 
-        # Step 3: Get all data sheets
-        sheets = self.get_sheet_names(file_content, filename)
-        data_sheets = [s for s in sheets if s.lower().strip() != 'filer information']
+        # Step 3: Get all data sheets (a CSV is one sheet named after the file)
+        if is_csv:
+            sheets = data_sheets = [Path(filename).stem]
+        else:
+            sheets = self.get_sheet_names(file_content, filename, workbook=workbook)
+            data_sheets = [s for s in sheets if s.lower().strip() != FILER_INFO_SHEET]
 
         if not data_sheets:
             result['errors'].append(f"No data sheets found. Sheets present: {sheets}")
             return result
 
-        # Step 4: Process each data sheet directly to forms
-        for sheet_name in data_sheets:
-            try:
-                df = self.parse_file(file_content, filename, sheet_name=sheet_name)
-
-                # Skip empty sheets
-                if len(df) == 0:
-                    continue
+        # Recipients and forms already on file, to diff the rows against
+        existing = self._load_existing_records(filer_id, operating_year_id)
+
+        # Step 4: Process the data sheets directly to forms, several at once.
+        # Each sheet collects its own counts and errors; they're merged below.
+        parts = {sheet_name: self._new_sheet_part(sheet_name, index) for index, sheet_name in enumerate(data_sheets)}
+        progress_lock = threading.Lock()
+
+        def report(sheet_name: str) -> None:
+            if progress:
+                with progress_lock:
+                    progress({
+                        'sheets_total': len(data_sheets),
+                        'sheets_done': sum(1 for part in parts.values() if part['done']),
+                        'current_sheet': sheet_name,
+                        'rows_processed': sum(part['total_rows'] for part in parts.values()),
+                        'errors_so_far': sum(skipped_rows(part['row_errors']) for part in parts.values())
+                    })
+
+        def import_sheet(sheet_name: str, book: WorkbookSession) -> Dict[str, Any]:
+            part = parts[sheet_name]
+            self._quick_import_sheet(
+                part, book, streaming, filer_id, operating_year_id, existing,
+                lambda: report(sheet_name)
+            )
+            return part
+
+        for part in self._run_sheets(workbook, data_sheets, import_sheet):
+            self._flag_duplicate_rows(part, existing)
+            result['sheets_imported'].append(part['sheet'])
+            result['errors'].extend(part['errors'])
+            result['row_errors'].extend(part['row_errors'])
+            for key in ('total_rows', 'imported_rows', 'recipients_created'):
+                result[key] += part[key]
+
+        self._count_changes(existing, result)
+
+        if delete_missing:
+            if result['errors'] or skipped_rows(result['row_errors']):
+                result['warnings'].append(
+                    "Forms missing from the file were not deleted because some rows could not be imported"
+                )
+            else:
+                self._delete_missing_forms(existing, result)
 
-                # Drop completely empty rows
-                df = df.dropna(how='all')
-                if len(df) == 0:
-                    continue
+        result['diff']['recipients_created'] = result['recipients_created']
+        result['diff']['forms_created'] = len(result['forms_created'])
+        result['diff']['forms_updated'] = len(result['forms_updated'])
 
-                # Detect form type from sheet name
-                form_type = self.detect_form_type_from_sheet_name(sheet_name)
-
-                # Get column mapping (pass form_type for form-specific BOX mappings)
-                mapping = auto_map_columns(list(df.columns), form_type=form_type)
-                reverse_map = {v: k for k, v in mapping.items()}
-
-                def get_raw(row_data, field):
-                    source_col = reverse_map.get(field)
-                    return row_data.get(source_col) if source_col else None
-
-                # Process each row
-                for idx, row in df.iterrows():
-                    result['total_rows'] += 1
-                    row_data = row.to_dict()
-                    row_data = {k: (None if pd.isna(v) else v) for k, v in row_data.items()}
-                    row_num = idx + 2  # Account for header and 0-index
-
-                    row_errors = []
-
-                    # Normalize fields
-                    name, errs = normalize_name(get_raw(row_data, 'recipient_name'))
-                    row_errors.extend(errs)
-
-                    # Name Line 2 (optional)
-                    name_line_2_raw = get_raw(row_data, 'recipient_name_line2')
-                    name_line_2 = None
-                    if name_line_2_raw and not pd.isna(name_line_2_raw):
-                        name_line_2, errs = normalize_name(name_line_2_raw)
-                        row_errors.extend(errs)
-
-                    tin, tin_type, errs = normalize_tin(get_raw(row_data, 'recipient_tin'))
-                    row_errors.extend(errs)
-
-                    # Check if TIN type matches entity type
-                    if name and tin_type:
-                        is_business_name = detect_business_entity(name)
-                        if is_business_name and tin_type == 'SSN':
-                            row_errors.append({
-                                'field': 'recipient_tin',
-                                'code': 'TIN_TYPE_MISMATCH',
-                                'message': f'Name "{name}" appears to be a business (LLC/Inc/Corp) but TIN type is SSN. Should be EIN.',
-                                'severity': 'warning'
-                            })
-                        elif not is_business_name and tin_type == 'EIN':
-                            row_errors.append({
-                                'field': 'recipient_tin',
-                                'code': 'TIN_TYPE_MISMATCH',
-                                'message': f'Name "{name}" appears to be an individual but TIN type is EIN. Should be SSN.',
-                                'severity': 'warning'
-                            })
-
-                    address1, errs = normalize_address(get_raw(row_data, 'recipient_address1'))
-                    row_errors.extend(errs)
-
-                    address2, _ = normalize_address(get_raw(row_data, 'recipient_address2'))
-
-                    city, errs = normalize_city(get_raw(row_data, 'recipient_city'))
-                    row_errors.extend(errs)
-
-                    state, errs = normalize_state(get_raw(row_data, 'recipient_state'))
-                    row_errors.extend(errs)
-
-                    zip_code, errs = normalize_zip(get_raw(row_data, 'recipient_zip'))
-                    row_errors.extend(errs)
-
-                    # Check for critical errors
-                    critical_errors = [e for e in row_errors if e['severity'] == 'error']
-                    if critical_errors:
-                        result['row_errors'].append({
-                            'sheet': sheet_name,
-                            'row': row_num,
-                            'name': name or get_raw(row_data, 'recipient_name'),
-                            'errors': critical_errors
-                        })
-                        continue  # Skip this row
-
-                    # Normalize amounts based on form type
-                    nec_box1, _ = normalize_amount(get_raw(row_data, 'nec_box1'), 'nec_box1')
-                    nec_box4, _ = normalize_amount(get_raw(row_data, 'nec_box4'), 'nec_box4')
-                    misc_box1, _ = normalize_amount(get_raw(row_data, 'misc_box1'), 'misc_box1')
-
-                    # 1099-S fields
-                    s_box1_date, _ = normalize_date(get_raw(row_data, 's_box1_date_closing'), 's_box1_date_closing')
-                    s_box2_proceeds, _ = normalize_amount(get_raw(row_data, 's_box2_gross_proceeds'), 's_box2_gross_proceeds')
-                    s_box3_address = get_raw(row_data, 's_box3_property_address')
-                    if s_box3_address and not pd.isna(s_box3_address):
-                        s_box3_address = str(s_box3_address).strip()
-                    else:
-                        s_box3_address = None
-                    s_box4_services, _ = normalize_boolean(get_raw(row_data, 's_box4_property_services'), 's_box4_property_services')
-                    s_box5_foreign, _ = normalize_boolean(get_raw(row_data, 's_box5_foreign_person'), 's_box5_foreign_person')
-                    s_box6_tax, _ = normalize_amount(get_raw(row_data, 's_box6_buyers_tax'), 's_box6_buyers_tax')
-
-                    # 1098 fields
-                    f1098_box1, _ = normalize_amount(get_raw(row_data, 'f1098_box1_mortgage_interest'), 'f1098_box1_mortgage_interest')
-                    f1098_box2, _ = normalize_amount(get_raw(row_data, 'f1098_box2_outstanding_principal'), 'f1098_box2_outstanding_principal')
-                    f1098_box3, _ = normalize_date(get_raw(row_data, 'f1098_box3_origination_date'), 'f1098_box3_origination_date')
-                    f1098_box4, _ = normalize_amount(get_raw(row_data, 'f1098_box4_refund_interest'), 'f1098_box4_refund_interest')
-                    f1098_box5, _ = normalize_amount(get_raw(row_data, 'f1098_box5_mortgage_insurance'), 'f1098_box5_mortgage_insurance')
-                    f1098_box6, _ = normalize_amount(get_raw(row_data, 'f1098_box6_points_paid'), 'f1098_box6_points_paid')
-                    f1098_box8 = get_raw(row_data, 'f1098_box8_property_address')
-                    if f1098_box8 and not pd.isna(f1098_box8):
-                        f1098_box8 = str(f1098_box8).strip()
-                    else:
-                        f1098_box8 = None
-                    f1098_box9 = get_raw(row_data, 'f1098_box9_num_properties')
-                    if f1098_box9 and not pd.isna(f1098_box9):
-                        try:
-                            f1098_box9 = int(float(f1098_box9))
-                        except:
-                            f1098_box9 = None
-                    else:
-                        f1098_box9 = None
-                    f1098_box10, _ = normalize_amount(get_raw(row_data, 'f1098_box10_other'), 'f1098_box10_other')
-                    f1098_box11, _ = normalize_date(get_raw(row_data, 'f1098_box11_acquisition_date'), 'f1098_box11_acquisition_date')
-
-                    # Override form type based on data if needed
-                    if misc_box1 and not nec_box1:
-                        form_type = '1099-MISC'
-                    elif nec_box1 and not misc_box1:
-                        form_type = '1099-NEC'
-                    elif s_box2_proceeds or s_box1_date:
-                        form_type = '1099-S'
-                    elif f1098_box1 or f1098_box2:
-                        form_type = '1098'
-
-                    # Find or create recipient
-                    existing_recip = self.client.table('recipients').select('id').eq('filer_id', filer_id).eq('tin', tin).execute().data
-
-                    if existing_recip:
-                        recipient_id = existing_recip[0]['id']
-                        # Update recipient info
-                        update_data = {
-                            'name': name,
-                            'address1': address1,
-                            'address2': address2,
-                            'city': city,
-                            'state': state,
-                            'zip': zip_code,
-                        }
-                        if name_line_2:
-                            update_data['name_line_2'] = name_line_2
-                        self.client.table('recipients').update(update_data).eq('id', recipient_id).execute()
-                    else:
-                        recip_data = {
-                            'filer_id': filer_id,
-                            'name': name,
-                            'tin': tin,
-                            'tin_type': tin_type or 'SSN',
-                            'address1': address1,
-                            'address2': address2,
-                            'city': city,
-                            'state': state,
-                            'zip': zip_code,
-                        }
-                        if name_line_2:
-                            recip_data['name_line_2'] = name_line_2
-                        recip_result = self.client.table('recipients').insert(recip_data).execute()
-                        recipient_id = recip_result.data[0]['id']
-                        result['recipients_created'] += 1
-
-                    # Check if form already exists for this recipient/filer/year/type
-                    existing_form = self.client.table('forms_1099').select('id').eq(
-                        'filer_id', filer_id
-                    ).eq(
-                        'recipient_id', recipient_id
-                    ).eq(
-                        'operating_year_id', operating_year_id
-                    ).eq(
-                        'form_type', form_type
-                    ).execute().data
-
-                    # Build form data
-                    form_data = {
-                        'status': 'ready',  # Ready for printing/filing
-                    }
+        result['elapsed_seconds'] = round(time.perf_counter() - started, 3)
+        if result['elapsed_seconds'] > 0:
+            result['rows_per_second'] = round(result['total_rows'] / result['elapsed_seconds'], 1)
 
-                    # Add amount fields based on form type
-                    if form_type == '1099-NEC':
-                        form_data['nec_box1'] = nec_box1 or 0
-                        if nec_box4:
-                            form_data['nec_box4'] = nec_box4
-                    elif form_type == '1099-MISC':
-                        form_data['misc_box1'] = misc_box1 or 0
-                        # Add other MISC boxes as needed
-                        for box in ['misc_box2', 'misc_box3', 'misc_box4', 'misc_box5',
-                                   'misc_box6', 'misc_box8', 'misc_box9', 'misc_box10']:
-                            val, _ = normalize_amount(get_raw(row_data, box), box)
-                            if val:
-                                form_data[box] = val
-                    elif form_type == '1099-S':
-                        if s_box1_date:
-                            form_data['s_box1_date_closing'] = s_box1_date
-                        if s_box2_proceeds:
-                            form_data['s_box2_gross_proceeds'] = s_box2_proceeds
-                        if s_box3_address:
-                            form_data['s_box3_property_address'] = s_box3_address
-                        if s_box4_services is not None:
-                            form_data['s_box4_property_services'] = s_box4_services
-                        if s_box5_foreign is not None:
-                            form_data['s_box5_foreign_person'] = s_box5_foreign
-                        if s_box6_tax:
-                            form_data['s_box6_buyers_tax'] = s_box6_tax
-                    elif form_type == '1098':
-                        if f1098_box1:
-                            form_data['f1098_box1_mortgage_interest'] = f1098_box1
-                        if f1098_box2:
-                            form_data['f1098_box2_outstanding_principal'] = f1098_box2
-                        if f1098_box3:
-                            form_data['f1098_box3_origination_date'] = f1098_box3
-                        if f1098_box4:
-                            form_data['f1098_box4_refund_interest'] = f1098_box4
-                        if f1098_box5:
-                            form_data['f1098_box5_mortgage_insurance'] = f1098_box5
-                        if f1098_box6:
-                            form_data['f1098_box6_points_paid'] = f1098_box6
-                        if f1098_box8:
-                            form_data['f1098_box8_property_address'] = f1098_box8
-                        if f1098_box9:
-                            form_data['f1098_box9_num_properties'] = f1098_box9
-                        if f1098_box10:
-                            form_data['f1098_box10_other'] = f1098_box10
-                        if f1098_box11:
-                            form_data['f1098_box11_acquisition_date'] = f1098_box11
-
-                    if existing_form:
-                        # Update existing form
-                        form_result = self.client.table('forms_1099').update(form_data).eq('id', existing_form[0]['id']).execute()
-                        result['forms_created'].append(form_result.data[0])
-                    else:
-                        # Create new form
-                        form_data['filer_id'] = filer_id
-                        form_data['recipient_id'] = recipient_id
-                        form_data['operating_year_id'] = operating_year_id
-                        form_data['form_type'] = form_type
-                        form_result = self.client.table('forms_1099').insert(form_data).execute()
-                        result['forms_created'].append(form_result.data[0])
-
-                    result['imported_rows'] += 1
-
-            except Exception as e:
-                result['errors'].append(f"Error processing sheet '{sheet_name}': {str(e)}")
+        self._record_import(result, operating_year_id, filename, file_content, file_hash)
 
         log_activity(
             action='quick_import',
@@ -1301,21 +2301,590 @@ class ImportService:
             details={
                 'filename': filename,
                 'forms_created': len(result['forms_created']),
+                'forms_updated': len(result['forms_updated']),
                 'recipients_created': result['recipients_created'],
                 'total_rows': result['total_rows'],
                 'imported_rows': result['imported_rows'],
-                'errors': len(result['row_errors'])
+                'errors': skipped_rows(result['row_errors']),
+                'rows_per_second': result['rows_per_second'],
+                'diff': result['diff']
             }
         )
 
         return result
 
+    def _new_sheet_part(self, sheet_name: str, index: int) -> Dict[str, Any]:
+        """
+        Counts and errors of one quick-import sheet, merged into the import result at the end.
+
+        index is the sheet's place among the data sheets; with the row number
+        it gives each row's position in the file (see _quick_import_rows).
+        """
+        return {
+            'index': index,
+            'sheet': {
+                'sheet_name': sheet_name,
+                'form_type': self.detect_form_type_from_sheet_name(sheet_name),
+                'row_count': 0,
+                'imported_rows': 0,
+                'error': None,
+                'elapsed_seconds': 0.0
+            },
+            'done': False,
+            'total_rows': 0,
+            'imported_rows': 0,
+            'recipients_created': 0,
+            'row_errors': [],
+            'errors': [],
+            'duplicate_rows': [],  # (row, tin, name, zip, form_type) for RecipientIndex
+        }
+
+    def _flag_duplicate_rows(self, part: Dict[str, Any], existing: Dict[str, Any]) -> None:
+        """
+        Check a finished sheet's rows against RecipientIndex and add the warnings to its row_errors.
+
+        Called for each sheet in sheet order once all of them are read, so the
+        warnings don't depend on which sheet finished first.
+        """
+        sheet_name = part['sheet']['sheet_name']
+        for row_num, tin, name, zip_code, form_type in part['duplicate_rows']:
+            warnings = existing['duplicates'].check(tin, name, zip_code, form_type, sheet_name, row_num)
+            if warnings:
+                part['row_errors'].append({'sheet': sheet_name, 'row': row_num, 'name': name, 'errors': warnings})
+        part['duplicate_rows'] = []
+        part['row_errors'].sort(key=lambda entry: entry['row'])
+
+    def _quick_import_sheet(
+        self,
+        part: Dict[str, Any],
+        workbook: WorkbookSession,
+        streaming: bool,
+        filer_id: str,
+        operating_year_id: str,
+        existing: Dict[str, Any],
+        report: Callable[[], None]
+    ) -> None:
+        """Quick-import one data sheet into part (see _new_sheet_part); report is called after each chunk."""
+        started = time.perf_counter()
+        sheet = part['sheet']
+        sheet_name = sheet['sheet_name']
+        # Form writes are collected per sheet and upserted in bulk below
+        pending_forms: List[Dict[str, Any]] = []
+        try:
+            form_type = sheet['form_type']
+
+            if streaming:
+                chunks = workbook.iter_sheet_chunks(sheet_name)
+            else:
+                chunks = iter([self.parse_file(
+                    workbook.file_content, workbook.filename, sheet_name=sheet_name, workbook=workbook
+                )])
+
+            reverse_map: Optional[Dict[str, str]] = None
+            for df in chunks:
+                # Drop completely empty rows (skips empty sheets too)
+                df = df.dropna(how='all')
+                if len(df) == 0:
+                    continue
+
+                if reverse_map is None:
+                    # Get column mapping (pass form_type for form-specific BOX mappings)
+                    mapping = auto_map_columns(list(df.columns), form_type=form_type)
+                    reverse_map = {v: k for k, v in mapping.items()}
+
+                form_type = self._quick_import_rows(
+                    df, sheet_name, form_type, reverse_map,
+                    filer_id, operating_year_id, part, pending_forms, existing
+                )
+
+                # In streaming mode each chunk is written before the next is read
+                if streaming and pending_forms:
+                    self._upsert_forms(pending_forms, part, existing, ids_only=streaming)
+                    pending_forms.clear()
+                report()
+
+        except Exception as e:
+            sheet['error'] = str(e)
+            part['errors'].append(f"Error processing sheet '{sheet_name}': {str(e)}")
+
+        # Write whatever was collected, even if the sheet stopped early
+        if pending_forms:
+            self._upsert_forms(pending_forms, part, existing, ids_only=streaming)
+
+        sheet['row_count'] = part['total_rows']
+        sheet['imported_rows'] = part['imported_rows']
+        sheet['elapsed_seconds'] = round(time.perf_counter() - started, 3)
+        part['done'] = True
+        report()
+
+    def find_previous_import(
+        self,
+        file_hash: str,
+        operating_year_id: str,
+        filer_id: Optional[str] = None
+    ) -> Optional[dict]:
+        """
+        Latest import_history entry for an identical file, if it completed.
+
+        The hash covers the workbook's filer sheet, so matching on hash and
+        year identifies the filer too; filer_id narrows it for CSV uploads.
+        Failed, partial and rolled-back imports don't count: uploading the
+        same file again retries the rows that didn't make it.
+        """
+        query = self.client.table('import_history').select('*') \
+            .eq('file_hash', file_hash) \
+            .eq('operating_year_id', operating_year_id) \
+            .eq('status', 'completed')
+        if filer_id:
+            query = query.eq('filer_id', filer_id)
+        rows = query.order('created_at', desc=True).limit(1).execute().data
+        return rows[0] if rows else None
+
+    def _record_import(
+        self,
+        result: Dict[str, Any],
+        operating_year_id: str,
+        filename: str,
+        file_content: FileContent,
+        file_hash: str
+    ) -> None:
+        """
+        Add a quick import's outcome to import_history so a re-upload can be skipped.
+
+        Only the first HISTORY_ROW_ERRORS row_errors are kept, with the total
+        in row_error_count.
+        """
+        if not result['filer_id']:
+            return
+
+        if result['imported_rows'] == 0:
+            status = 'failed'
+        elif result['errors'] or skipped_rows(result['row_errors']):
+            status = 'partial'
+        else:
+            status = 'completed'
+
+        try:
+            self.client.table('import_history').insert({
+                'filer_id': result['filer_id'],
+                'operating_year_id': operating_year_id,
+                'filename': filename,
+                'file_hash': file_hash,
+                'file_size': upload_size(file_content),
+                'records_imported': len(result['forms_created']),
+                'records_updated': len(result['forms_updated']),
+                'records_skipped': skipped_rows(result['row_errors']),
+                'errors': {
+                    'total_rows': result['total_rows'],
+                    'errors': result['errors'],
+                    'row_error_count': len(result['row_errors']),
+                    'row_errors': result['row_errors'][:HISTORY_ROW_ERRORS]
+                },
+                'status': status
+            }).execute()
+        except Exception as e:
+            # The import itself succeeded; only re-upload detection is lost
+            print(f"DEBUG quick_import: Could not record import history: {e}")
+
+    def _load_existing_records(self, filer_id: str, operating_year_id: str) -> Dict[str, Any]:
+        """
+        Recipients and original forms already stored for a filer/year.
+
+        Returns {'recipients': {tin: row}, 'forms': {form key: row}, 'seen': set(),
+        'seen_recipients': set(), 'written_forms': {}, 'recipient_locks': [...], 'forms_lock': Lock, 'form_boxes': {},
+        'duplicates': RecipientIndex} where a form key is (filer_id,
+        recipient_id, operating_year_id, form_type). Rows carry id and
+        content_hash (forms also status). The import keeps this up to date
+        as it writes, adds every form key found in the file to 'seen', the
+        ID of every stored recipient found in the file to 'seen_recipients'
+        and every form it writes to 'written_forms' (see _upsert_forms).
+        A recipient it rewrites keeps its original hash in 'stored_hash'; one
+        it creates is marked 'created'.
+        Sheets imported in parallel hold
+        recipient_locks[hash(tin) % RECIPIENT_LOCK_STRIPES] while they look up
+        and write a recipient, and forms_lock while they write forms.
+        form_boxes holds each written form's boxes with the file position
+        they came from (see _upsert_forms). 'duplicates' starts out with the
+        stored recipients and flags duplicate rows once the file is read.
+        """
+        recipients: Dict[str, dict] = {}
+        for row in self._fetch_all(
+            lambda: self.client.table('recipients').select('id, tin, name, zip, content_hash').eq('filer_id', filer_id),
+            order='created_at'
+        ):
+            recipients.setdefault(row['tin'], row)
+
+        forms: Dict[tuple, dict] = {}
+        for row in self._fetch_all(
+            lambda: self.client.table('forms_1099')
+                .select('id, recipient_id, form_type, status, content_hash')
+                .eq('filer_id', filer_id)
+                .eq('operating_year_id', operating_year_id)
+                .eq('is_correction', False)
+        ):
+            forms[(filer_id, row['recipient_id'], operating_year_id, row['form_type'])] = row
+
+        return {
+            'recipients': recipients,
+            'forms': forms,
+            'seen': set(),
+            'seen_recipients': set(),
+            'written_forms': {},
+            'recipient_locks': [threading.Lock() for _ in range(RECIPIENT_LOCK_STRIPES)],
+            'forms_lock': threading.Lock(),
+            'form_boxes': {},
+            'duplicates': RecipientIndex(recipients.values())
+        }
+
+    def _count_changes(self, existing: Dict[str, Any], result: Dict[str, Any]) -> None:
+        """
+        Fill forms_created/forms_updated and result['diff'], once per recipient and form key.
+
+        A stored recipient or form is updated if what was written differs
+        from what was stored and unchanged otherwise, however many rows,
+        sheets or chunks wrote it. A form is created if it wasn't stored
+        before the import (created recipients are counted as they're inserted).
+        """
+        for recipient in existing['recipients'].values():
+            if recipient['id'] in existing['seen_recipients']:
+                changed = recipient.get('stored_hash', recipient['content_hash']) != recipient['content_hash']
+                result['diff']['recipients_updated' if changed else 'recipients_unchanged'] += 1
+
+        changed = 0
+        for written_form in existing['written_forms'].values():
+            if written_form['before'] is None:
+                result['forms_created'].append(written_form['form'])
+                changed += 1
+            elif written_form['before'] != written_form['after']:
+                result['forms_updated'].append(written_form['form'])
+                changed += 1
+        result['diff']['forms_unchanged'] = len(existing['seen']) - changed
+
+    def _delete_missing_forms(self, existing: Dict[str, Any], result: Dict[str, Any]) -> None:
+        """Delete imported draft/ready forms whose rows are no longer in the file."""
+        stale = [
+            form['id'] for key, form in existing['forms'].items()
+            if key not in existing['seen']
+            and form.get('content_hash')
+            and form.get('status') in DELETABLE_FORM_STATUSES
+        ]
+        for i in range(0, len(stale), FORM_UPSERT_CHUNK_SIZE):
+            deleted = self.client.table('forms_1099').delete() \
+                .in_('id', stale[i:i + FORM_UPSERT_CHUNK_SIZE]) \
+                .in_('status', DELETABLE_FORM_STATUSES) \
+                .execute().data or []
+            result['diff']['forms_deleted'] += len(deleted)
+
+    def _quick_import_rows(
+        self,
+        df: pd.DataFrame,
+        sheet_name: str,
+        form_type: str,
+        reverse_map: Dict[str, str],
+        filer_id: str,
+        operating_year_id: str,
+        result: Dict[str, Any],
+        pending_forms: List[Dict[str, Any]],
+        existing: Dict[str, Any],
+    ) -> str:
+        """
+        Quick-import one sheet (or one chunk of a sheet).
+
+        Creates/updates recipients, appends form rows to pending_forms and
+        records row errors in result. Recipients are looked up in existing
+        (see _load_existing_records) and only written when new or changed.
+        Each row's position in the file is (sheet index, row number). When
+        sheets share a recipient, the values of the row furthest into the
+        file are kept, whichever sheet gets there first. Rows are queued in
+        result['duplicate_rows'] for the duplicate check
+        (_flag_duplicate_rows); duplicate rows are still imported.
+        Returns the form type in effect after the last row, so the next chunk
+        continues where this one left off.
+        """
+        # Normalize the sheet column by column; only rows that come
+        # back with errors are looked at individually
+        normalized, norm_errors = normalize_columns(df, reverse_map)
+        critical_by_row = errors_by_row(norm_errors[
+            (norm_errors['source'].isin(RECIPIENT_FIELDS) & (norm_errors['severity'] == 'error')).to_numpy()
+        ])
+        name_col = reverse_map.get('recipient_name')
+
+        # Process each row
+        for idx, rec in zip(normalized.index, normalized.to_dict('records')):
+            result['total_rows'] += 1
+            row_num = idx + 2  # Account for header and 0-index
+            position = (result['index'], row_num)
+            name = rec['recipient_name']
+
+            # Check for critical errors
+            critical_errors = critical_by_row.get(idx)
+            if critical_errors:
+                raw_name = df.at[idx, name_col] if name_col in df.columns else None
+                result['row_errors'].append({
+                    'sheet': sheet_name,
+                    'row': row_num,
+                    'name': name or (None if pd.isna(raw_name) else raw_name),
+                    'errors': critical_errors
+                })
+                continue  # Skip this row
+
+            name_line_2 = rec['recipient_name_line2']
+            tin, tin_type = rec['recipient_tin'], rec['recipient_tin_type']
+            address1, address2 = rec['recipient_address1'], rec['recipient_address2']
+            city, state, zip_code = rec['recipient_city'], rec['recipient_state'], rec['recipient_zip']
+
+            nec_box1, nec_box4, misc_box1 = rec['nec_box1'], rec['nec_box4'], rec['misc_box1']
+
+            # 1099-S fields
+            s_box1_date = rec['s_box1_date_closing']
+            s_box2_proceeds = rec['s_box2_gross_proceeds']
+            s_box3_address = rec['s_box3_property_address']
+            s_box4_services = rec['s_box4_property_services']
+            s_box5_foreign = rec['s_box5_foreign_person']
+            s_box6_tax = rec['s_box6_buyers_tax']
+
+            # 1098 fields
+            f1098_box1 = rec['f1098_box1_mortgage_interest']
+            f1098_box2 = rec['f1098_box2_outstanding_principal']
+            f1098_box3 = rec['f1098_box3_origination_date']
+            f1098_box4 = rec['f1098_box4_refund_interest']
+            f1098_box5 = rec['f1098_box5_mortgage_insurance']
+            f1098_box6 = rec['f1098_box6_points_paid']
+            f1098_box8 = rec['f1098_box8_property_address']
+            f1098_box9 = rec['f1098_box9_num_properties']
+            f1098_box10 = rec['f1098_box10_other']
+            f1098_box11 = rec['f1098_box11_acquisition_date']
+
+            # Override form type based on data if needed
+            if misc_box1 and not nec_box1:
+                form_type = '1099-MISC'
+            elif nec_box1 and not misc_box1:
+                form_type = '1099-NEC'
+            elif s_box2_proceeds or s_box1_date:
+                form_type = '1099-S'
+            elif f1098_box1 or f1098_box2:
+                form_type = '1098'
+
+            result['duplicate_rows'].append((row_num, tin, name, zip_code, form_type))
+
+            # Find or create recipient
+            recip_values = {
+                'name': name,
+                'address1': address1,
+                'address2': address2,
+                'city': city,
+                'state': state,
+                'zip': zip_code,
+            }
+            if name_line_2:
+                recip_values['name_line_2'] = name_line_2
+            recip_hash = content_hash(recip_values)
+            # Another sheet may be writing the same recipient right now
+            with existing['recipient_locks'][hash(tin) % RECIPIENT_LOCK_STRIPES]:
+                known_recip = existing['recipients'].get(tin)
+
+                if known_recip:
+                    recipient_id = known_recip['id']
+                    if not known_recip.get('created'):
+                        existing['seen_recipients'].add(recipient_id)
+                    written_from = known_recip.get('position')
+                    # Leave it alone if a row further into the file already wrote it
+                    if written_from is None or written_from < position:
+                        known_recip['position'] = position
+                        if known_recip.get('content_hash') != recip_hash:
+                            # Update recipient info
+                            self.client.table('recipients').update({
+                                **recip_values, 'content_hash': recip_hash
+                            }).eq('id', recipient_id).execute()
+                            known_recip.setdefault('stored_hash', known_recip.get('content_hash'))
+                            known_recip['content_hash'] = recip_hash
+                else:
+                    recip_data = {
+                        'filer_id': filer_id,
+                        'tin': tin,
+                        'tin_type': tin_type or 'SSN',
+                        **recip_values,
+                        'content_hash': recip_hash,
+                    }
+                    recip_result = self.client.table('recipients').insert(recip_data).execute()
+                    recipient_id = recip_result.data[0]['id']
+                    existing['recipients'][tin] = {
+                        'id': recipient_id, 'tin': tin, 'content_hash': recip_hash, 'position': position,
+                        'created': True
+                    }
+                    result['recipients_created'] += 1
+
+            # Build form data (keyed on the forms_1099 upsert key)
+            form_data = {
+                'filer_id': filer_id,
+                'recipient_id': recipient_id,
+                'operating_year_id': operating_year_id,
+                'form_type': form_type,
+                'status': 'ready',  # Ready for printing/filing
+            }
+
+            # Add amount fields based on form type
+            if form_type == '1099-NEC':
+                form_data['nec_box1'] = nec_box1 or 0
+                if nec_box4:
+                    form_data['nec_box4'] = nec_box4
+            elif form_type == '1099-MISC':
+                form_data['misc_box1'] = misc_box1 or 0
+                # Add other MISC boxes as needed
+                for box in ['misc_box2', 'misc_box3', 'misc_box4', 'misc_box5',
+                           'misc_box6', 'misc_box8', 'misc_box9', 'misc_box10']:
+                    if rec[box]:
+                        form_data[box] = rec[box]
+            elif form_type == '1099-S':
+                if s_box1_date:
+                    form_data['s_box1_date_closing'] = s_box1_date
+                if s_box2_proceeds:
+                    form_data['s_box2_gross_proceeds'] = s_box2_proceeds
+                if s_box3_address:
+                    form_data['s_box3_property_address'] = s_box3_address
+                if s_box4_services is not None:
+                    form_data['s_box4_property_services'] = s_box4_services
+                if s_box5_foreign is not None:
+                    form_data['s_box5_foreign_person'] = s_box5_foreign
+                if s_box6_tax:
+                    form_data['s_box6_buyers_tax'] = s_box6_tax
+            elif form_type == '1098':
+                if f1098_box1:
+                    form_data['f1098_box1_mortgage_interest'] = f1098_box1
+                if f1098_box2:
+                    form_data['f1098_box2_outstanding_principal'] = f1098_box2
+                if f1098_box3:
+                    form_data['f1098_box3_origination_date'] = f1098_box3
+                if f1098_box4:
+                    form_data['f1098_box4_refund_interest'] = f1098_box4
+                if f1098_box5:
+                    form_data['f1098_box5_mortgage_insurance'] = f1098_box5
+                if f1098_box6:
+                    form_data['f1098_box6_points_paid'] = f1098_box6
+                if f1098_box8:
+                    form_data['f1098_box8_property_address'] = f1098_box8
+                if f1098_box9:
+                    form_data['f1098_box9_num_properties'] = f1098_box9
+                if f1098_box10:
+                    form_data['f1098_box10_other'] = f1098_box10
+                if f1098_box11:
+                    form_data['f1098_box11_acquisition_date'] = f1098_box11
+
+            pending_forms.append({
+                'form': form_data,
+                'sheet': sheet_name,
+                'row': row_num,
+                'position': position,
+                'name': name,
+            })
+
+        return form_type
+
+    def _upsert_forms(
+        self,
+        pending_forms: List[Dict[str, Any]],
+        result: Dict[str, Any],
+        existing: Dict[str, Any],
+        ids_only: bool = False
+    ) -> None:
+        """
+        Write collected quick-import forms as chunked bulk upserts.
+
+        Each entry in pending_forms is {'form', 'sheet', 'row', 'position',
+        'name'}. When the same recipient/year/type appears more than once, the
+        rows' form dicts are merged in file order (position): a later row
+        overwrites the boxes it provides and keeps the ones only an earlier
+        row had (as the old row-by-row partial updates did). The merge takes
+        in the boxes already written for the key by other sheets or chunks
+        (existing['form_boxes']), so the form ends up the same whichever
+        sheet writes first; sheets write forms one at a time (forms_lock).
+        Forms are grouped by column set so that a bulk upsert never resets
+        boxes no row provided. A failed chunk is retried one row at a time so
+        errors land on the offending row in result['row_errors'].
+
+        Every written form is recorded in existing['written_forms'] by key,
+        with the content_hash stored before the import, so
+        _count_changes can count it once however many sheets or chunks
+        wrote it. With ids_only (streaming) only the form's ID is kept.
+
+        Forms whose content_hash matches the one stored in existing are not
+        written at all; they count as imported.
+        """
+        with existing['forms_lock']:
+            # Collapse duplicate keys, remembering every source row for the count
+            by_key: Dict[tuple, List[Dict[str, Any]]] = {}
+            for entry in pending_forms:
+                form = entry['form']
+                key = (form['filer_id'], form['recipient_id'], form['operating_year_id'], form['form_type'])
+                by_key.setdefault(key, []).append(entry)
+
+            merged: Dict[tuple, Dict[str, Any]] = {}
+            groups: Dict[tuple, List[tuple]] = {}
+            for key, entries in by_key.items():
+                # column -> (position, value) of the furthest row that provided it
+                boxes = existing['form_boxes'].setdefault(key, {})
+                for entry in entries:
+                    for column, value in entry['form'].items():
+                        if column not in boxes or boxes[column][0] <= entry['position']:
+                            boxes[column] = (entry['position'], value)
+                form = {column: value for column, (_, value) in boxes.items()}
+                merged[key] = form
+                form_hash = content_hash(form)
+                known = existing['forms'].get(key)
+                if known and known.get('content_hash') == form_hash:
+                    result['imported_rows'] += len(entries)
+                    existing['seen'].add(key)
+                    continue
+                form['content_hash'] = form_hash
+                groups.setdefault(tuple(sorted(form)), []).append(key)
+
+            def upsert(forms: List[dict]) -> List[dict]:
+                return self.client.table('forms_1099').upsert(
+                    forms, on_conflict=FORMS_1099_UPSERT_KEY
+                ).execute().data or []
+
+            for keys in groups.values():
+                for i in range(0, len(keys), FORM_UPSERT_CHUNK_SIZE):
+                    chunk = keys[i:i + FORM_UPSERT_CHUNK_SIZE]
+                    try:
+                        written = upsert([merged[k] for k in chunk])
+                    except Exception:
+                        # Fall back to single-row writes to attribute the failure
+                        written = []
+                        for k in chunk:
+                            entry = by_key[k][-1]
+                            try:
+                                written.extend(upsert([merged[k]]))
+                            except Exception as e:
+                                result['row_errors'].append({
+                                    'sheet': entry['sheet'],
+                                    'row': entry['row'],
+                                    'name': entry['name'],
+                                    'errors': [{'field': 'form', 'code': 'FORM_WRITE_FAILED',
+                                                'message': str(e), 'severity': 'error'}]
+                                })
+
+                    for form in written:
+                        key = (form['filer_id'], form['recipient_id'], form['operating_year_id'], form['form_type'])
+                        result['imported_rows'] += len(by_key.get(key, []))
+                        known = existing['forms'].get(key)
+                        written_form = existing['written_forms'].setdefault(
+                            key, {'before': known.get('content_hash') if known else None}
+                        )
+                        written_form['after'] = form.get('content_hash')
+                        written_form['form'] = {'id': form['id']} if ids_only else form
+                        existing['forms'][key] = {
+                            'id': form['id'], 'status': form.get('status'), 'content_hash': form.get('content_hash')
+                        }
+                        existing['seen'].add(key)
+
     def import_workbook(
         self,
-        file_content: bytes,
+        file_content: FileContent,
         filename: str,
         operating_year_id: str,
-        sheet_name: Optional[str] = None
+        sheet_name: Optional[str] = None,
+        workbook: Optional[WorkbookSession] = None
     ) -> Dict[str, Any]:
         """
         Full import workflow for a workbook (single sheet):
@@ -1326,6 +2895,7 @@ class ImportService:
 
         Returns dict with filer_id, filer_data, batch_id, sheet_name, row_count
         """
+        workbook = workbook or WorkbookSession(file_content, filename)
         result: Dict[str, Any] = {
             'filer_id': None,
             'filer_data': None,
@@ -1337,7 +2907,7 @@ class ImportService:
         }
 
         # Step 1: Parse filer information
-        filer_data = self.parse_filer_info(file_content, filename)
+        filer_data = self.parse_filer_info(file_content, filename, workbook=workbook)
         result['filer_data'] = filer_data
 
         # Step 2: Create/update filer
@@ -1352,8 +2922,8 @@ class ImportService:
             result['errors'].append("No filer information found in workbook")
 
         # Step 3: Determine which sheet to import
-        sheets = self.get_sheet_names(file_content, filename)
-        data_sheets = [s for s in sheets if s != 'Filer Information']
+        sheets = self.get_sheet_names(file_content, filename, workbook=workbook)
+        data_sheets = [s for s in sheets if s.lower().strip() != FILER_INFO_SHEET]
 
         if sheet_name and sheet_name in sheets:
             target_sheet = sheet_name
@@ -1368,7 +2938,7 @@ class ImportService:
 
         # Step 4: Parse the data sheet
         try:
-            df = self.parse_file(file_content, filename, sheet_name=target_sheet)
+            df = self.parse_file(file_content, filename, sheet_name=target_sheet, workbook=workbook)
             result['row_count'] = len(df)
 
             # Step 5: Create batch
@@ -1391,31 +2961,84 @@ class ImportService:
 
     def store_raw_rows(self, batch_id: str, df: pd.DataFrame) -> int:
         """Store raw rows from DataFrame into import_rows."""
-        rows_to_insert = []
-
-        for idx, row in df.iterrows():
-            raw_data = row.to_dict()
-            # Convert NaN to None for JSON
-            raw_data = {k: (None if pd.isna(v) else v) for k, v in raw_data.items()}
-
-            rows_to_insert.append({
-                'batch_id': batch_id,
-                'row_number': idx + 2,  # +2 for header row and 0-index
-                'raw_data': raw_data,
-                'status': 'pending'
-            })
+        def records() -> Iterator[dict]:
+            # Built a page at a time rather than as one list for the whole sheet
+            for start in range(0, len(df), IMPORT_ROW_PAGE_SIZE):
+                page = df.iloc[start:start + IMPORT_ROW_PAGE_SIZE]
+                # Convert NaN to None for JSON
+                page = page.astype(object).where(page.notna(), None)
+                for idx, raw_data in zip(page.index, page.to_dict('records')):
+                    yield {
+                        'batch_id': batch_id,
+                        'row_number': idx + 2,  # +2 for header row and 0-index
+                        'raw_data': raw_data,
+                        'status': 'pending'
+                    }
 
-        # Insert in batches of 100
-        for i in range(0, len(rows_to_insert), 100):
-            batch = rows_to_insert[i:i+100]
-            self.client.table('import_rows').insert(batch).execute()
+        total = self._insert_chunks('import_rows', _chunk_by_size(records()), on_conflict='batch_id,row_number')
 
         # Update batch total
         self.client.table('import_batches').update({
-            'total_rows': len(rows_to_insert)
+            'total_rows': total
         }).eq('id', batch_id).execute()
 
-        return len(rows_to_insert)
+        return total
+
+    def _insert_chunks(self, table: str, chunks: Iterator[List[dict]], on_conflict: str) -> int:
+        """
+        Insert each chunk of records into table; returns the number of records.
+
+        Up to IMPORT_INSERT_WORKERS chunks are in flight at once, and the next
+        chunk is only built when one finishes. Chunks that fail are retried
+        on their own after the rest are in. A failed chunk may still have been
+        written (a timeout or dropped connection after the server committed),
+        so retries skip records whose on_conflict key (a unique index) is
+        already there instead of inserting them twice. Raises the last error
+        if a chunk still fails after IMPORT_INSERT_RETRIES retries.
+        """
+        def insert(chunk: List[dict]) -> int:
+            self.client.table(table).insert(chunk).execute()
+            return len(chunk)
+
+        def insert_missing(chunk: List[dict]) -> int:
+            self.client.table(table).upsert(chunk, on_conflict=on_conflict, ignore_duplicates=True).execute()
+            return len(chunk)
+
+        inserted = 0
+        failed: List[Tuple[List[dict], Exception]] = []
+        pending: Dict[Any, List[dict]] = {}
+
+        def settle(futures) -> None:
+            nonlocal inserted
+            for future in futures:
+                chunk = pending.pop(future)
+                try:
+                    inserted += future.result()
+                except Exception as e:
+                    failed.append((chunk, e))
+
+        with ThreadPoolExecutor(max_workers=IMPORT_INSERT_WORKERS, thread_name_prefix="import-insert") as pool:
+            for chunk in chunks:
+                if len(pending) >= IMPORT_INSERT_WORKERS:
+                    settle(wait(pending, return_when=FIRST_COMPLETED).done)
+                pending[pool.submit(insert, chunk)] = chunk
+            settle(wait(pending).done)
+
+        for attempt in range(IMPORT_INSERT_RETRIES):
+            if not failed:
+                break
+            time.sleep(0.5 * 2 ** attempt)
+            retry, failed = failed, []
+            for chunk, _ in retry:
+                try:
+                    inserted += insert_missing(chunk)
+                except Exception as e:
+                    failed.append((chunk, e))
+
+        if failed:
+            print(f"DEBUG: {len(failed)} chunk(s) of {table} failed to insert")
+            raise failed[-1][1]
+        return inserted
 
     def apply_column_mapping(self, batch_id: str, mapping: Dict[str, str]) -> None:
         """Apply column mapping to a batch."""
@@ -1428,6 +3051,14 @@ class ImportService:
         """
         Normalize all rows in a batch.
 
+        Each row keeps its normalization errors per target field
+        (field_errors) and the batch keeps the mapping they were made with
+        (normalized_mapping). Normalizing again after a mapping change only
+        re-normalizes the target fields whose source column changed; the
+        other fields' values and errors are taken from the rows. Rules, form
+        type, row status and the batch counts are always worked out again
+        from every field.
+
         Returns: {'valid': n, 'errors': n, 'warnings': n}
         """
         # Get batch with mapping
@@ -1440,182 +3071,101 @@ class ImportService:
         # Reverse mapping for lookup
         reverse_map = {v: k for k, v in mapping.items()}
 
+        # Only fields mapped differently from the last normalization need redoing
+        previous = batch.get('normalized_mapping')
+        if previous is None:
+            fields = NORMALIZED_FIELDS
+        else:
+            previous_map = {v: k for k, v in previous.items()}
+            fields = [f for f in NORMALIZED_FIELDS if reverse_map.get(f) != previous_map.get(f)]
+
         # Get all rows
-        rows = self.client.table('import_rows').select('*').eq('batch_id', batch_id).execute().data
+        rows = self._fetch_batch_rows(batch_id)
 
         stats = {'valid': 0, 'errors': 0, 'warnings': 0}
 
-        for row in rows:
-            raw = row['raw_data']
-            normalized: Dict[str, Any] = {}
-            all_errors: List[dict] = []
-
-            # Extract and normalize each field
-            def get_raw(field):
-                source_col = reverse_map.get(field)
-                return raw.get(source_col) if source_col else None
-
-            # Name (Line 1)
-            val, errs = normalize_name(get_raw('recipient_name'))
-            normalized['recipient_name'] = val
-            all_errors.extend(errs)
-
-            # Name Line 2 (optional, also needs IRS sanitization)
-            name2_raw = get_raw('recipient_name_line2')
-            if name2_raw and not pd.isna(name2_raw):
-                val, errs = normalize_name(name2_raw)
-                normalized['recipient_name_line2'] = val
-                all_errors.extend([{**e, 'field': 'recipient_name_line2'} for e in errs])
-
-            # TIN
-            val, tin_type, errs = normalize_tin(get_raw('recipient_tin'))
-            normalized['recipient_tin'] = val
-            normalized['recipient_tin_type'] = tin_type
-            all_errors.extend(errs)
-
-            # Address
-            val, errs = normalize_address(get_raw('recipient_address1'))
-            normalized['recipient_address1'] = val
-            all_errors.extend([{**e, 'field': 'recipient_address1'} for e in errs])
-
-            val, errs = normalize_address(get_raw('recipient_address2'))
-            normalized['recipient_address2'] = val
-            all_errors.extend([{**e, 'field': 'recipient_address2'} for e in errs])
-
-            # City/State/ZIP
-            val, errs = normalize_city(get_raw('recipient_city'))
-            normalized['recipient_city'] = val
-            all_errors.extend(errs)
-
-            val, errs = normalize_state(get_raw('recipient_state'))
-            normalized['recipient_state'] = val
-            all_errors.extend(errs)
-
-            val, errs = normalize_zip(get_raw('recipient_zip'))
-            normalized['recipient_zip'] = val
-            all_errors.extend(errs)
-
-            # Amounts - NEC
-            amount_val, errs = normalize_amount(get_raw('nec_box1'), 'nec_box1')
-            normalized['nec_box1'] = amount_val
-            all_errors.extend(errs)
-
-            amount_val, errs = normalize_amount(get_raw('nec_box4'), 'nec_box4')
-            normalized['nec_box4'] = amount_val
-            all_errors.extend(errs)
-
-            # Amounts - MISC
-            for box in ['misc_box1', 'misc_box2', 'misc_box3', 'misc_box4', 'misc_box5',
-                       'misc_box6', 'misc_box8', 'misc_box9', 'misc_box10', 'misc_box11',
-                       'misc_box12', 'misc_box14']:
-                amount_val, errs = normalize_amount(get_raw(box), box)
-                normalized[box] = amount_val
-                all_errors.extend(errs)
-
-            # 1099-S fields
-            date_val, errs = normalize_date(get_raw('s_box1_date_closing'), 's_box1_date_closing')
-            normalized['s_box1_date_closing'] = date_val
-            all_errors.extend(errs)
-
-            amount_val, errs = normalize_amount(get_raw('s_box2_gross_proceeds'), 's_box2_gross_proceeds')
-            normalized['s_box2_gross_proceeds'] = amount_val
-            all_errors.extend(errs)
-
-            # Property address is just text
-            prop_addr = get_raw('s_box3_property_address')
-            if prop_addr and not pd.isna(prop_addr):
-                normalized['s_box3_property_address'] = str(prop_addr).strip()
-
-            bool_val, errs = normalize_boolean(get_raw('s_box4_property_services'), 's_box4_property_services')
-            normalized['s_box4_property_services'] = bool_val
-            all_errors.extend(errs)
-
-            bool_val, errs = normalize_boolean(get_raw('s_box5_foreign_person'), 's_box5_foreign_person')
-            normalized['s_box5_foreign_person'] = bool_val
-            all_errors.extend(errs)
-
-            amount_val, errs = normalize_amount(get_raw('s_box6_buyers_tax'), 's_box6_buyers_tax')
-            normalized['s_box6_buyers_tax'] = amount_val
-            all_errors.extend(errs)
-
-            # 1098 fields
-            amount_val, errs = normalize_amount(get_raw('f1098_box1_mortgage_interest'), 'f1098_box1_mortgage_interest')
-            normalized['f1098_box1_mortgage_interest'] = amount_val
-            all_errors.extend(errs)
-
-            amount_val, errs = normalize_amount(get_raw('f1098_box2_outstanding_principal'), 'f1098_box2_outstanding_principal')
-            normalized['f1098_box2_outstanding_principal'] = amount_val
-            all_errors.extend(errs)
-
-            date_val, errs = normalize_date(get_raw('f1098_box3_origination_date'), 'f1098_box3_origination_date')
-            normalized['f1098_box3_origination_date'] = date_val
-            all_errors.extend(errs)
-
-            amount_val, errs = normalize_amount(get_raw('f1098_box4_refund_interest'), 'f1098_box4_refund_interest')
-            normalized['f1098_box4_refund_interest'] = amount_val
-            all_errors.extend(errs)
-
-            amount_val, errs = normalize_amount(get_raw('f1098_box5_mortgage_insurance'), 'f1098_box5_mortgage_insurance')
-            normalized['f1098_box5_mortgage_insurance'] = amount_val
-            all_errors.extend(errs)
-
-            amount_val, errs = normalize_amount(get_raw('f1098_box6_points_paid'), 'f1098_box6_points_paid')
-            normalized['f1098_box6_points_paid'] = amount_val
-            all_errors.extend(errs)
-
-            prop_addr = get_raw('f1098_box8_property_address')
-            if prop_addr and not pd.isna(prop_addr):
-                normalized['f1098_box8_property_address'] = str(prop_addr).strip()
-
-            num_props = get_raw('f1098_box9_num_properties')
-            if num_props and not pd.isna(num_props):
-                try:
-                    normalized['f1098_box9_num_properties'] = int(float(num_props))
-                except:
-                    pass
-
-            amount_val, errs = normalize_amount(get_raw('f1098_box10_other'), 'f1098_box10_other')
-            normalized['f1098_box10_other'] = amount_val
-            all_errors.extend(errs)
-
-            date_val, errs = normalize_date(get_raw('f1098_box11_acquisition_date'), 'f1098_box11_acquisition_date')
-            normalized['f1098_box11_acquisition_date'] = date_val
-            all_errors.extend(errs)
-
-            # Detect form type based on data
-            if normalized.get('nec_box1'):
-                normalized['form_type'] = '1099-NEC'
-            elif any(normalized.get(f'misc_box{i}') for i in [1,2,3,4,5,6,8,9,10,11,12,14]):
-                normalized['form_type'] = '1099-MISC'
-            elif normalized.get('s_box2_gross_proceeds') or normalized.get('s_box1_date_closing'):
-                normalized['form_type'] = '1099-S'
-            elif normalized.get('f1098_box1_mortgage_interest') or normalized.get('f1098_box2_outstanding_principal'):
-                normalized['form_type'] = '1098'
-            else:
-                normalized['form_type'] = '1099-NEC'  # Default
-
-            # Determine status
-            has_errors = any(e['severity'] == 'error' for e in all_errors)
-            has_warnings = any(e['severity'] == 'warning' for e in all_errors)
-
-            if has_errors:
+        # Normalize the changed fields column by column
+        raw_df = pd.DataFrame([row['raw_data'] for row in rows], index=range(len(rows)))
+        fresh, fresh_errors = normalize_fields(raw_df, reverse_map, fields)
+
+        # Stored values for the rest
+        kept = [f for f in NORMALIZED_FIELDS if f not in fields]
+        if 'recipient_tin' not in fields:
+            kept.append('recipient_tin_type')
+        stored = pd.DataFrame([{f: row.get(f) for f in kept} for row in rows], index=raw_df.index, columns=kept)
+        normalized = pd.concat([stored, fresh], axis=1)
+
+        # Per-field errors: stored ones for kept fields, fresh ones for the rest
+        field_errors: List[Dict[str, List[dict]]] = [
+            {} if previous is None else
+            {f: errs for f, errs in (row.get('field_errors') or {}).items() if f not in fields}
+            for row in rows
+        ]
+        for idx, error in zip(fresh_errors.index, fresh_errors.to_dict('records')):
+            field_errors[idx].setdefault(error.pop('source'), []).append(error)
+
+        # Back to one error table, fields in normalization order, then the rules
+        labels, records = [], []
+        for idx, errors in enumerate(field_errors):
+            for field in NORMALIZED_FIELDS:
+                for error in errors.get(field, ()):
+                    labels.append(idx)
+                    records.append({**error, 'source': field})
+        norm_errors = _with_source(_concat_errors([
+            pd.DataFrame(records, index=labels, columns=ERROR_COLUMNS + ['source']),
+            validate_normalized(normalized),
+        ]))
+
+        # Line 2 and address errors are reported against their own field here
+        relabel = norm_errors['source'].isin(['recipient_name_line2', 'recipient_address1', 'recipient_address2']).to_numpy()
+        norm_errors.loc[relabel, 'field'] = norm_errors.loc[relabel, 'source']
+        row_errors = errors_by_row(norm_errors)
+
+        # Detect form type based on data (first match wins)
+        def filled(field: str) -> pd.Series:
+            return _present(normalized[field])
+
+        misc_boxes = [f'misc_box{i}' for i in [1, 2, 3, 4, 5, 6, 8, 9, 10, 11, 12, 14]]
+        form_type = pd.Series('1099-NEC', index=normalized.index, dtype=object)  # Default
+        form_type[filled('f1098_box1_mortgage_interest') | filled('f1098_box2_outstanding_principal')] = '1098'
+        form_type[filled('s_box2_gross_proceeds') | filled('s_box1_date_closing')] = '1099-S'
+        form_type[pd.concat([filled(box) for box in misc_boxes], axis=1).any(axis=1)] = '1099-MISC'
+        form_type[filled('nec_box1')] = '1099-NEC'
+        normalized['form_type'] = form_type
+
+        # Determine status
+        error_rows = set(norm_errors.index[(norm_errors['severity'] == 'error').to_numpy()])
+        warning_rows = set(norm_errors.index[(norm_errors['severity'] == 'warning').to_numpy()])
+
+        updates = []
+        written = list(fresh.columns) + ['form_type']
+        for idx, (row, values) in enumerate(zip(rows, normalized[written].to_dict('records'))):
+            all_errors = row_errors.get(idx, [])
+
+            if idx in error_rows:
                 status = 'error'
                 stats['errors'] += 1
-            elif has_warnings:
+            elif idx in warning_rows:
                 status = 'warning'
                 stats['warnings'] += 1
             else:
                 status = 'valid'
                 stats['valid'] += 1
 
-            # Update row
-            update_data = {
+            # Full row so the upsert keeps the fields that weren't re-normalized
+            updates.append({
+                **row,
                 'status': status,
                 'validation_errors': all_errors if all_errors else None,
-                **{k: v for k, v in normalized.items() if v is not None}
-            }
+                'field_errors': field_errors[idx] or None,
+                **values
+            })
 
-            self.client.table('import_rows').update(update_data).eq('id', row['id']).execute()
+        # Write rows back in bulk, keyed on id
+        for i in range(0, len(updates), IMPORT_ROW_CHUNK_SIZE):
+            self.client.table('import_rows').upsert(
+                updates[i:i + IMPORT_ROW_CHUNK_SIZE], on_conflict='id'
+            ).execute()
 
         # Update batch status and counts
         self.client.table('import_batches').update({
@@ -1623,6 +3173,7 @@ class ImportService:
             'valid_rows': stats['valid'],
             'error_rows': stats['errors'],
             'warning_rows': stats['warnings'],
+            'normalized_mapping': mapping,
             'validated_at': datetime.utcnow().isoformat()
         }).eq('id', batch_id).execute()
 
@@ -1630,11 +3181,34 @@ class ImportService:
             action='import_batch_validated',
             entity_type='import_batch',
             entity_id=batch_id,
-            details=stats
+            details={**stats, 'fields_normalized': len(fields)}
         )
 
         return stats
 
+    def _fetch_batch_rows(self, batch_id: str, status: Optional[str] = None) -> List[dict]:
+        """Get every row of a batch (optionally one status), paging past the response cap."""
+        def query():
+            q = self.client.table('import_rows').select('*').eq('batch_id', batch_id)
+            return q.eq('status', status) if status else q
+        return self._fetch_all(query, order='row_number')
+
+    def _fetch_all(self, query: Callable[[], Any], order: str = 'id') -> List[dict]:
+        """
+        Every row of a select, paging past the response cap.
+
+        query builds a fresh filtered select for each page; order must give
+        the rows a stable order.
+        """
+        rows: List[dict] = []
+        while True:
+            page = query().order(order).range(
+                len(rows), len(rows) + IMPORT_ROW_PAGE_SIZE - 1
+            ).execute().data or []
+            rows.extend(page)
+            if len(page) < IMPORT_ROW_PAGE_SIZE:
+                return rows
+
     def get_batch(self, batch_id: str) -> dict:
         """Get batch details."""
         return self.client.table('import_batches').select('*').eq('id', batch_id).single().execute().data
@@ -1644,136 +3218,99 @@ class ImportService:
         batch_id: str,
         status: Optional[str] = None,
         limit: int = 100,
-        offset: int = 0
+        offset: int = 0,
+        error_code: Optional[str] = None,
+        error_field: Optional[str] = None,
+        after_row_number: Optional[int] = None
     ) -> List[dict]:
-        """Get rows for a batch with optional filtering."""
-        query = self.client.table('import_rows').select('*').eq('batch_id', batch_id)
+        """
+        Get rows for a batch with optional filtering.
 
-        if status:
-            query = query.eq('status', status)
+        error_code / error_field keep rows with a validation error of that
+        code and/or field (GIN-indexed, migration 018). For large batches page
+        with after_row_number (the last row_number of the previous page)
+        instead of offset.
+        """
+        query = self._batch_rows_query(batch_id, '*', status, error_code, error_field)
+
+        if after_row_number is not None:
+            query = query.gt('row_number', after_row_number)
 
         query = query.order('row_number').range(offset, offset + limit - 1)
         return query.execute().data
 
+    def count_batch_rows(
+        self,
+        batch_id: str,
+        status: Optional[str] = None,
+        error_code: Optional[str] = None,
+        error_field: Optional[str] = None
+    ) -> int:
+        """Number of rows get_batch_rows would page through with the same filters."""
+        query = self._batch_rows_query(batch_id, 'id', status, error_code, error_field, count='exact')
+        return query.limit(1).execute().count or 0
+
+    def get_batch_error_summary(self, batch_id: str) -> List[dict]:
+        """
+        Validation errors of a batch by kind, most rows first.
+
+        Returns: [{'code', 'field', 'severity', 'row_count'}]
+        """
+        return self.client.rpc('import_batch_error_summary', {'p_batch_id': batch_id}).execute().data or []
+
+    def _batch_rows_query(
+        self,
+        batch_id: str,
+        columns: str,
+        status: Optional[str],
+        error_code: Optional[str],
+        error_field: Optional[str],
+        count: Optional[str] = None
+    ) -> Any:
+        query = self.client.table('import_rows').select(columns, count=count).eq('batch_id', batch_id)
+
+        if status:
+            query = query.eq('status', status)
+
+        # One error entry with this code and field (JSONB containment)
+        error = {k: v for k, v in (('code', error_code), ('field', error_field)) if v}
+        if error:
+            query = query.contains('validation_errors', json.dumps([error]))
+
+        return query
+
     def update_row(self, row_id: str, updates: dict) -> dict:
-        """Update a single import row."""
+        """
+        Update a single import row.
+
+        Normalization errors kept for the edited fields (field_errors) are
+        dropped, so they don't come back when the batch is validated again.
+        """
+        edited = [field for field in updates if field in NORMALIZED_FIELDS]
+        if edited and 'field_errors' not in updates:
+            row = self.client.table('import_rows').select('field_errors').eq('id', row_id).single().execute().data
+            field_errors = {f: errs for f, errs in (row.get('field_errors') or {}).items() if f not in edited}
+            updates = {**updates, 'field_errors': field_errors or None}
         return self.client.table('import_rows').update(updates).eq('id', row_id).execute().data[0]
 
     def promote_batch(self, batch_id: str, filer_id: str) -> Dict[str, int]:
         """
         Promote valid rows to canonical recipients and forms tables.
 
+        Runs server-side in one transaction (promote_import_batch, migration
+        015): recipients and forms are inserted set-wise and the staging rows
+        linked to them, or nothing is written if any part fails. Rows whose
+        form already exists are skipped with a FORM_EXISTS error.
+
         Returns: {'recipients_created': n, 'forms_created': n, 'skipped': n}
         """
         batch = self.get_batch(batch_id)
         operating_year_id = batch['operating_year_id']
 
-        # Get valid rows only
-        rows = self.client.table('import_rows').select('*').eq('batch_id', batch_id).eq('status', 'valid').execute().data
-
-        stats = {'recipients_created': 0, 'forms_created': 0, 'skipped': 0}
-
-        for row in rows:
-            try:
-                # Check if recipient already exists (by TIN)
-                existing = self.client.table('recipients').select('id').eq('filer_id', filer_id).eq('tin', row['recipient_tin']).execute().data
-
-                if existing:
-                    recipient_id = existing[0]['id']
-                else:
-                    # Create recipient
-                    recipient_data = {
-                        'filer_id': filer_id,
-                        'name': row['recipient_name'],
-                        'name_line_2': row.get('recipient_name_line2'),
-                        'tin': row['recipient_tin'],
-                        'tin_type': row.get('recipient_tin_type', 'SSN'),
-                        'address1': row['recipient_address1'],
-                        'address2': row.get('recipient_address2'),
-                        'city': row['recipient_city'],
-                        'state': row['recipient_state'],
-                        'zip': row['recipient_zip'],
-                        'account_number': row.get('account_number'),
-                    }
-                    result = self.client.table('recipients').insert(recipient_data).execute()
-                    recipient_id = result.data[0]['id']
-                    stats['recipients_created'] += 1
-
-                # Create form
-                form_data = {
-                    'filer_id': filer_id,
-                    'recipient_id': recipient_id,
-                    'operating_year_id': operating_year_id,
-                    'form_type': row.get('form_type', '1099-NEC'),
-                    'status': 'draft',
-                    # NEC fields
-                    'nec_box1': row.get('nec_box1'),
-                    'nec_box4': row.get('nec_box4'),
-                    # MISC fields
-                    'misc_box1': row.get('misc_box1'),
-                    'misc_box2': row.get('misc_box2'),
-                    'misc_box3': row.get('misc_box3'),
-                    'misc_box4': row.get('misc_box4'),
-                    'misc_box5': row.get('misc_box5'),
-                    'misc_box6': row.get('misc_box6'),
-                    'misc_box8': row.get('misc_box8'),
-                    'misc_box9': row.get('misc_box9'),
-                    'misc_box10': row.get('misc_box10'),
-                    'misc_box11': row.get('misc_box11'),
-                    'misc_box12': row.get('misc_box12'),
-                    'misc_box14': row.get('misc_box14'),
-                    # 1099-S fields
-                    's_box1_date_closing': row.get('s_box1_date_closing'),
-                    's_box2_gross_proceeds': row.get('s_box2_gross_proceeds'),
-                    's_box3_property_address': row.get('s_box3_property_address'),
-                    's_box4_property_services': row.get('s_box4_property_services'),
-                    's_box5_foreign_person': row.get('s_box5_foreign_person'),
-                    's_box6_buyers_tax': row.get('s_box6_buyers_tax'),
-                    # 1098 fields
-                    'f1098_box1_mortgage_interest': row.get('f1098_box1_mortgage_interest'),
-                    'f1098_box2_outstanding_principal': row.get('f1098_box2_outstanding_principal'),
-                    'f1098_box3_origination_date': row.get('f1098_box3_origination_date'),
-                    'f1098_box4_refund_interest': row.get('f1098_box4_refund_interest'),
-                    'f1098_box5_mortgage_insurance': row.get('f1098_box5_mortgage_insurance'),
-                    'f1098_box6_points_paid': row.get('f1098_box6_points_paid'),
-                    'f1098_box8_property_address': row.get('f1098_box8_property_address'),
-                    'f1098_box9_num_properties': row.get('f1098_box9_num_properties'),
-                    'f1098_box10_other': row.get('f1098_box10_other'),
-                    'f1098_box11_acquisition_date': row.get('f1098_box11_acquisition_date'),
-                    # State fields
-                    'state1_code': row.get('state1_code'),
-                    'state1_id': row.get('state1_id'),
-                    'state1_income': row.get('state1_income'),
-                    'state1_withheld': row.get('state1_withheld'),
-                }
-                # Remove None values
-                form_data = {k: v for k, v in form_data.items() if v is not None}
-
-                result = self.client.table('forms_1099').insert(form_data).execute()
-                form_id = result.data[0]['id']
-                stats['forms_created'] += 1
-
-                # Update import row with promoted IDs
-                self.client.table('import_rows').update({
-                    'promoted_recipient_id': recipient_id,
-                    'promoted_form_id': form_id,
-                    'status': 'promoted'
-                }).eq('id', row['id']).execute()
-
-            except Exception as e:
-                stats['skipped'] += 1
-                # Log error but continue
-                self.client.table('import_rows').update({
-                    'validation_errors': [{'field': 'promotion', 'code': 'PROMOTE_FAILED',
-                                          'message': str(e), 'severity': 'error'}]
-                }).eq('id', row['id']).execute()
-
-        # Update batch status
-        self.client.table('import_batches').update({
-            'status': 'promoted',
-            'filer_id': filer_id,
-            'promoted_at': datetime.utcnow().isoformat()
-        }).eq('id', batch_id).execute()
+        stats = self.client.rpc('promote_import_batch', {
+            'p_batch_id': batch_id,
+            'p_filer_id': filer_id
+        }).execute().data
 
         log_activity(
             action='import_batch_promoted',
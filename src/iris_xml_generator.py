@@ -17,14 +17,15 @@ XML Structure:
     - IRSubmission1Detail (individual form records)
 """
 
+import io
+import re
 import uuid
 import logging
 from datetime import date, datetime
 from decimal import Decimal
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Callable, TextIO
 from dataclasses import dataclass, field
 from xml.etree import ElementTree as ET
-from xml.dom import minidom
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +36,15 @@ IRIS_NS_PREFIX = "irs"
 # Current schema version (from IRS schema)
 SCHEMA_VERSION = "2.0.3"
 
+# Root element start tag of a transmission
+TRANSMISSION_START_TAG = (
+    f'<IRTransmission xmlns="{IRIS_NS}" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" '
+    f'xsi:schemaLocation="{IRIS_NS} ../MSG/IRS-IRIntakeTransmissionMessage.xsd">'
+)
+
+# Characters XML 1.0 doesn't allow in text
+_INVALID_XML_CHARS = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
 
 @dataclass
 class TransmitterInfo:
@@ -1025,12 +1035,9 @@ class IRISXMLGenerator:
 
         return totals_grp
 
-    def _build_submission_1_group(self, batch: SubmissionBatch, submission_id: str) -> ET.Element:
-        """Build IRSubmission1Grp for a batch of forms."""
-        grp = ET.Element(f"{{{IRIS_NS}}}IRSubmission1Grp")
-
-        # Header
-        header = self._add_element(grp, "IRSubmission1Header")
+    def _build_submission_1_header(self, batch: SubmissionBatch, submission_id: str) -> ET.Element:
+        """Build IRSubmission1Header (issuer, signature, form count and totals) for a batch of forms."""
+        header = ET.Element(f"{{{IRIS_NS}}}IRSubmission1Header")
         self._add_element(header, "SubmissionId", submission_id)
         self._add_element(header, "TaxYr", str(batch.tax_year))
 
@@ -1093,20 +1100,16 @@ class IRISXMLGenerator:
             totals_grp = self._calculate_1098_totals(batch.forms)
             form_totals.append(totals_grp)
 
-        # Detail section with individual forms
-        if batch.forms:
-            detail = self._add_element(grp, "IRSubmission1Detail")
-            for form in batch.forms:
-                if batch.form_type == "1099NEC":
-                    detail.append(self._build_1099nec_detail(form))
-                elif batch.form_type == "1099MISC":
-                    detail.append(self._build_1099misc_detail(form))
-                elif batch.form_type == "1099S":
-                    detail.append(self._build_1099s_detail(form))
-                elif batch.form_type == "1098":
-                    detail.append(self._build_1098_detail(form))
+        return header
 
-        return grp
+    def _form_detail_builder(self, form_type: str) -> Optional[Callable[[Any], ET.Element]]:
+        """The _build_*_detail method for a form type (None if unsupported)."""
+        return {
+            "1099NEC": self._build_1099nec_detail,
+            "1099MISC": self._build_1099misc_detail,
+            "1099S": self._build_1099s_detail,
+            "1098": self._build_1098_detail,
+        }.get(form_type)
 
     def _generate_utid(self) -> str:
         """
@@ -1127,26 +1130,8 @@ class IRISXMLGenerator:
         tcc = self.transmitter.tcc[:5].upper() if self.transmitter.tcc else "XXXXX"
         return f"{uuid.uuid4()}:IRIS:{tcc}::A"
 
-    def generate_transmission(
-        self,
-        batches: List[SubmissionBatch],
-        tax_year: int,
-        transmission_id: Optional[str] = None,
-    ) -> str:
-        """
-        Generate complete IRIS transmission XML.
-
-        Args:
-            batches: List of submission batches (one per issuer/form type)
-            tax_year: Tax year for the transmission
-            transmission_id: Optional unique transmission ID (UUID generated if not provided)
-
-        Returns:
-            str: Complete XML document as string
-        """
-        if not transmission_id:
-            transmission_id = self._generate_utid()
-
+    def _build_manifest(self, batches: List[SubmissionBatch], tax_year: int, transmission_id: str) -> ET.Element:
+        """Build IRTransmissionManifest (transmitter, vendor and counts)."""
         # Calculate totals
         total_issuers = len(batches)
         total_recipients = sum(len(b.forms) for b in batches)
@@ -1160,20 +1145,7 @@ class IRISXMLGenerator:
         )
         transmission_type = "C" if has_corrections else "O"
 
-        # Register namespace
-        ET.register_namespace("", IRIS_NS)
-
-        # Root element
-        root = ET.Element(
-            f"{{{IRIS_NS}}}IRTransmission",
-            {
-                "xmlns:xsi": "http://www.w3.org/2001/XMLSchema-instance",
-                "xsi:schemaLocation": f"{IRIS_NS} ../MSG/IRS-IRIntakeTransmissionMessage.xsd",
-            }
-        )
-
-        # Transmission manifest
-        manifest = self._add_element(root, "IRTransmissionManifest")
+        manifest = ET.Element(f"{{{IRIS_NS}}}IRTransmissionManifest")
         self._add_element(manifest, "SchemaVersionNum", SCHEMA_VERSION)
         self._add_element(manifest, "UniqueTransmissionId", transmission_id)
         self._add_element(manifest, "TaxYr", str(tax_year))
@@ -1199,22 +1171,115 @@ class IRISXMLGenerator:
         self._add_element(manifest, "MediaSourceCd", "M")  # M=Magnetic media
         self._add_element(manifest, "SubmissionChannelCd", "A2A")
 
-        # Add submission groups
+        return manifest
+
+    def _write_element(self, sink: TextIO, elem: ET.Element, depth: int) -> None:
+        """
+        Write elem on new lines, one element per line, indented with depth tabs.
+
+        Same layout and escaping as minidom's toprettyxml(indent="\t") with
+        blank lines dropped, which is how transmissions were formatted when the
+        whole tree was serialized at once.
+        """
+        lines: List[str] = []
+
+        def add(e: ET.Element, level: int) -> None:
+            indent = "\t" * level
+            tag = e.tag.rpartition("}")[2]
+            children = list(e)
+            if children:
+                lines.append(f"{indent}<{tag}>")
+                for child in children:
+                    add(child, level + 1)
+                lines.append(f"{indent}</{tag}>")
+            elif e.text:
+                if _INVALID_XML_CHARS.search(e.text):
+                    raise ValueError(f"{tag} contains a character that is not allowed in XML")
+                text = (e.text.replace("\r\n", "\n").replace("\r", "\n")
+                        .replace("&", "&amp;").replace("<", "&lt;").replace('"', "&quot;").replace(">", "&gt;"))
+                lines.append(f"{indent}<{tag}>{text}</{tag}>")
+            else:
+                lines.append(f"{indent}<{tag}/>")
+
+        add(elem, depth)
+        for line in "\n".join(lines).split("\n"):
+            if line.strip():
+                sink.write("\n" + line)
+
+    def write_transmission(
+        self,
+        sink: TextIO,
+        batches: List[SubmissionBatch],
+        tax_year: int,
+        transmission_id: Optional[str] = None,
+    ) -> str:
+        """
+        Write a complete IRIS transmission XML document to sink as it is built.
+
+        Counts and totals are worked out from the batches first (manifest and
+        submission headers come before the forms), then each form's detail
+        is built, written and dropped, so memory stays at about one form
+        however many forms the batches hold.
+
+        Args:
+            sink: Text file-like object (open files with encoding="utf-8", newline="")
+            batches: List of submission batches (one per issuer/form type)
+            tax_year: Tax year for the transmission
+            transmission_id: Optional unique transmission ID (UUID generated if not provided)
+
+        Returns:
+            str: The transmission ID written
+        """
+        if not transmission_id:
+            transmission_id = self._generate_utid()
+
+        sink.write('<?xml version="1.0" encoding="UTF-8"?>')
+        sink.write("\n" + TRANSMISSION_START_TAG)
+        self._write_element(sink, self._build_manifest(batches, tax_year, transmission_id), 1)
+
+        # Submission groups
         for i, batch in enumerate(batches, 1):
-            root.append(self._build_submission_1_group(batch, str(i)))
+            sink.write("\n\t<IRSubmission1Grp>")
+            self._write_element(sink, self._build_submission_1_header(batch, str(i)), 2)
+
+            # Detail section with individual forms
+            if batch.forms:
+                build_detail = self._form_detail_builder(batch.form_type)
+                if build_detail is None:
+                    sink.write("\n\t\t<IRSubmission1Detail/>")
+                else:
+                    sink.write("\n\t\t<IRSubmission1Detail>")
+                    for form in batch.forms:
+                        self._write_element(sink, build_detail(form), 3)
+                    sink.write("\n\t\t</IRSubmission1Detail>")
 
-        # Convert to string with pretty printing
-        xml_str = ET.tostring(root, encoding="unicode")
+            sink.write("\n\t</IRSubmission1Grp>")
 
-        # Pretty print
-        dom = minidom.parseString(xml_str)
-        pretty_xml = dom.toprettyxml(indent="\t", encoding="UTF-8")
+        sink.write("\n</IRTransmission>")
+        return transmission_id
 
-        # Remove extra blank lines and fix XML declaration
-        lines = pretty_xml.decode("utf-8").split("\n")
-        cleaned_lines = [line for line in lines if line.strip()]
+    def generate_transmission(
+        self,
+        batches: List[SubmissionBatch],
+        tax_year: int,
+        transmission_id: Optional[str] = None,
+    ) -> str:
+        """
+        Generate complete IRIS transmission XML.
+
+        For large transmissions use write_transmission with a file instead.
 
-        return "\n".join(cleaned_lines)
+        Args:
+            batches: List of submission batches (one per issuer/form type)
+            tax_year: Tax year for the transmission
+            transmission_id: Optional unique transmission ID (UUID generated if not provided)
+
+        Returns:
+            str: Complete XML document as string
+        """
+        sink = io.StringIO()
+        self.write_transmission(sink, batches, tax_year, transmission_id)
+        return sink.getvalue()
 
     def generate_transmission_bytes(
         self,
@@ -1223,8 +1288,10 @@ class IRISXMLGenerator:
         transmission_id: Optional[str] = None,
     ) -> bytes:
         """Generate transmission XML as bytes (UTF-8 encoded)."""
-        xml_str = self.generate_transmission(batches, tax_year, transmission_id)
-        return xml_str.encode("utf-8")
+        sink = io.TextIOWrapper(io.BytesIO(), encoding="utf-8", newline="")
+        self.write_transmission(sink, batches, tax_year, transmission_id)
+        sink.flush()
+        return sink.detach().getvalue()
 
 
 def convert_db_records_to_submission(
@@ -8,7 +8,7 @@ This key bypasses Row Level Security and should NEVER be exposed to the frontend
 """
 
 import os
-from typing import Optional, Any, Dict
+from typing import Optional, Any, Dict, Iterable
 from dataclasses import dataclass
 from dotenv import load_dotenv
 
@@ -211,6 +211,30 @@ def get_recipient(recipient_id: str):
     return response.data
 
 
+# Recipient IDs per request in get_recipients_by_id (keeps the URL short)
+RECIPIENT_ID_CHUNK_SIZE = 200
+
+
+def get_recipients_by_id(recipient_ids: Iterable[str]) -> Dict[str, dict]:
+    """
+    Get many recipients by ID, a few hundred per request.
+
+    Returns {recipient_id: recipient}; IDs that don't exist are left out.
+    """
+    client = get_supabase_client()
+    ids = list(dict.fromkeys(i for i in recipient_ids if i))
+    recipients = {}
+    for start in range(0, len(ids), RECIPIENT_ID_CHUNK_SIZE):
+        response = (
+            client.table("recipients")
+            .select("*")
+            .in_("id", ids[start:start + RECIPIENT_ID_CHUNK_SIZE])
+            .execute()
+        )
+        recipients.update((r["id"], r) for r in response.data)
+    return recipients
+
+
 def create_recipient(recipient_data: dict):
     """Create a new recipient."""
     client = get_supabase_client()
@@ -0,0 +1,521 @@
+"""
+Validation rules for 1099/1098 forms, declared once and checked column-wise.
+
+A forms frame has one row per form, with recipient and form columns named as
+in the recipients and forms_1099 tables (name, tin, tin_type, address1, city,
+state, zip, form_type, nec_box1, ...). Each Rule marks the rows that break it
+with a boolean mask over the whole frame; evaluate_rules collects the marks
+into a sparse error table (one row per error, indexed by the frame's row
+label) with field / code / message / severity columns.
+
+The same rules back:
+- the e-file pre-check (api/routers/efile.py validate_forms, and the filer
+  TIN, state and ZIP in validate_filer_data)
+- the import normalizer (import_service.normalize_columns, IMPORT_RULES)
+- the worksheet validator (validate_1099s.py and the Streamlit app)
+
+Each of them turns the error table into its own error format.
+"""
+
+import re
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+import pandas as pd
+
+
+# =============================================================================
+# REFERENCE DATA
+# =============================================================================
+
+# US state codes (including territories)
+VALID_STATES = {
+    'AL', 'AK', 'AZ', 'AR', 'CA', 'CO', 'CT', 'DE', 'DC', 'FL', 'GA', 'HI',
+    'ID', 'IL', 'IN', 'IA', 'KS', 'KY', 'LA', 'ME', 'MD', 'MA', 'MI', 'MN',
+    'MS', 'MO', 'MT', 'NE', 'NV', 'NH', 'NJ', 'NM', 'NY', 'NC', 'ND', 'OH',
+    'OK', 'OR', 'PA', 'PR', 'RI', 'SC', 'SD', 'TN', 'TX', 'UT', 'VT', 'VA',
+    'VI', 'WA', 'WV', 'WI', 'WY', 'AS', 'GU', 'MP', 'FM', 'MH', 'PW'
+}
+
+# Entity designators, matched as whole words (so CO/PA/INC don't fire
+# inside COLLINS, PATRICIA or VINCENT). Dotted and spaced forms included.
+BUSINESS_ENTITY_INDICATORS = [
+    'LLC', 'L.L.C', 'L L C',
+    'INC', 'INCORPORATED',
+    'CORP', 'CORPORATION',
+    'LTD', 'LIMITED',
+    'CO', 'COMPANY',
+    'LP', 'L.P',
+    'LLP', 'L.L.P',
+    'PLLC', 'P.L.L.C',
+    'PA', 'P.A',
+    'PC', 'P.C',
+    'PROFESSIONAL ASSOCIATION',
+    'PROFESSIONAL CORPORATION',
+]
+
+# The lookahead on the designators' first letters lets the search skip most
+# positions without trying every alternative
+BUSINESS_ENTITY_RE = re.compile(
+    r'(?<![A-Z0-9])(?=['
+    + ''.join(sorted({i[0] for i in BUSINESS_ENTITY_INDICATORS}))
+    + r'])(?:'
+    + '|'.join(re.escape(i) for i in sorted(BUSINESS_ENTITY_INDICATORS, key=len, reverse=True))
+    + r')(?![A-Z0-9])',
+    re.IGNORECASE
+)
+
+MAX_AMOUNT = 99999999.99
+
+# Amount columns and the labels used in their messages
+AMOUNT_LABELS: Dict[str, str] = {
+    'nec_box1': 'Nonemployee compensation (Box 1)',
+    'nec_box4': 'Federal tax withheld (Box 4)',
+    'misc_box1': 'Rents (Box 1)',
+    'misc_box2': 'Royalties (Box 2)',
+    'misc_box3': 'Other income (Box 3)',
+    'misc_box4': 'Federal tax withheld (Box 4)',
+    'misc_box5': 'Fishing boat proceeds (Box 5)',
+    'misc_box6': 'Medical payments (Box 6)',
+    'misc_box8': 'Substitute payments (Box 8)',
+    'misc_box9': 'Crop insurance (Box 9)',
+    'misc_box10': 'Attorney proceeds (Box 10)',
+    'misc_box11': 'Fish purchased (Box 11)',
+    'misc_box12': 'Section 409A deferrals (Box 12)',
+    'misc_box14': 'Nonqualified deferred comp (Box 14)',
+    's_box2_gross_proceeds': 'Gross proceeds (Box 2)',
+    's_box6_buyers_tax': "Buyer's real estate tax (Box 6)",
+    'f1098_box1_mortgage_interest': 'Mortgage interest received (Box 1)',
+    'f1098_box2_outstanding_principal': 'Outstanding principal (Box 2)',
+    'f1098_box4_refund_interest': 'Refund of overpaid interest (Box 4)',
+    'f1098_box5_mortgage_insurance': 'Mortgage insurance premiums (Box 5)',
+    'f1098_box6_points_paid': 'Points paid (Box 6)',
+    'f1098_box10_other': 'Other (Box 10)',
+    'state1_withheld': 'State 1 withholding',
+    'state1_income': 'State 1 income',
+    'state2_withheld': 'State 2 withholding',
+    'state2_income': 'State 2 income',
+}
+
+# 1099-MISC boxes that carry an amount (7 is a checkbox, 13 doesn't exist)
+MISC_AMOUNT_BOXES = [f'misc_box{i}' for i in (1, 2, 3, 4, 5, 6, 8, 9, 10, 11, 12, 14)]
+
+# 1099-MISC boxes counted as income when checking federal withholding
+MISC_INCOME_BOXES = [box for box in MISC_AMOUNT_BOXES if box != 'misc_box4']
+
+ERROR_COLUMNS = ['field', 'code', 'message', 'severity']
+
+
+# =============================================================================
+# BUSINESS NAMES
+# =============================================================================
+
+@lru_cache(maxsize=8192)
+def _has_entity_designator(name: str) -> bool:
+    return BUSINESS_ENTITY_RE.search(name) is not None
+
+
+def detect_business_entity(name: str) -> bool:
+    """
+    Detect if a name appears to be a business entity based on common suffixes.
+
+    Returns True if the name contains business entity indicators like LLC, Inc, Corp, etc.
+    Results are memoized by name.
+    """
+    if not name:
+        return False
+
+    return _has_entity_designator(name)
+
+
+def detect_business_entity_series(names: pd.Series) -> pd.Series:
+    """Column-wise detect_business_entity (missing names are False)."""
+    return names.astype(object).where(names.notna(), '').astype(str).str.contains(BUSINESS_ENTITY_RE)
+
+
+# =============================================================================
+# RULE ENGINE
+# =============================================================================
+
+class FormFrame:
+    """
+    A forms DataFrame plus the column views rules are written against.
+
+    Views are computed once per column and shared by every rule. Columns the
+    frame doesn't have read as missing in every row.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        self.df = df
+        self.index = df.index
+        self._views: Dict[Tuple[str, str], pd.Series] = {}
+
+    def cached(self, kind: str, column: str, build: Callable[[], pd.Series]) -> pd.Series:
+        """build(), computed once per (kind, column)."""
+        key = (kind, column)
+        if key not in self._views:
+            self._views[key] = build()
+        return self._views[key]
+
+    def raw(self, column: str) -> pd.Series:
+        """Column as stored, None/NaN where missing."""
+        if column not in self.df.columns:
+            return self.cached('raw', '', lambda: pd.Series(None, index=self.index, dtype=object))
+        return self.df[column]
+
+    def form_type_in(self, form_types: Tuple[str, ...]) -> pd.Series:
+        """Rows whose form_type is one of form_types."""
+        return self.cached('form_type_in', ','.join(form_types), lambda: self.upper('form_type').isin(form_types))
+
+    def text(self, column: str) -> pd.Series:
+        """Column as stripped text, '' where missing."""
+        def build() -> pd.Series:
+            if column not in self.df.columns:
+                return self.cached('text', '', lambda: pd.Series('', index=self.index, dtype=object))
+            values = self.raw(column).astype(object)
+            return values.where(values.notna(), '').astype(str).str.strip()
+        return self.cached('text', column, build)
+
+    def upper(self, column: str) -> pd.Series:
+        return self.cached('upper', column, lambda: self.text(column).str.upper())
+
+    def present(self, column: str) -> pd.Series:
+        """Rows with a non-blank value."""
+        return self.cached('present', column, lambda: self.text(column) != '')
+
+    def digits(self, column: str) -> pd.Series:
+        """Only the digits of the column (TINs, ZIP codes)."""
+        return self.cached('digits', column, lambda: self.text(column).str.replace(r'[^0-9]', '', regex=True))
+
+    def amount(self, column: str) -> pd.Series:
+        """Column as float, NaN where missing or not a number."""
+        def build() -> pd.Series:
+            if column not in self.df.columns:
+                return self.cached('amount', '', lambda: pd.Series(float('nan'), index=self.index))
+            values = self.raw(column)
+            if pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values):
+                return values.astype(float)
+            return pd.to_numeric(values, errors='coerce').astype(float)
+        return self.cached('amount', column, build)
+
+    def unreadable(self, column: str) -> pd.Series:
+        """Rows with a value that isn't a number."""
+        def build() -> pd.Series:
+            raw = self.raw(column)
+            flagged = raw.notna() & self.amount(column).isna()
+            if flagged.any():
+                flagged[flagged] = raw[flagged].astype(str).str.strip() != ''
+            return flagged
+        return self.cached('unreadable', column, build)
+
+    def positive(self, column: str) -> pd.Series:
+        return self.cached('positive', column, lambda: self.amount(column).fillna(0) > 0)
+
+
+# Messages are a fixed string or built from the frame for the flagged rows
+RuleMessage = Union[str, Callable[[FormFrame, pd.Series], pd.Series]]
+
+
+@dataclass(frozen=True)
+class Rule:
+    """
+    One validation rule.
+
+    check(frame) returns a boolean Series that is True for the rows breaking
+    the rule. message is a fixed string or message(frame, flagged) returning
+    the messages of the flagged rows. messages replaces it for a consumer
+    ('import', 'efile', 'filer', 'cli') that words the error its own way.
+    With form_types, only rows whose form_type is listed are checked.
+    """
+    code: str
+    field: str
+    severity: str
+    check: Callable[[FormFrame], pd.Series]
+    message: RuleMessage
+    form_types: Optional[Tuple[str, ...]] = None
+    messages: Optional[Dict[str, RuleMessage]] = None
+
+    def message_for(self, consumer: Optional[str]) -> RuleMessage:
+        """The message consumer reports this rule with."""
+        return (self.messages or {}).get(consumer, self.message)
+
+
+def empty_error_table() -> pd.DataFrame:
+    """Error table with no rows."""
+    return pd.DataFrame(columns=ERROR_COLUMNS)
+
+
+def evaluate_rules(
+    frame: Union[pd.DataFrame, FormFrame], rules: Iterable[Rule] = None, consumer: Optional[str] = None
+) -> pd.DataFrame:
+    """
+    Check every row of a forms frame against rules (default: all RULES).
+
+    Returns the sparse error table: one row per broken rule, indexed by the
+    frame's row label, in rule order within a row. Messages are consumer's
+    wording where a rule has one (Rule.messages).
+    """
+    frame = frame if isinstance(frame, FormFrame) else FormFrame(frame)
+    tables: List[pd.DataFrame] = []
+
+    for rule in RULES if rules is None else rules:
+        flagged = rule.check(frame)
+        if rule.form_types:
+            flagged = flagged & frame.form_type_in(rule.form_types)
+        if not flagged.any():
+            continue
+        message = rule.message_for(consumer)
+        message = message(frame, flagged) if callable(message) else message
+        tables.append(pd.DataFrame(
+            {'field': rule.field, 'code': rule.code, 'message': message, 'severity': rule.severity},
+            index=frame.index[flagged.to_numpy()], columns=ERROR_COLUMNS
+        ))
+
+    if not tables:
+        return empty_error_table()
+    return pd.concat(tables).sort_index(kind='stable')
+
+
+def rules_by_code(*codes: str) -> List[Rule]:
+    """The rules with the given codes, in RULES order."""
+    return [rule for rule in RULES if rule.code in codes]
+
+
+# =============================================================================
+# RULES
+# =============================================================================
+
+def _missing(column: str) -> Callable[[FormFrame], pd.Series]:
+    return lambda f: ~f.present(column)
+
+
+def _longer_than(column: str, limit: int) -> Callable[[FormFrame], pd.Series]:
+    return lambda f: f.text(column).str.len() > limit
+
+
+def _ssn_segments(f: FormFrame) -> pd.Series:
+    """SSNs (9 digits, not all zeros) with an all-zero area, group or serial number."""
+    digits = f.digits('tin')
+    ssn = (f.upper('tin_type') == 'SSN') & (digits.str.len() == 9) & (digits != '000000000')
+    return ssn & ((digits.str[:3] == '000') | (digits.str[3:5] == '00') | (digits.str[5:] == '0000'))
+
+
+def _business_name(f: FormFrame) -> pd.Series:
+    return f.cached('business', 'name', lambda: detect_business_entity_series(f.text('name')))
+
+
+def _last_name(names: pd.Series) -> pd.Series:
+    return names.str.rsplit(' ', n=1).str[-1]
+
+
+def _individual_last_name_too_long(f: FormFrame) -> pd.Series:
+    name = f.text('name')
+    # Only a name longer than 21 characters can have a last name over 20
+    candidates = (f.upper('tin_type') == 'EIN') & (name.str.len() > 21) & name.str.contains(' ', regex=False)
+    flagged = pd.Series(False, index=f.index)
+    if candidates.any():
+        last_name = _last_name(name[candidates])
+        flagged[candidates] = (last_name.str.len() > 20) & ~_business_name(f)[candidates]
+    return flagged
+
+
+def _last_name_message(f: FormFrame, rows: pd.Series) -> pd.Series:
+    last_name = _last_name(f.text('name')[rows])
+    return ("Last name '" + last_name + "' is " + last_name.str.len().astype(str)
+            + " characters (max 20 for individuals). Either shorten the name or change TIN type "
+              "to EIN if this is a business.")
+
+
+def _ssn_segment_message(f: FormFrame, rows: pd.Series) -> pd.Series:
+    """E-file wording: the first all-zero segment of the SSN."""
+    digits = f.digits('tin')[rows]
+    return (('Invalid SSN serial number: ' + digits.str[5:])
+            .where(digits.str[3:5] != '00', 'Invalid SSN group number: 00')
+            .where(digits.str[:3] != '000', 'Invalid SSN area number: 000'))
+
+
+def _missing_field(column: str) -> str:
+    """CLI wording for a missing required column."""
+    return f'Missing required field: {column}'
+
+
+def _zip_digits(f: FormFrame) -> pd.Series:
+    return f.cached('zip_digits', 'zip', lambda: f.text('zip').str.replace('-', '', regex=False)
+                    .str.replace(' ', '', regex=False))
+
+
+def _zip_length(f: FormFrame, rows: pd.Series) -> pd.Series:
+    return _zip_digits(f)[rows].str.len().astype(str)
+
+
+def _federal_withheld(f: FormFrame) -> pd.Series:
+    def build() -> pd.Series:
+        nec = f.amount('nec_box4').fillna(0)
+        return nec.where(nec != 0, f.amount('misc_box4').fillna(0))
+    return f.cached('federal_withheld', '', build)
+
+
+def _total_income(f: FormFrame) -> pd.Series:
+    def build() -> pd.Series:
+        misc = sum(f.amount(box).fillna(0) for box in MISC_INCOME_BOXES)
+        return f.amount('nec_box1').fillna(0).where(f.upper('form_type') == '1099-NEC', misc)
+    return f.cached('total_income', '', build)
+
+
+def _money(values: pd.Series) -> pd.Series:
+    return values.map(lambda v: f'${v:,.2f}')
+
+
+def _amount_rules(field: str, label: str) -> List[Rule]:
+    # The importer names the field and the value it read
+    return [
+        Rule('INVALID_AMOUNT', field, 'error', lambda f: f.unreadable(field), f'{label} must be a number'),
+        Rule('NEGATIVE_AMOUNT', field, 'error', lambda f: f.amount(field) < 0, f'{label} cannot be negative',
+             messages={'import': lambda f, rows: f'{field} cannot be negative: ' + f.amount(field)[rows].astype(str)}),
+        Rule('AMOUNT_TOO_LARGE', field, 'error', lambda f: f.amount(field) > MAX_AMOUNT,
+             f'{label} exceeds maximum ({MAX_AMOUNT:,.2f})',
+             messages={'import': lambda f, rows: f'{field} exceeds maximum: ' + f.amount(field)[rows].astype(str)}),
+    ]
+
+
+def _zero_amount(field: str) -> Callable[[FormFrame], pd.Series]:
+    return lambda f: ~f.unreadable(field) & (f.amount(field).fillna(0) == 0)
+
+
+def _state_rules(n: int) -> List[Rule]:
+    code, withheld, income = f'state{n}_code', f'state{n}_withheld', f'state{n}_income'
+    return [
+        Rule('STATE_CODE_REQUIRED', code, 'error',
+             lambda f: f.positive(withheld) & ~f.present(code),
+             f'State {n} withholding requires a state code'),
+        Rule('INVALID_STATE_CODE', code, 'error',
+             lambda f: f.positive(withheld) & f.present(code) & ~f.upper(code).isin(VALID_STATES),
+             lambda f, rows: 'Invalid state code: ' + f.text(code)[rows]),
+        Rule('STATE_CODE_REQUIRED', code, 'warning',
+             lambda f: f.positive(income) & ~f.present(code),
+             f'State {n} income without state code'),
+    ]
+
+
+RECIPIENT_RULES: List[Rule] = [
+    # Name
+    Rule('MISSING_NAME', 'name', 'error', _missing('name'), 'Recipient name is required',
+         messages={'efile': 'Recipient name is missing', 'cli': _missing_field('recipient_name')}),
+    Rule('NAME_TOO_LONG', 'name', 'error', _longer_than('name', 80),
+         'Recipient name too long (max 80 characters)'),
+
+    # TIN
+    Rule('MISSING_TIN', 'tin', 'error', _missing('tin'), 'TIN is required',
+         messages={'efile': 'TIN is missing', 'cli': _missing_field('tin')}),
+    Rule('INVALID_TIN_LENGTH', 'tin', 'error',
+         lambda f: f.present('tin') & (f.digits('tin').str.len() != 9),
+         lambda f, rows: 'TIN must be 9 digits, got ' + f.digits('tin')[rows].str.len().astype(str),
+         messages={
+             'efile': lambda f, rows: 'TIN must be 9 digits (got ' + f.digits('tin')[rows].str.len().astype(str) + ')',
+             'cli': 'Recipient TIN must be exactly 9 digits.',
+         }),
+    Rule('INVALID_TIN', 'tin', 'error', lambda f: f.digits('tin') == '000000000', 'TIN cannot be all zeros'),
+    Rule('INVALID_SSN', 'tin', 'error', _ssn_segments, 'SSN contains invalid segment (all zeros)',
+         messages={'efile': _ssn_segment_message}),
+    Rule('INVALID_SSN', 'tin', 'error',
+         lambda f: (f.upper('tin_type') == 'SSN') & (f.digits('tin').str.len() == 9) & (f.digits('tin').str[:3] == '666'),
+         'SSN area number 666 is invalid', messages={'efile': 'Invalid SSN area number: 666'}),
+
+    # Payer TIN, when the frame carries one (worksheets)
+    Rule('INVALID_PAYER_TIN', 'payer_tin', 'error',
+         lambda f: f.present('payer_tin') & (f.digits('payer_tin').str.len() != 9),
+         lambda f, rows: 'Payer TIN must be 9 digits, got ' + f.digits('payer_tin')[rows].str.len().astype(str),
+         messages={'cli': 'Payer TIN must be exactly 9 digits.'}),
+
+    # TIN type vs. name (IRIS XML uses business or person name elements by TIN type)
+    Rule('TIN_TYPE_MISMATCH', 'tin_type', 'error',
+         lambda f: (f.upper('tin_type') == 'SSN') & _business_name(f),
+         lambda f, rows: "Name '" + f.text('name')[rows] + "' appears to be a business (LLC/Inc/Corp) but "
+                         "TIN type is SSN. This will cause XML validation errors. Please change TIN type to EIN."),
+    Rule('LAST_NAME_TOO_LONG', 'name', 'error', _individual_last_name_too_long, _last_name_message),
+
+    # Address
+    Rule('MISSING_ADDRESS', 'address1', 'error', _missing('address1'), 'Street address is required',
+         messages={'efile': 'Street address is missing', 'cli': _missing_field('address1')}),
+    Rule('ADDRESS_TOO_LONG', 'address1', 'error', _longer_than('address1', 40),
+         'Street address too long (max 40 characters)'),
+    Rule('ADDRESS_TOO_LONG', 'address2', 'warning', _longer_than('address2', 40),
+         'Address line 2 too long (max 40 characters)'),
+    Rule('MISSING_CITY', 'city', 'error', _missing('city'), 'City is required',
+         messages={'efile': 'City is missing', 'cli': _missing_field('city')}),
+    Rule('CITY_TOO_LONG', 'city', 'error', _longer_than('city', 25), 'City name too long (max 25 characters)'),
+    Rule('MISSING_STATE', 'state', 'error', _missing('state'), 'State is required',
+         messages={'efile': 'State is missing', 'filer': 'Filer state is missing', 'cli': _missing_field('state')}),
+    Rule('INVALID_STATE', 'state', 'error',
+         lambda f: f.present('state') & ~f.upper('state').isin(VALID_STATES),
+         lambda f, rows: 'Invalid state: ' + f.upper('state')[rows],
+         messages={
+             'efile': lambda f, rows: 'Invalid state code: ' + f.upper('state')[rows],
+             'filer': lambda f, rows: 'Invalid filer state code: ' + f.upper('state')[rows],
+             'cli': lambda f, rows: "State must be 2-letter US code; got '" + f.upper('state')[rows] + "'.",
+         }),
+    Rule('MISSING_ZIP', 'zip', 'error', _missing('zip'), 'ZIP code is required',
+         messages={'efile': 'ZIP code is missing', 'filer': 'Filer zip code is missing', 'cli': _missing_field('zip')}),
+    Rule('INVALID_ZIP', 'zip', 'error',
+         lambda f: f.present('zip') & ~_zip_digits(f).str.isdigit(),
+         'ZIP code must be numeric',
+         messages={'filer': 'Filer zip code must be numeric', 'cli': 'ZIP must be 12345 or 12345-6789.'}),
+    Rule('INVALID_ZIP', 'zip', 'error',
+         lambda f: _zip_digits(f).str.isdigit() & ~_zip_digits(f).str.len().isin((5, 9)),
+         lambda f, rows: 'ZIP must be 5 or 9 digits, got ' + _zip_length(f, rows),
+         messages={
+             'efile': lambda f, rows: 'ZIP code must be 5 or 9 digits (got ' + _zip_length(f, rows) + ')',
+             'filer': lambda f, rows: 'Filer zip code must be 5 or 9 digits (got ' + _zip_length(f, rows) + ')',
+             'cli': 'ZIP must be 12345 or 12345-6789.',
+         }),
+]
+
+FORM_RULES: List[Rule] = [
+    *[rule for field, label in AMOUNT_LABELS.items() for rule in _amount_rules(field, label)],
+
+    Rule('ZERO_AMOUNT', 'nec_box1', 'warning', _zero_amount('nec_box1'),
+         'Nonemployee compensation (Box 1) is zero - form may not be required', form_types=('1099-NEC',)),
+    Rule('ZERO_AMOUNT', 'amounts', 'warning',
+         lambda f: ~pd.concat([f.positive(box) for box in MISC_AMOUNT_BOXES], axis=1).any(axis=1),
+         'No amounts entered - form may not be required', form_types=('1099-MISC',)),
+    Rule('ZERO_AMOUNT', 's_box2_gross_proceeds', 'warning', _zero_amount('s_box2_gross_proceeds'),
+         'Gross proceeds (Box 2) is zero - form may not be required', form_types=('1099-S',)),
+    Rule('MISSING_PROPERTY', 's_box3_property_address', 'warning', _missing('s_box3_property_address'),
+         'Property address/description (Box 3) is empty', form_types=('1099-S',)),
+    Rule('ZERO_AMOUNT', 'f1098_box1_mortgage_interest', 'warning', _zero_amount('f1098_box1_mortgage_interest'),
+         'Mortgage interest (Box 1) is zero - form may not be required', form_types=('1098',)),
+
+    *_state_rules(1),
+    *_state_rules(2),
+
+    Rule('WITHHOLDING_EXCEEDS_INCOME', 'federal_withheld', 'warning',
+         lambda f: (_federal_withheld(f) > 0) & (_total_income(f) > 0) & (_federal_withheld(f) > _total_income(f)),
+         lambda f, rows: 'Federal withholding (' + _money(_federal_withheld(f)[rows]) + ') exceeds total income ('
+                         + _money(_total_income(f)[rows]) + ')',
+         form_types=('1099-NEC', '1099-MISC')),
+]
+
+RULES: List[Rule] = RECIPIENT_RULES + FORM_RULES
+
+# Checked on import: the recipient identity a row can't be stored without,
+# and amounts the database would reject. The rest (address lengths, TIN type
+# vs. name, zero amounts) can be fixed after import and is left to the
+# e-file check. All-zero TINs and invalid SSN segments only warn on import:
+# IRS test returns (see Test Returns/) use 000- SSNs and still have to import.
+# City and state are checked by the import normalizer itself, on the cell as
+# read (the stored state is cut to two letters, and a blank city is not an
+# error there).
+IMPORT_RULES: List[Rule] = [
+    replace(rule, severity='warning') if rule.code in ('INVALID_TIN', 'INVALID_SSN') else rule
+    for rule in rules_by_code(
+        'MISSING_NAME', 'MISSING_TIN', 'INVALID_TIN_LENGTH', 'INVALID_TIN', 'INVALID_SSN',
+        'MISSING_ZIP', 'INVALID_ZIP',
+        'NEGATIVE_AMOUNT', 'AMOUNT_TOO_LARGE',
+    )
+]
+
+# The filer's TIN, state and ZIP, checked by the e-file pre-check
+# (efile.validate_filer_data) with the same rules as the recipient's
+FILER_TIN_RULES: List[Rule] = rules_by_code('MISSING_TIN', 'INVALID_TIN_LENGTH', 'INVALID_TIN', 'INVALID_SSN')
+FILER_ADDRESS_RULES: List[Rule] = rules_by_code('MISSING_STATE', 'INVALID_STATE', 'MISSING_ZIP', 'INVALID_ZIP')
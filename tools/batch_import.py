@@ -0,0 +1,214 @@
+"""
+Headless batch importer.
+
+Quick-imports every workbook in a directory (the same import as the web
+upload's /api/imports/quick), several files at once, and writes a summary
+report with one line per file: filer, rows, errors and duration.
+
+Each file is spooled and hashed once (SpooledUpload). A file that was already
+imported for the operating year is skipped by quick_import's file-hash check,
+so re-running over the same directory only imports new or changed workbooks;
+--force imports everything again.
+
+Every import also runs its sheets in parallel (IMPORT_SHEET_WORKERS), so the
+number of threads is about --workers times that.
+
+CSV files have no Filer Information sheet; they are only imported with
+--filer-id, and are ignored otherwise. The report is never imported, even
+when it is written into the directory (the default).
+
+Usage:
+    python tools/batch_import.py "C:/Imports/2025 clients"
+    python tools/batch_import.py inbox --tax-year 2025 --workers 8
+    python tools/batch_import.py inbox --report season_report.csv --force
+"""
+
+import argparse
+import contextlib
+import csv
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Add src to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from supabase_client import get_supabase_client, get_current_operating_year
+from import_service import ImportService, SpooledUpload, skipped_rows
+
+WORKBOOK_SUFFIXES = ('.xlsx', '.xls')
+
+REPORT_COLUMNS = [
+    'file', 'status', 'filer', 'filer_id', 'total_rows', 'imported_rows', 'skipped_rows',
+    'flagged_rows', 'forms_created', 'forms_updated', 'seconds', 'errors',
+]
+
+
+def find_files(directory: Path, include_csv: bool, exclude: Optional[Path] = None) -> List[Path]:
+    """Workbooks (and CSVs if include_csv) directly in directory, by name, except exclude."""
+    suffixes = WORKBOOK_SUFFIXES + (('.csv',) if include_csv else ())
+    excluded = exclude.resolve() if exclude else None
+    return sorted(
+        path for path in directory.iterdir()
+        if path.is_file() and path.suffix.lower() in suffixes and not path.name.startswith('~$')
+        and path.resolve() != excluded
+    )
+
+
+def resolve_operating_year(operating_year_id: Optional[str], tax_year: Optional[int]) -> str:
+    """The operating year to import into: given by ID, by tax year, or the current one."""
+    if operating_year_id:
+        return operating_year_id
+    if tax_year:
+        rows = get_supabase_client().table('operating_years').select('id') \
+            .eq('tax_year', tax_year).limit(1).execute().data
+        if not rows:
+            raise SystemExit(f"No operating year for tax year {tax_year}")
+        return rows[0]['id']
+    return get_current_operating_year()['id']
+
+
+def import_file(
+    path: Path,
+    operating_year_id: str,
+    filer_id: Optional[str],
+    force: bool,
+    delete_missing: bool,
+) -> Dict[str, Any]:
+    """Quick-import one file; returns its report line (never raises)."""
+    started = time.perf_counter()
+    line: Dict[str, Any] = {column: '' for column in REPORT_COLUMNS}
+    line['file'] = path.name
+
+    try:
+        with open(path, 'rb') as stream, SpooledUpload.from_stream(stream, path.suffix.lower()) as upload:
+            result = ImportService().quick_import(
+                file_content=upload,
+                filename=path.name,
+                operating_year_id=operating_year_id,
+                filer_id=filer_id,
+                force=force,
+                delete_missing=delete_missing,
+            )
+    except Exception as e:
+        line.update(status='failed', errors=str(e), seconds=round(time.perf_counter() - started, 3))
+        return line
+
+    skipped = skipped_rows(result['row_errors'])
+    if result.get('duplicate_of'):
+        status = 'already imported'
+    elif result['imported_rows'] == 0:
+        status = 'failed'
+    elif result['errors'] or skipped:
+        status = 'partial'
+    else:
+        status = 'imported'
+
+    line.update(
+        status=status,
+        filer=(result.get('filer_data') or {}).get('name', ''),
+        filer_id=result.get('filer_id') or '',
+        total_rows=result['total_rows'],
+        imported_rows=result['imported_rows'],
+        skipped_rows=skipped,
+        flagged_rows=len(result['row_errors']) - skipped,
+        forms_created=len(result['forms_created']),
+        forms_updated=len(result['forms_updated']),
+        seconds=round(time.perf_counter() - started, 3),
+        errors='; '.join(result['errors']),
+    )
+    return line
+
+
+def run_batch(
+    files: List[Path],
+    operating_year_id: str,
+    workers: int,
+    filer_id: Optional[str] = None,
+    force: bool = False,
+    delete_missing: bool = False,
+    verbose: bool = False,
+) -> List[Dict[str, Any]]:
+    """
+    Import files with up to workers at once; report lines come back in files order.
+
+    Progress goes to stderr. The import service's debug output is dropped
+    unless verbose.
+    """
+    lines: Dict[Path, Dict[str, Any]] = {}
+
+    def run(path: Path) -> Dict[str, Any]:
+        if path.suffix.lower() == '.csv' and not filer_id:
+            return {**{column: '' for column in REPORT_COLUMNS}, 'file': path.name, 'status': 'skipped',
+                    'seconds': 0, 'errors': 'CSV files need --filer-id'}
+        return import_file(path, operating_year_id, filer_id, force, delete_missing)
+
+    with contextlib.ExitStack() as stack:
+        if not verbose:
+            stack.enter_context(contextlib.redirect_stdout(stack.enter_context(open(os.devnull, 'w'))))
+        pool = stack.enter_context(ThreadPoolExecutor(max_workers=workers, thread_name_prefix="batch-import"))
+        futures = {pool.submit(run, path): path for path in files}
+        for future in as_completed(futures):
+            line = future.result()
+            lines[futures[future]] = line
+            print(f"[{len(lines)}/{len(files)}] {line['file']}: {line['status']}, "
+                  f"{line['imported_rows'] or 0} rows imported ({line['seconds']}s)", file=sys.stderr)
+
+    return [lines[path] for path in files]
+
+
+def write_report(lines: List[Dict[str, Any]], path: Path) -> None:
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=REPORT_COLUMNS)
+        writer.writeheader()
+        writer.writerows(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Quick-import every workbook in a directory")
+    parser.add_argument("directory", type=Path, help="Directory of .xlsx/.xls workbooks")
+    parser.add_argument("--operating-year-id", help="Operating year to import into (default: the current one)")
+    parser.add_argument("--tax-year", type=int, help="Pick the operating year by tax year instead")
+    parser.add_argument("--workers", type=int, default=int(os.getenv("BATCH_IMPORT_WORKERS", "4")),
+                        help="Files imported at once (default: 4)")
+    parser.add_argument("--filer-id", help="Filer for CSV files (CSVs are skipped without it)")
+    parser.add_argument("--report", type=Path, help="Summary CSV to write (default: DIRECTORY/import_report.csv)")
+    parser.add_argument("--force", action="store_true", help="Re-import files that were already imported")
+    parser.add_argument("--delete-missing", action="store_true",
+                        help="Delete draft/ready forms no longer in a re-imported file")
+    parser.add_argument("--verbose", action="store_true", help="Show the import service's debug output")
+    args = parser.parse_args()
+
+    if not args.directory.is_dir():
+        raise SystemExit(f"Not a directory: {args.directory}")
+
+    report = args.report or args.directory / "import_report.csv"
+    files = find_files(args.directory, include_csv=bool(args.filer_id), exclude=report)
+    if not files:
+        print(f"No workbooks found in {args.directory}")
+        return 0
+
+    operating_year_id = resolve_operating_year(args.operating_year_id, args.tax_year)
+    started = time.perf_counter()
+    lines = run_batch(files, operating_year_id, max(1, args.workers), filer_id=args.filer_id,
+                      force=args.force, delete_missing=args.delete_missing, verbose=args.verbose)
+
+    write_report(lines, report)
+
+    counts: Dict[str, int] = {}
+    for line in lines:
+        counts[line['status']] = counts.get(line['status'], 0) + 1
+    print(f"{len(lines)} files in {time.perf_counter() - started:.1f}s: "
+          + ", ".join(f"{n} {status}" for status, n in sorted(counts.items())))
+    print(f"Rows imported: {sum(line['imported_rows'] or 0 for line in lines)}")
+    print(f"Report: {report}")
+
+    return 1 if counts.get('failed') else 0
+
+
+if __name__ == "__main__":
+    exit(main())
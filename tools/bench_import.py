@@ -0,0 +1,315 @@
+"""
+Import throughput benchmark.
+
+Generates multi-sheet workbooks (Filer Information + 1099-NEC, 1099-MISC,
+1099-S and 1098 sheets, built from 1099-Template.xlsx) at several sizes and
+runs the import pipeline against an in-memory database stand-in
+(tools/local_supabase.py):
+
+    quick_import       one-step import straight to recipients/forms
+    quick_reimport     the same workbook again (force=True); nothing changed
+    import_all_sheets  staging: one batch per sheet, raw rows stored
+    normalize_batch    every batch from import_all_sheets
+    promote_batch      every normalized batch
+
+For each stage it reports rows/sec, round trips per row (requests that would
+go to Supabase) and peak Python memory (tracemalloc, including rows held by
+the stand-in). Each size runs twice: once timed, once under tracemalloc.
+
+Results are checked against tools/import_bench_thresholds.json; the exit code
+is 1 if any stage is slower, chattier or bigger than its threshold. Round
+trips are exact and machine-independent; rows/sec and memory thresholds are
+set loose enough for a laptop.
+
+The 100,000-row size takes about 20 minutes (mostly the tracemalloc pass);
+use --sizes 1000 10000 for a quick check.
+
+--latency-ms adds a delay to every request, as a network round trip to
+Supabase would. Thresholds assume no latency, so combine it with --no-check;
+it shows how much the concurrent sheet workers (IMPORT_SHEET_WORKERS) save.
+
+Usage:
+    python tools/bench_import.py
+    python tools/bench_import.py --sizes 1000 10000
+    python tools/bench_import.py --json bench_output.txt
+    python tools/bench_import.py --sizes 10000 --latency-ms 20 --no-check
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from openpyxl import load_workbook
+
+# Add src and tools to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
+sys.path.insert(0, str(PROJECT_ROOT / "tools"))
+
+import supabase_client
+from import_service import ImportService
+from local_supabase import LocalSupabase
+
+TEMPLATE = PROJECT_ROOT / "1099-Template.xlsx"
+THRESHOLDS = PROJECT_ROOT / "tools" / "import_bench_thresholds.json"
+
+DEFAULT_SIZES = [1000, 10000, 100000]
+STAGES = ['quick_import', 'quick_reimport', 'import_all_sheets', 'normalize_batch', 'promote_batch']
+
+# Share of rows per data sheet
+SHEET_MIX = {'1099-NEC': 0.55, '1099-MISC': 0.25, '1099-S': 0.1, '1098': 0.1}
+
+FIRST_NAMES = ['Aaron', 'Bobby', 'Charlie', 'Delroy', 'Eliza', 'James', 'Kevin', 'Maria', 'Nina', 'Omar']
+LAST_NAMES = ['Walker', 'Hughes', 'Rivera', 'Nguyen', 'Patel', 'Okafor', 'Larsen', 'Moreau', 'Tanaka', 'Bishop']
+STREETS = ['Main St', 'Oak Ave', 'Hawthorne Ave', 'West St', 'Peachtree Rd', 'Lake Dr']
+CITIES = [('Athens', 'GA', '306'), ('Atlanta', 'GA', '303'), ('Austin', 'TX', '787'), ('Denver', 'CO', '802')]
+
+
+# =============================================================================
+# Workbook generation
+# =============================================================================
+
+def _recipient(rng: random.Random, n: int) -> List[Any]:
+    """RecipientTaxID .. EMailAddress columns (same order in every template sheet)."""
+    city, state, zip_prefix = rng.choice(CITIES)
+    return [
+        f"{101 + n // (9999 * 99):03d}-{(n // 9999) % 99 + 1:02d}-{n % 9999 + 1:04d}",
+        f"ACCT-{n:07d}",
+        None,
+        f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+        None,
+        f"{rng.randint(1, 9999)} {rng.choice(STREETS)}",
+        city,
+        state,
+        f"{zip_prefix}{rng.randint(0, 99):02d}",
+        None,
+    ]
+
+
+def _amount(rng: random.Random) -> str:
+    return f"{rng.randint(600, 250000)}.{rng.randint(0, 99):02d}"
+
+
+def _form_values(rng: random.Random, sheet: str, width: int) -> List[Any]:
+    """Box columns for one row of a template sheet."""
+    values: List[Any] = [None] * width
+    if sheet == '1099-NEC':
+        values[0] = _amount(rng)                        # Box1_NEC
+    elif sheet == '1099-MISC':
+        values[1] = _amount(rng)                        # Box1_RENTS
+        if rng.random() < 0.3:
+            values[3] = _amount(rng)                    # Box3_OtherIncome
+    elif sheet == '1099-S':
+        values[0] = f"{rng.randint(1, 12):02d}/{rng.randint(1, 28):02d}/2025"   # BOX1 date of closing
+        values[1] = _amount(rng)                        # BOX2 gross proceeds
+        values[2] = f"{rng.randint(1, 9999)} {rng.choice(STREETS)}"              # BOX3 address
+    elif sheet == '1098':
+        values[0] = _amount(rng)                        # BOX1 mortgage interest
+        values[1] = _amount(rng)                        # BOX2 outstanding principal
+        values[2] = f"{rng.randint(1, 12):02d}/{rng.randint(1, 28):02d}/2019"   # BOX3 origination date
+    return values
+
+
+def generate_workbook(rows: int, seed: int = 1099) -> bytes:
+    """Template workbook filled with `rows` recipients spread over the data sheets."""
+    rng = random.Random(seed)
+    wb = load_workbook(TEMPLATE)
+
+    filer = wb['Filer Information']
+    filer_values = {
+        'Filing Year': '2025',
+        'Company / Filer TaxID': '58-1234567',
+        'Company / Filer Name1': 'Benchmark Holdings LLC',
+        'Address1': '100 Main Street',
+        'City': 'Atlanta',
+        'State': 'GA',
+        'ZipCode': '30301',
+        'TelephoneNumber': '4045551234',
+    }
+    for cells in filer.iter_rows(min_col=1, max_col=2):
+        label = cells[0].value.strip() if isinstance(cells[0].value, str) else None
+        if label in filer_values:
+            cells[1].value = filer_values[label]
+
+    n = 0
+    for sheet, share in SHEET_MIX.items():
+        ws = wb[sheet]
+        box_columns = ws.max_column - 10
+        for _ in range(round(rows * share)):
+            n += 1
+            ws.append(_recipient(rng, n) + _form_values(rng, sheet, box_columns))
+
+    out = io.BytesIO()
+    wb.save(out)
+    return out.getvalue()
+
+
+# =============================================================================
+# Benchmark
+# =============================================================================
+
+def _fresh_database(latency: float = 0.0) -> Tuple[LocalSupabase, str]:
+    """Empty stand-in with one operating year, installed as the service client."""
+    db = LocalSupabase(latency=latency)
+    supabase_client._service_client = db
+    year = db.table('operating_years').insert({'tax_year': 2025, 'name': '2025'}).execute().data[0]
+    db.round_trips = 0
+    return db, year['id']
+
+
+def _run_pipeline(
+    content: bytes, filename: str, measure_memory: bool, latency: float = 0.0
+) -> Dict[str, Dict[str, Any]]:
+    """Run every stage once; returns {stage: {'rows', 'seconds', 'round_trips', 'peak_bytes'}}."""
+    results: Dict[str, Dict[str, Any]] = {}
+
+    def stage(name: str, db: LocalSupabase, fn):
+        db.round_trips = 0
+        if measure_memory:
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+        started = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            rows = fn()
+        seconds = time.perf_counter() - started
+        results[name] = {
+            'rows': rows,
+            'seconds': seconds,
+            'round_trips': db.round_trips,
+            'peak_bytes': tracemalloc.get_traced_memory()[1] - baseline if measure_memory else None,
+        }
+
+    # One-step import into an empty database
+    db, year_id = _fresh_database(latency)
+    service = ImportService()
+
+    def quick() -> int:
+        result = service.quick_import(content, filename, year_id, force=True)
+        if result['errors']:
+            raise RuntimeError(f"quick_import failed: {result['errors']}")
+        return result['total_rows']
+
+    stage('quick_import', db, quick)
+    stage('quick_reimport', db, quick)
+
+    # Staging pipeline into another empty database
+    db, year_id = _fresh_database(latency)
+    service = ImportService()
+    staged: Dict[str, Any] = {}
+
+    def upload() -> int:
+        staged.update(service.import_all_sheets(content, filename, year_id))
+        failed = [s for s in staged['sheets_imported'] if s['error']]
+        if staged['errors'] or failed:
+            raise RuntimeError(f"import_all_sheets failed: {staged['errors'] or failed}")
+        return staged['total_rows']
+
+    def normalize() -> int:
+        return sum(
+            sum(service.normalize_batch(sheet['batch_id']).values())
+            for sheet in staged['sheets_imported']
+        )
+
+    def promote() -> int:
+        for sheet in staged['sheets_imported']:
+            service.promote_batch(sheet['batch_id'], staged['filer_id'])
+        return staged['total_rows']
+
+    stage('import_all_sheets', db, upload)
+    stage('normalize_batch', db, normalize)
+    stage('promote_batch', db, promote)
+
+    return results
+
+
+def benchmark(rows: int, latency: float = 0.0) -> Dict[str, Dict[str, Any]]:
+    content = generate_workbook(rows)
+    filename = f"bench_{rows}.xlsx"
+
+    timed = _run_pipeline(content, filename, measure_memory=False, latency=latency)
+    tracemalloc.start()
+    try:
+        traced = _run_pipeline(content, filename, measure_memory=True)
+    finally:
+        tracemalloc.stop()
+
+    report = {}
+    for name in STAGES:
+        r = timed[name]
+        report[name] = {
+            'rows': r['rows'],
+            'seconds': round(r['seconds'], 3),
+            'rows_per_second': round(r['rows'] / r['seconds'], 1) if r['seconds'] else None,
+            'round_trips': r['round_trips'],
+            'round_trips_per_row': round(r['round_trips'] / r['rows'], 4) if r['rows'] else None,
+            'peak_memory_mb': round(traced[name]['peak_bytes'] / (1024 * 1024), 1),
+        }
+    return report
+
+
+def check_thresholds(size: int, report: Dict[str, Dict[str, Any]], thresholds: Dict[str, Any]) -> List[str]:
+    """Threshold violations for one size (sizes missing from the file are not checked)."""
+    limits = thresholds.get('sizes', {}).get(str(size), {})
+    failures = []
+    for name, limit in limits.items():
+        r = report.get(name)
+        if not r:
+            continue
+        if 'min_rows_per_second' in limit and r['rows_per_second'] < limit['min_rows_per_second']:
+            failures.append(f"{size} rows {name}: {r['rows_per_second']} rows/s < {limit['min_rows_per_second']}")
+        if 'max_round_trips_per_row' in limit and r['round_trips_per_row'] > limit['max_round_trips_per_row']:
+            failures.append(f"{size} rows {name}: {r['round_trips_per_row']} round trips/row > {limit['max_round_trips_per_row']}")
+        if 'max_peak_memory_mb' in limit and r['peak_memory_mb'] > limit['max_peak_memory_mb']:
+            failures.append(f"{size} rows {name}: {r['peak_memory_mb']} MB peak > {limit['max_peak_memory_mb']} MB")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the import pipeline against an in-memory database")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                        help="Workbook sizes in rows (default: 1000 10000 100000)")
+    parser.add_argument("--json", metavar="PATH", help="Also write the results as JSON to PATH")
+    parser.add_argument("--no-check", action="store_true", help="Report only; don't compare to thresholds")
+    parser.add_argument("--latency-ms", type=float, default=0.0,
+                        help="Simulated round-trip latency per request, in the timed pass (default: 0)")
+    args = parser.parse_args()
+
+    thresholds = json.loads(THRESHOLDS.read_text())
+    results: Dict[str, Any] = {}
+    failures: List[str] = []
+
+    print(f"{'rows':>8}  {'stage':<18} {'seconds':>9} {'rows/s':>10} {'trips':>7} {'trips/row':>10} {'peak MB':>8}")
+    for size in args.sizes:
+        report = benchmark(size, latency=args.latency_ms / 1000)
+        results[str(size)] = report
+        for name, r in report.items():
+            print(f"{size:>8}  {name:<18} {r['seconds']:>9.3f} {r['rows_per_second']:>10,.0f} "
+                  f"{r['round_trips']:>7} {r['round_trips_per_row']:>10.4f} {r['peak_memory_mb']:>8.1f}")
+        if not args.no_check:
+            failures.extend(check_thresholds(size, report, thresholds))
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2))
+
+    if failures:
+        print()
+        print("FAIL: import benchmark thresholds exceeded")
+        for failure in failures:
+            print(f"  {failure}")
+        return 1
+
+    if not args.no_check:
+        print()
+        print("PASS: all stages within thresholds")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,499 @@
+"""
+In-memory stand-in for the Supabase client, for benchmarks.
+
+Implements the part of the supabase-py / PostgREST query builder that
+ImportService uses (select / insert / update / upsert / delete with eq, neq,
+gt, in_, is_, contains, order, range, limit, single) plus the
+promote_import_batch RPC from migration 015 and import_batch_error_summary
+from migration 018. Every execute() counts as one round trip, so callers can
+measure how many requests an import would send to the real API.
+
+Payloads go through a JSON encode/decode on the way in and out, as they would
+over HTTP. Rows get id / created_at / updated_at and the column defaults in
+COLUMN_DEFAULTS, updates bump updated_at (like the updated_at triggers), and
+forms_1099.original_key is filled in like the generated column from
+migration 014.
+
+Requests are served one at a time (a lock around execute()), so the import's
+worker threads can share one stand-in. Pass latency (seconds) to make every
+request wait that long outside the lock, like a network round trip; that is
+the wait concurrent sheet workers overlap.
+
+This is not a database: there are no constraints beyond upsert conflict keys,
+no RLS and no transactions.
+
+Usage:
+    import supabase_client
+    from local_supabase import LocalSupabase
+
+    db = LocalSupabase()
+    supabase_client._service_client = db   # ImportService and log_activity use it
+    ...
+    print(db.round_trips)
+"""
+
+import json
+import time
+import uuid
+import itertools
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Any, Dict, List, Callable, Iterable
+
+# Logical clock: every write gets a later timestamp, even within one microsecond
+_EPOCH = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+# Column defaults the import code relies on (see database/*.sql)
+COLUMN_DEFAULTS = {
+    'forms_1099': {'status': 'draft', 'is_correction': False},
+    'recipients': {'tin_type': 'SSN'},
+    'import_batches': {'status': 'uploaded'},
+    'import_rows': {'status': 'pending'},
+}
+
+
+class LocalTable:
+    """Rows of one table, with equality indexes built on first use."""
+
+    def __init__(self):
+        self.rows: Dict[str, dict] = {}
+        self._order: Dict[str, int] = {}
+        self._seq = itertools.count()
+        self._indexes: Dict[str, Dict[Any, set]] = {}
+
+    def index(self, column: str) -> Dict[Any, set]:
+        if column not in self._indexes:
+            index: Dict[Any, set] = {}
+            for row_id, row in self.rows.items():
+                index.setdefault(_hashable(row.get(column)), set()).add(row_id)
+            self._indexes[column] = index
+        return self._indexes[column]
+
+    def find(self, equals: Dict[str, Any]) -> List[dict]:
+        """Rows matching every column = value filter, in insertion order."""
+        if not equals:
+            return list(self.rows.values())
+        wanted = {col: _hashable(value) for col, value in equals.items()}
+        smallest = min((self.index(col).get(value, set()) for col, value in wanted.items()), key=len)
+        return [
+            self.rows[row_id] for row_id in sorted(smallest, key=self._order.__getitem__)
+            if all(_hashable(self.rows[row_id].get(col)) == value for col, value in wanted.items())
+        ]
+
+    def add(self, row: dict) -> None:
+        self.rows[row['id']] = row
+        self._order[row['id']] = next(self._seq)
+        for column, index in self._indexes.items():
+            index.setdefault(_hashable(row.get(column)), set()).add(row['id'])
+
+    def change(self, row: dict, changes: dict) -> None:
+        for column, index in self._indexes.items():
+            if column in changes:
+                index.get(_hashable(row.get(column)), set()).discard(row['id'])
+                index.setdefault(_hashable(changes[column]), set()).add(row['id'])
+        row.update(changes)
+
+    def remove(self, row_id: str) -> None:
+        row = self.rows.pop(row_id)
+        del self._order[row_id]
+        for column, index in self._indexes.items():
+            index.get(_hashable(row.get(column)), set()).discard(row_id)
+
+
+class LocalResponse:
+    """Mimics postgrest's APIResponse."""
+
+    def __init__(self, data: Any, count: Optional[int] = None):
+        self.data = data
+        self.count = count
+
+
+class LocalQuery:
+    """One PostgREST request against a LocalSupabase table."""
+
+    def __init__(self, db: "LocalSupabase", table: str):
+        self._db = db
+        self._table = table
+        self._op = 'select'
+        self._columns: Optional[List[str]] = None
+        self._payload: Any = None
+        self._on_conflict: Optional[str] = None
+        self._ignore_duplicates = False
+        self._equals: Dict[str, Any] = {}
+        self._filters: List[Callable[[dict], bool]] = []
+        self._order: List[tuple] = []
+        self._range: Optional[tuple] = None
+        self._limit: Optional[int] = None
+        self._single = False
+        self._count: Optional[str] = None
+
+    # -- request type -------------------------------------------------------
+
+    def select(self, columns: str = '*', count: Optional[str] = None, **_) -> "LocalQuery":
+        self._op = 'select'
+        self._count = count
+        if columns.strip() != '*':
+            self._columns = [c.strip() for c in columns.split(',')]
+        return self
+
+    def insert(self, payload: Any, **_) -> "LocalQuery":
+        self._op, self._payload = 'insert', payload
+        return self
+
+    def update(self, payload: dict, **_) -> "LocalQuery":
+        self._op, self._payload = 'update', payload
+        return self
+
+    def upsert(self, payload: Any, on_conflict: str = 'id', ignore_duplicates: bool = False, **_) -> "LocalQuery":
+        self._op, self._payload, self._on_conflict = 'upsert', payload, on_conflict
+        self._ignore_duplicates = ignore_duplicates
+        return self
+
+    def delete(self, **_) -> "LocalQuery":
+        self._op = 'delete'
+        return self
+
+    # -- filters and modifiers ----------------------------------------------
+
+    def eq(self, column: str, value: Any) -> "LocalQuery":
+        self._equals[column] = value
+        return self
+
+    def neq(self, column: str, value: Any) -> "LocalQuery":
+        self._filters.append(lambda row: row.get(column) != value)
+        return self
+
+    def gt(self, column: str, value: Any) -> "LocalQuery":
+        self._filters.append(lambda row: row.get(column) is not None and row.get(column) > value)
+        return self
+
+    def contains(self, column: str, value: Any) -> "LocalQuery":
+        # JSONB @>; postgrest sends a str value as is
+        pattern = json.loads(value) if isinstance(value, str) else value
+        self._filters.append(lambda row: _jsonb_contains(row.get(column), pattern))
+        return self
+
+    def in_(self, column: str, values: Iterable[Any]) -> "LocalQuery":
+        allowed = {_hashable(v) for v in values}
+        self._filters.append(lambda row: _hashable(row.get(column)) in allowed)
+        return self
+
+    def is_(self, column: str, value: Any) -> "LocalQuery":
+        expected = None if value in (None, 'null') else value
+        self._filters.append(lambda row: row.get(column) is expected)
+        return self
+
+    def order(self, column: str, desc: bool = False, **_) -> "LocalQuery":
+        self._order.append((column, desc))
+        return self
+
+    def range(self, start: int, end: int) -> "LocalQuery":
+        self._range = (start, end)
+        return self
+
+    def limit(self, size: int, **_) -> "LocalQuery":
+        self._limit = size
+        return self
+
+    def single(self) -> "LocalQuery":
+        self._single = True
+        return self
+
+    # -- execution ----------------------------------------------------------
+
+    def execute(self) -> LocalResponse:
+        return self._db.request(self._execute)
+
+    def _execute(self) -> LocalResponse:
+        table = self._db.table_rows(self._table)
+        payload = _over_the_wire(self._payload)
+
+        if self._op == 'select':
+            rows = self._matching(table)
+            total = len(rows)
+            for column, desc in reversed(self._order):
+                rows.sort(key=lambda r: _sort_key(r.get(column)), reverse=desc)
+            if self._range:
+                rows = rows[self._range[0]:self._range[1] + 1]
+            if self._limit is not None:
+                rows = rows[:self._limit]
+            if self._columns:
+                rows = [{c: r.get(c) for c in self._columns} for r in rows]
+            data: Any = _over_the_wire(rows)
+            if self._single:
+                if len(data) != 1:
+                    raise Exception(f"JSON object requested, multiple (or no) rows returned ({len(data)})")
+                data = data[0]
+            return LocalResponse(data, total if self._count else None)
+
+        if self._op == 'insert':
+            rows = payload if isinstance(payload, list) else [payload]
+            return LocalResponse(_over_the_wire([self._db.insert_row(self._table, r) for r in rows]))
+
+        if self._op == 'update':
+            written = []
+            for row in self._matching(table):
+                table.change(row, {**payload, 'updated_at': self._db.now()})
+                written.append(row)
+            return LocalResponse(_over_the_wire(written))
+
+        if self._op == 'upsert':
+            rows = payload if isinstance(payload, list) else [payload]
+            key_columns = [c.strip() for c in self._on_conflict.split(',')]
+            seen = set()
+            written = []
+            for row in rows:
+                row = self._db.with_generated_columns(self._table, row)
+                key = tuple(_hashable(row.get(c)) for c in key_columns)
+                if key in seen:
+                    raise Exception("ON CONFLICT DO UPDATE command cannot affect row a second time")
+                seen.add(key)
+                # NULLs never conflict, as in a Postgres unique index
+                matches = [] if None in key else table.find({c: row.get(c) for c in key_columns})
+                if matches and self._ignore_duplicates:
+                    continue  # ON CONFLICT DO NOTHING
+                if matches:
+                    existing = matches[0]
+                    changes = {k: v for k, v in row.items() if k not in ('id', 'created_at')}
+                    table.change(existing, {**changes, 'updated_at': self._db.now()})
+                    written.append(existing)
+                else:
+                    written.append(self._db.insert_row(self._table, row))
+            return LocalResponse(_over_the_wire(written))
+
+        if self._op == 'delete':
+            removed = self._matching(table)
+            for row in removed:
+                table.remove(row['id'])
+            return LocalResponse(_over_the_wire(removed))
+
+        raise ValueError(f"Unsupported operation: {self._op}")
+
+    def _matching(self, table: LocalTable) -> List[dict]:
+        return [row for row in table.find(self._equals) if all(f(row) for f in self._filters)]
+
+
+class LocalRPC:
+    """A pending client.rpc() call."""
+
+    def __init__(self, db: "LocalSupabase", fn: str, params: dict):
+        self._db = db
+        self._fn = fn
+        self._params = params
+
+    def execute(self) -> LocalResponse:
+        return self._db.request(self._execute)
+
+    def _execute(self) -> LocalResponse:
+        if self._fn not in self._db.functions:
+            raise Exception(f"Could not find the function public.{self._fn}")
+        return LocalResponse(_over_the_wire(self._db.functions[self._fn](self._db, _over_the_wire(self._params))))
+
+
+class LocalSupabase:
+    """In-memory database with the Supabase client's table() / rpc() interface."""
+
+    def __init__(self, latency: float = 0.0):
+        self.tables: Dict[str, LocalTable] = {}
+        self.round_trips = 0
+        self.latency = latency
+        self._lock = threading.Lock()
+        self.functions: Dict[str, Callable[["LocalSupabase", dict], Any]] = {
+            'promote_import_batch': promote_import_batch,
+            'import_batch_error_summary': import_batch_error_summary,
+        }
+        self._clock = itertools.count(1)
+
+    def table(self, name: str) -> LocalQuery:
+        return LocalQuery(self, name)
+
+    def request(self, handle: Callable[[], LocalResponse]) -> LocalResponse:
+        """Serve one request: count it, wait out the latency, then run it under the lock."""
+        if self.latency:
+            time.sleep(self.latency)
+        with self._lock:
+            self.round_trips += 1
+            return handle()
+
+    def rpc(self, fn: str, params: Optional[dict] = None) -> LocalRPC:
+        return LocalRPC(self, fn, params or {})
+
+    def table_rows(self, name: str) -> LocalTable:
+        return self.tables.setdefault(name, LocalTable())
+
+    def now(self) -> str:
+        return (_EPOCH + timedelta(microseconds=next(self._clock))).isoformat()
+
+    def with_generated_columns(self, table: str, row: dict) -> dict:
+        if table == 'forms_1099':
+            return {**row, 'original_key': None if row.get('is_correction') else True}
+        return row
+
+    def insert_row(self, table: str, row: dict) -> dict:
+        now = self.now()
+        row = {'id': str(uuid.uuid4()), **COLUMN_DEFAULTS.get(table, {}),
+               **self.with_generated_columns(table, row), 'created_at': now, 'updated_at': now}
+        self.table_rows(table).add(row)
+        return row
+
+
+# =============================================================================
+# RPC functions
+# =============================================================================
+
+# Columns copied from import_rows to forms_1099 by promote_import_batch, with
+# the column default used when the staging value is empty
+_PROMOTED_FORM_DEFAULTS = {
+    'nec_box1': 0, 'nec_box4': 0,
+    'misc_box1': 0, 'misc_box2': 0, 'misc_box3': 0, 'misc_box4': 0, 'misc_box5': 0, 'misc_box6': 0,
+    'misc_box8': 0, 'misc_box9': 0, 'misc_box10': 0, 'misc_box11': 0, 'misc_box12': 0, 'misc_box14': 0,
+    's_box1_date_closing': None, 's_box2_gross_proceeds': 0, 's_box3_property_address': None,
+    's_box4_property_services': False, 's_box5_foreign_person': False, 's_box6_buyers_tax': 0,
+    'f1098_box1_mortgage_interest': 0, 'f1098_box2_outstanding_principal': 0,
+    'f1098_box3_origination_date': None, 'f1098_box4_refund_interest': 0,
+    'f1098_box5_mortgage_insurance': 0, 'f1098_box6_points_paid': 0,
+    'f1098_box8_property_address': None, 'f1098_box9_num_properties': None,
+    'f1098_box10_other': 0, 'f1098_box11_acquisition_date': None,
+    'state1_code': None, 'state1_id': None, 'state1_income': 0, 'state1_withheld': 0,
+}
+
+
+def promote_import_batch(db: LocalSupabase, params: dict) -> dict:
+    """Same rules as public.promote_import_batch (migration 015)."""
+    batch_id, filer_id = params['p_batch_id'], params['p_filer_id']
+    batches = db.table_rows('import_batches')
+    if batch_id not in batches.rows:
+        raise Exception(f"Import batch {batch_id} not found")
+    operating_year_id = batches.rows[batch_id]['operating_year_id']
+
+    import_rows = db.table_rows('import_rows')
+    recipients = db.table_rows('recipients')
+    forms = db.table_rows('forms_1099')
+
+    valid = sorted(import_rows.find({'batch_id': batch_id, 'status': 'valid'}), key=lambda r: r['row_number'])
+
+    def recipient_for(tin: Any) -> Optional[dict]:
+        found = recipients.find({'filer_id': filer_id, 'tin': tin})
+        return found[0] if found else None
+
+    recipients_created = 0
+    for row in valid:
+        if recipient_for(row.get('recipient_tin')) is None:
+            db.insert_row('recipients', {
+                'filer_id': filer_id,
+                'name': row.get('recipient_name'),
+                'name_line_2': row.get('recipient_name_line2'),
+                'tin': row.get('recipient_tin'),
+                'tin_type': row.get('recipient_tin_type') or 'SSN',
+                'address1': row.get('recipient_address1'),
+                'address2': row.get('recipient_address2'),
+                'city': row.get('recipient_city'),
+                'state': row.get('recipient_state'),
+                'zip': row.get('recipient_zip'),
+                'account_number': row.get('account_number'),
+            })
+            recipients_created += 1
+
+    forms_created = skipped = 0
+    seen = set()
+    for row in valid:
+        recipient = recipient_for(row.get('recipient_tin'))
+        form_type = row.get('form_type') or '1099-NEC'
+        key = (recipient['id'], form_type)
+        exists = key in seen or bool(forms.find({
+            'filer_id': filer_id,
+            'recipient_id': recipient['id'],
+            'operating_year_id': operating_year_id,
+            'form_type': form_type,
+            'original_key': True,
+        }))
+        seen.add(key)
+        if exists:
+            import_rows.change(row, {'validation_errors': [{
+                'field': 'promotion',
+                'code': 'FORM_EXISTS',
+                'message': f"A {form_type} form already exists for this recipient and year",
+                'severity': 'error',
+            }], 'updated_at': db.now()})
+            skipped += 1
+            continue
+
+        form = db.insert_row('forms_1099', {
+            'filer_id': filer_id,
+            'recipient_id': recipient['id'],
+            'operating_year_id': operating_year_id,
+            'form_type': form_type,
+            'status': 'draft',
+            **{col: default if row.get(col) is None else row[col]
+               for col, default in _PROMOTED_FORM_DEFAULTS.items()},
+        })
+        import_rows.change(row, {
+            'promoted_recipient_id': recipient['id'],
+            'promoted_form_id': form['id'],
+            'status': 'promoted',
+            'updated_at': db.now(),
+        })
+        forms_created += 1
+
+    batches.change(batches.rows[batch_id], {
+        'status': 'promoted',
+        'filer_id': filer_id,
+        'promoted_at': db.now(),
+    })
+
+    return {
+        'recipients_created': recipients_created,
+        'forms_created': forms_created,
+        'skipped': skipped,
+    }
+
+
+def import_batch_error_summary(db: LocalSupabase, params: dict) -> List[dict]:
+    """Same result as public.import_batch_error_summary (migration 018)."""
+    rows: Dict[tuple, set] = {}
+    for row in db.table_rows('import_rows').find({'batch_id': params['p_batch_id']}):
+        errors = row.get('validation_errors')
+        for error in errors if isinstance(errors, list) else []:
+            key = (error.get('code'), error.get('field'), error.get('severity'))
+            rows.setdefault(key, set()).add(row['id'])
+    summary = [
+        {'code': code, 'field': field, 'severity': severity, 'row_count': len(ids)}
+        for (code, field, severity), ids in rows.items()
+    ]
+    summary.sort(key=lambda s: (-s['row_count'], _sort_key(s['code']), _sort_key(s['field'])))
+    return summary
+
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+def _over_the_wire(value: Any) -> Any:
+    """Encode and decode as JSON, like a request or response body."""
+    if value is None:
+        return None
+    return json.loads(json.dumps(value, default=str))
+
+
+def _jsonb_contains(value: Any, pattern: Any) -> bool:
+    """Postgres jsonb @>: objects match on a subset of keys, arrays on a subset of elements."""
+    if isinstance(pattern, dict):
+        return isinstance(value, dict) and all(
+            k in value and _jsonb_contains(value[k], v) for k, v in pattern.items()
+        )
+    if isinstance(pattern, list):
+        return isinstance(value, list) and all(
+            any(_jsonb_contains(v, p) for v in value) for p in pattern
+        )
+    return value == pattern
+
+
+def _hashable(value: Any) -> Any:
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, sort_keys=True, default=str)
+    return value
+
+
+def _sort_key(value: Any) -> tuple:
+    # Postgres sorts NULLs last in ascending order
+    return (value is None, value if value is not None else 0)
@@ -1,9 +1,12 @@
 import argparse
-import re
 import sys
 from pathlib import Path
 import pandas as pd
 
+# Validation rules are shared with the API (src/validation_rules.py)
+sys.path.insert(0, str(Path(__file__).resolve().parent / "src"))
+from validation_rules import evaluate_rules
+
 # Column name mappings for eFileMagic-style worksheets
 HEADER_MAP = {
     # Recipient name
@@ -91,15 +94,16 @@ HEADER_MAP = {
 
 SUPPORTED_FORM_TYPES = {"1099-NEC", "1099-MISC"}
 
-US_STATES = {
-    "AL","AK","AZ","AR","CA","CO","CT","DC","DE","FL","GA","HI","IA","ID","IL","IN","KS","KY",
-    "LA","MA","MD","ME","MI","MN","MO","MS","MT","NC","ND","NE","NH","NJ","NM","NV","NY","OH",
-    "OK","OR","PA","RI","SC","SD","TN","TX","UT","VA","VT","WA","WI","WV","WY"
+# Worksheet columns under the names the validation rules use
+RULE_COLUMNS = {
+    "recipient_name": "name",
+    "recipient_name2": "name_line_2",
+    "state_code": "state1_code",
+    "state_payer_id": "state1_id",
+    "state_tax_withheld": "state1_withheld",
+    "state_income": "state1_income",
 }
 
-TIN_RE = re.compile(r"^\d{9}$")
-ZIP5_RE = re.compile(r"^\d{5}$|^\d{5}-\d{4}$")
-
 
 def normalize_headers(df):
     mapped = {}
@@ -126,11 +130,6 @@ def clean_text(df, cols):
             df[c] = df[c].astype(str).str.strip().replace({"nan": "", "NaN": "", "None": ""})
 
 
-def add_error(row_errors, msg):
-    if msg not in row_errors:
-        row_errors.append(msg)
-
-
 def extract_filer_info(xlsx):
     filer_info = {"payer_name": "", "payer_tin": "", "filing_year": ""}
     if "Filer Information" not in xlsx.sheet_names:
@@ -148,19 +147,6 @@ def extract_filer_info(xlsx):
     return filer_info
 
 
-def form_specific_rules(row, form_type, errors):
-    f = form_type.upper()
-    if f == "1099-NEC":
-        nec = row.get("nec_box1")
-        if pd.isna(nec) or float(nec or 0) <= 0:
-            add_error(errors, "For 1099-NEC, Box 1 (compensation) must be > 0.")
-    elif f == "1099-MISC":
-        misc_boxes = ["misc_box1", "misc_box2", "misc_box3", "misc_box7"]
-        has_amount = any(pd.notna(row.get(c)) and float(row.get(c) or 0) > 0 for c in misc_boxes)
-        if not has_amount:
-            add_error(errors, "For 1099-MISC, at least one box must be > 0.")
-
-
 def validate_dataframe(df, form_type=None, filer_info=None):
     if filer_info is None:
         filer_info = {}
@@ -183,35 +169,25 @@ def validate_dataframe(df, form_type=None, filer_info=None):
     if "payer_tin" in df.columns:
         df["payer_tin"] = df["payer_tin"].astype(str).str.replace("-", "", regex=False).str.strip()
 
-    errors = []
-    required = ["recipient_name", "tin", "address1", "city", "state", "zip"]
-    for idx, row in df.iterrows():
-        row_errs = []
-        for req in required:
-            val = row.get(req)
-            if req not in df.columns or pd.isna(val) or str(val).strip() == "":
-                add_error(row_errs, f"Missing required field: {req}")
-        tin_val = str(row.get("tin") or "")
-        if not TIN_RE.match(tin_val):
-            add_error(row_errs, "Recipient TIN must be exactly 9 digits.")
-        payer_tin = str(row.get("payer_tin") or "")
-        if payer_tin and not TIN_RE.match(payer_tin):
-            add_error(row_errs, "Payer TIN must be exactly 9 digits.")
-        st = (row.get("state") or "").upper()
-        if st and st not in US_STATES:
-            add_error(row_errs, f"State must be 2-letter US code; got '{st}'.")
-        zp = str(row.get("zip") or "")
-        if zp and not ZIP5_RE.match(zp):
-            add_error(row_errs, "ZIP must be 12345 or 12345-6789.")
-        row_form = (row.get("form_type") or form_type or "").upper()
-        if row_form in SUPPORTED_FORM_TYPES:
-            form_specific_rules(row, row_form, row_errs)
-        if row_errs:
-            errors.append({"__row_index": idx, **row.to_dict(), "error_reason": " | ".join(row_errs)})
+    # Check the rows against the shared rules; errors (not warnings) reject a row
+    frame = df.rename(columns=RULE_COLUMNS)
+    if form_type:
+        frame["form_type"] = frame["form_type"].where(frame["form_type"] != "", form_type)
+    if "fed_withheld" in df.columns:
+        form_types = frame.get("form_type", pd.Series("", index=frame.index)).str.upper()
+        frame["nec_box4"] = df["fed_withheld"].where(form_types == "1099-NEC")
+        frame["misc_box4"] = df["fed_withheld"].where(form_types == "1099-MISC")
+    errors = evaluate_rules(frame, consumer="cli")
+    errors = errors[errors["severity"] == "error"]
+    if errors.empty:
+        return df.copy(), pd.DataFrame()
 
-    err_df = pd.DataFrame(errors)
-    ok_df = df.drop(index=err_df["__row_index"].values) if not err_df.empty else df.copy()
-    return ok_df, err_df
+    reasons = errors.groupby(level=0, sort=False)["message"].agg(lambda m: " | ".join(dict.fromkeys(m)))
+    err_df = df.loc[reasons.index].copy()
+    err_df.insert(0, "__row_index", reasons.index)
+    err_df["error_reason"] = reasons.to_numpy()
+    ok_df = df.drop(index=reasons.index)
+    return ok_df, err_df.reset_index(drop=True)
 
 
 def process_workbook(xlsx_path):